@@ -1,54 +1,349 @@
-import re
+import argparse
+import itertools
+import string
 import sys
-import time
-
-import pandas as pd
-import requests
-from bs4 import BeautifulSoup
+from typing import TYPE_CHECKING
 
 # local library
+import profiling
 import scraping_functions as scrape
+from config import ScrapeConfig, load_config, prepare_file_path
+from schemas import SchemaDriftError
 
-# main file
-# define main function here at some point
+if TYPE_CHECKING:
+    import pandas as pd
+
+# main file; each subcommand mirrors one of the sections of the scraping process:
+#   players       save the letter index pages listing every player and index who played in each season
+#   player-stats  game logs for the players active in the year range
+#   schedule      full season schedules
+#   box-scores    every player line of every game, from one box score page per game
+#   compile       attach player game logs to the games of each season
+#   features      pre-game rolling form of every player and team, updated with the games added since the last run
+#   ratings       Elo style team ratings from the season schedules, updated with the games added since the last run
+#   training-data float32 feature matrix and labels of the compiled seasons, memory-mappable for model training (needs compile and features first), and the sparse games x players lineup matrix
+#   export        write the compiled data as csv or json
+#   teams         dump the team names and abbreviations
+# --shard-index/--shard-count split the letters, players or seasons of a run between machines; every machine given the same options makes the same split
+# saved pages are re-checked with conditional requests (game logs and schedules on every run, letter, career and box score pages with --refresh) and only pages that changed are parsed and written again
+# pandas and the feature / rating / training data modules are imported by the subcommands that use them, and scraping_functions loads its submodules on first use, so each subcommand (and each worker process started for it) only imports what it runs
+
+# number of players handed to the workers at a time by player-stats
+PLAYER_BATCH_SIZE = 50
+
+
+# letters of the range that belong to this shard
+def letters_for_run(arguments) -> list:
+    letters = [
+        chr(i) for i in range(ord(arguments.start_letter), ord(arguments.end_letter) + 1)
+    ]
+    return scrape.shard_items(letters, arguments.shard_index, arguments.shard_count)
+
+
+# seasons (start year convention, end year inclusive) of the range that belong to this shard
+def seasons_for_run(arguments) -> list:
+    seasons = list(range(arguments.start_year, arguments.end_year + 1))
+    return scrape.shard_items(seasons, arguments.shard_index, arguments.shard_count)
+
+
+# schedules for a list of seasons; used as the per-process work function
+def schedule_worker(season_list: list, config: ScrapeConfig = None) -> "pd.DataFrame":
+    import pandas as pd
+
+    season_schedules = [
+        scrape.full_games_schedule(season, season, config=config)
+        for season in season_list
+    ]
+    return pd.concat(season_schedules) if season_schedules else pd.DataFrame()
+
+
+# box scores for a list of seasons; used as the per-process work function
+def box_score_worker(
+    season_list: list, config: ScrapeConfig = None, rebuild: bool = False, refresh: bool = False
+):
+    for season in season_list:
+        scrape.get_box_scores(season, season, config=config, rebuild=rebuild, refresh=refresh)
+
+
+# players: saves the letter index pages and brings the player season index up to date with them
+def run_players(arguments):
+    for letter in letters_for_run(arguments):
+        scrape.find_players(letter, letter, config=arguments.config, refresh=arguments.refresh)
+        scrape.update_player_season_index(letter, letter, config=arguments.config)
+
+
+# player-stats: game logs for every player active in the year range
+def run_player_stats(arguments):
+    # the players are looked up for the full letter range and then sharded by their url, so the split does not depend on how many players each letter has
+    player_stream = scrape.iterate_shard_items(
+        scrape.find_players_by_year(
+            arguments.start_letter,
+            arguments.end_letter,
+            arguments.start_year,
+            arguments.end_year,
+            config=arguments.config,
+        ),
+        arguments.shard_index,
+        arguments.shard_count,
+        key=lambda player: player.get("player_url"),
+    )
+
+    # range (inclusive, exclusive)
+    year_range = range(arguments.start_year, arguments.end_year + 1)
+
+    # players are fetched in batches while the letter pages are still being parsed; the workers return the games and this process appends them to the season files
+    player_list = []
+    for player_batch in itertools.batched(player_stream, PLAYER_BATCH_SIZE):
+        player_list.extend(player_batch)
+        worker_results = scrape.run_in_workers(
+            scrape.get_player_season_stats,
+            list(player_batch),
+            arguments.workers,
+            season_range=year_range,
+            config=arguments.config,
+            save_games=False,
+            refresh=arguments.refresh,
+        )
+        scrape.save_player_season_games(
+            [player_games_df for player_games_dfs in worker_results for player_games_df in player_games_dfs],
+            arguments.config,
+        )
+
+    # labels are assigned once every player of the run is known
+    scrape.player_label(player_list, arguments.config)
+
+
+# schedule: season schedules, one season per work item
+def run_schedule(arguments):
+    scrape.run_in_workers(
+        schedule_worker,
+        seasons_for_run(arguments),
+        arguments.workers,
+        config=arguments.config,
+    )
 
-# if the script is being executed as a "main" program
-if __name__ == "__main__":
 
-    # determine which portion of code to run
-    section_to_run = 2
+# box-scores: box score player lines, one season per work item
+def run_box_scores(arguments):
+    scrape.run_in_workers(
+        box_score_worker,
+        seasons_for_run(arguments),
+        arguments.workers,
+        config=arguments.config,
+        rebuild=arguments.rebuild,
+        refresh=arguments.refresh,
+    )
 
-    match section_to_run:
-        case 1:
-            scrape.find_players("a", "z")
 
-        case 2:
-            # returns large list containing smaller lists of 2 elements
-            player_list = scrape.find_players_by_year("a", "z", 1980, 1981)
+# compile: attaches the player game logs to the games of this shard's seasons, one season per work item and output file
+def run_compile(arguments):
+    scrape.collect_players_in_game(
+        seasons_for_run(arguments),
+        config=arguments.config,
+        workers=arguments.workers,
+        chunk=arguments.compile_chunk,
+        memory_budget_mib=arguments.memory_budget,
+        in_process=bool(arguments.profile),
+    )
 
-            # range (inclusive, exclusive)
-            year_range = range(1980, 1981)
-            scrape.get_player_season_stats(player_list, year_range)
 
-        case 3:
-            season_schedule = scrape.full_games_schedule(1980, 1981)
+# features: player and team form features of this shard's seasons
+def run_features(arguments):
+    import features
 
-        case 4:
-            # range (inclusive, exclusive)
-            set_range = range(1980, 1981)
-            game_data_df = scrape.collect_players_in_game(set_range)
+    features.update_season_form_features(
+        seasons_for_run(arguments), config=arguments.config, rebuild=arguments.rebuild
+    )
+
+
+# ratings: team ratings over the season range (not sharded; games are rated in date order)
+def run_ratings(arguments):
+    import ratings
+
+    rated_games = ratings.update_ratings(
+        list(range(arguments.start_year, arguments.end_year + 1)), config=arguments.config
+    )
+    print(rf"{rated_games} game(s) rated")
+
+
+# training-data: one matrix over every season of the range (not sharded; rows must stay in season order)
+def run_training_data(arguments):
+    import training_data
+
+    season_list = list(range(arguments.start_year, arguments.end_year + 1))
+    # both matrices share one game list, so their rows line up
+    games_df = training_data.compiled_games(season_list, arguments.config)
+    training_data.build_training_matrix(season_list, config=arguments.config, games_df=games_df)
+    training_data.build_lineup_matrix(season_list, config=arguments.config, games_df=games_df)
+
+
+# export: compiled seasons as csv or json
+def run_export(arguments):
+    match arguments.format:
+        case "csv":
+            scrape.pickled_players_in_games_to_csv(
+                seasons_for_run(arguments), config=arguments.config
+            )
+        case "json":
+            scrape.pickled_players_in_games_to_json(
+                seasons_for_run(arguments), config=arguments.config
+            )
+
+
+# teams: team names and abbreviations used by basketball-reference
+def run_teams(arguments):
+    team_name_df = scrape.get_team_abbreviations(arguments.config)
+    team_file = prepare_file_path(
+        arguments.config.compiled_root / rf"team_name_df.{arguments.format}"
+    )
+
+    match arguments.format:
+        case "csv":
+            team_name_df.to_csv(team_file, index=False)
+        case "json":
+            team_name_df.to_json(team_file, orient="records")
+
+
+# subcommand name -> function that runs it
+COMMANDS = {
+    "players": run_players,
+    "player-stats": run_player_stats,
+    "schedule": run_schedule,
+    "box-scores": run_box_scores,
+    "compile": run_compile,
+    "features": run_features,
+    "ratings": run_ratings,
+    "training-data": run_training_data,
+    "export": run_export,
+    "teams": run_teams,
+}
+
+
+# makes sure letter options are a single lowercase letter
+def letter_argument(value: str) -> str:
+    value = value.lower()
+    if len(value) != 1 or value not in string.ascii_lowercase:
+        raise argparse.ArgumentTypeError(f"expected a single letter, got {value!r}")
+    return value
+
+
+# command line options; the shared options are accepted by every subcommand
+def build_argument_parser() -> argparse.ArgumentParser:
+    # options shared by every subcommand
+    common_options = argparse.ArgumentParser(add_help=False)
+    common_options.add_argument(
+        "--start-year", type=int, default=1980, help="first season (start year, 1980 -> 1980-81)"
+    )
+    common_options.add_argument(
+        "--end-year", type=int, default=1980, help="last season, inclusive"
+    )
+    common_options.add_argument("--start-letter", type=letter_argument, default="a")
+    common_options.add_argument("--end-letter", type=letter_argument, default="z")
+    common_options.add_argument(
+        "--workers", type=int, default=1, help="worker processes (player-stats, schedule, box-scores, compile)"
+    )
+    common_options.add_argument(
+        "--config", dest="config_file", help="JSON config file with the data roots (see config.py)"
+    )
+    common_options.add_argument(
+        "--cache-dir", help="root for the raw html pages (overrides the configured raw_cache_root)"
+    )
+    common_options.add_argument(
+        "--intermediate-dir", help="root for the per player / per season csv files"
+    )
+    common_options.add_argument(
+        "--compiled-dir", help="root for the pickled and exported data"
+    )
+    common_options.add_argument(
+        "--format", choices=["csv", "json"], default="csv", help="output format (export, teams)"
+    )
+    common_options.add_argument(
+        "--rebuild",
+        action="store_true",
+        help="compute the saved features again from scratch instead of only the new games (features), or parse every saved box score page again (box-scores)",
+    )
+    common_options.add_argument(
+        "--refresh",
+        action="store_true",
+        help="check saved letter, career and box score pages against the site with conditional requests instead of reusing them as they are, and request game logs that were not found again (players, player-stats, box-scores)",
+    )
+    common_options.add_argument(
+        "--compile-chunk",
+        choices=["season", "month"],
+        default="season",
+        help="compile a season at once, or a month at a time spilled to disk (compile)",
+    )
+    common_options.add_argument(
+        "--memory-budget",
+        type=float,
+        help="memory budget in MiB; planned from the peaks of earlier compiles (or estimates): seasons that would not fit are compiled a month at a time and fewer compile workers run at once, and seasons whose worker still went over its share are compiled again a month at a time (compile)",
+    )
+    common_options.add_argument("--shard-index", type=int, default=0)
+    common_options.add_argument("--shard-count", type=int, default=1)
+    common_options.add_argument(
+        "--profile",
+        choices=["cpu", "memory"],
+        help="run under cProfile (cpu) or tracemalloc (memory); the profilers only see this process, so the command runs without worker processes",
+    )
+    common_options.add_argument(
+        "--profile-dir", default="profiles", help="directory for the profile output files"
+    )
+    common_options.add_argument(
+        "--profile-top",
+        type=int,
+        default=25,
+        help="number of functions / allocation sites listed in the profile summary",
+    )
+
+    parser = argparse.ArgumentParser(
+        description="Scrape NBA data from https://www.basketball-reference.com"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    for command_name in COMMANDS:
+        subparsers.add_parser(command_name, parents=[common_options])
+
+    return parser
+
+
+# if the script is being executed as a "main" program
+if __name__ == "__main__":
+    parser = build_argument_parser()
+    arguments = parser.parse_args()
 
-            # pickle the data for later use
+    if arguments.start_year > arguments.end_year:
+        parser.error("--start-year must not be after --end-year")
+    if arguments.start_letter > arguments.end_letter:
+        parser.error("--start-letter must not be after --end-letter")
+    if not 0 <= arguments.shard_index < arguments.shard_count:
+        parser.error("--shard-index must be between 0 and --shard-count - 1")
+    if arguments.workers < 1:
+        parser.error("--workers must be at least 1")
+    # the profilers only see this process, so the work is done in it
+    if arguments.profile and arguments.workers > 1:
+        print(rf"--profile runs {arguments.command} in this process; --workers {arguments.workers} ignored")
+        arguments.workers = 1
 
-        case 5:
-            scrape.pickled_players_in_games_to_csv()
+    # resolve every data path once; the command line options take priority over the environment and config file
+    arguments.config = load_config(
+        arguments.config_file,
+        raw_cache_root=arguments.cache_dir,
+        intermediate_root=arguments.intermediate_dir,
+        compiled_root=arguments.compiled_dir,
+    )
 
-        case 6:
-            # print(scrape.get_team_abbreviations())
-            with open(
-                rf"C:\Users\Michael\Code\Python\Data_scraping\team_name_df.txt", "w"
-            ) as file:
-                file.write(scrape.get_team_abbreviations().to_string())
+    command_function = COMMANDS[arguments.command]
 
-        case _:
-            print("No section of code could run")
+    try:
+        if arguments.profile:
+            profiling.profile_run(
+                lambda: command_function(arguments),
+                arguments.profile,
+                arguments.profile_dir,
+                arguments.command,
+                arguments.profile_top,
+            )
+        else:
+            command_function(arguments)
+    except SchemaDriftError as error:
+        # a changed page layout needs a code change, not a retry
+        sys.exit(rf"Stopped: {error}")
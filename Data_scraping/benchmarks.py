@@ -0,0 +1,230 @@
+import argparse
+import random
+import subprocess
+import sys
+import time
+import timeit
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+import pandas as pd
+
+# local library
+import scraping_functions as scrape
+from config import load_config
+
+# micro-benchmarks for the field parsers in scraping_functions; every parser is timed per value for the scalar version, the column version and the datetime.strptime approach the parsers replaced (test_parse.py checks that they read the same values)
+# --imports instead times how long the scraper's modules take to import, each in a fresh interpreter, and lists the heavy libraries every import pulled in
+# --browser loads a few basketball-reference pages with a stock firefox profile and with the lean scraping profile (see initialize_selenium_driver) and compares load time, bytes and requests per page; needs firefox and geckodriver
+#
+#   python benchmarks.py [--values 100000] [--repeat 5]
+#   python benchmarks.py --imports [--repeat 5]
+#   python benchmarks.py --browser [--pages /players/a/ ...]
+
+# parser name -> (scalar parser, column parser)
+FIELD_PARSERS = {
+    "playtime": (scrape.playtime_conversion, scrape.playtime_conversion_series),
+    "player_date": (
+        lambda value: scrape.date_change(value, is_player=True),
+        lambda column: scrape.date_change_series(column, is_player=True),
+    ),
+    "schedule_date": (
+        lambda value: scrape.date_change(value, is_player=False),
+        lambda column: scrape.date_change_series(column, is_player=False),
+    ),
+    "age": (scrape.reformat_player_age, scrape.reformat_player_age_series),
+    "margin": (scrape.reformat_win_loss_margin, scrape.reformat_win_loss_margin_series),
+}
+
+# (label, statement) timed by run_import_benchmarks; each starts from a fresh interpreter in this directory
+IMPORT_BENCHMARK_STATEMENTS = [
+    ("scraping_functions", "import scraping_functions"),
+    ("command line", "import Data_scraping"),
+    ("field parsers", "import scraping_functions; scraping_functions.playtime_conversion"),
+    ("compile", "import scraping_functions; scraping_functions.collect_players_in_game"),
+    ("page fetching", "import scraping_functions; scraping_functions.get_player_season_stats"),
+    ("training data", "import training_data"),
+    # what every command paid before the split: all the stages and every library they use
+    (
+        "everything",
+        "import scraping_functions.fetch, scraping_functions.transform, features, ratings, training_data, "
+        "bs4, requests, selenium.webdriver.firefox.options, selenium.webdriver.firefox.service",
+    ),
+]
+
+# libraries reported when an import statement loads them
+HEAVY_LIBRARIES = ["numpy", "pandas", "scipy", "bs4", "requests", "selenium"]
+
+# pages loaded by run_browser_benchmarks (paths on BASELINE_URL): a letter page, a player game log, a season schedule and a box score
+BROWSER_BENCHMARK_PAGES = [
+    "/players/a/",
+    "/players/j/jordami01/gamelog/1996",
+    "/leagues/NBA_1996_games.html",
+    "/boxscores/199511030CHI.html",
+]
+
+# seconds between page loads; basketball-reference allows roughly 20 requests a minute
+BROWSER_BENCHMARK_DELAY = 3.0
+
+# bytes received for the page's html and for everything it pulled in, and the number of requests, from the resource timing entries; responses of other sites that do not send Timing-Allow-Origin count as 0 bytes, so the request count is the better measure of what was blocked
+PAGE_TRANSFER_SCRIPT = """
+const navigation = performance.getEntriesByType("navigation")[0];
+const resources = performance.getEntriesByType("resource");
+return [
+    navigation ? navigation.transferSize : 0,
+    resources.reduce((total, resource) => total + resource.transferSize, 0),
+    resources.length,
+];
+"""
+
+# the strptime based conversions the parsers replaced, for comparison
+STRPTIME_REFERENCES = {
+    "playtime": lambda value: (lambda time_obj: time_obj.minute + time_obj.second / 60.0)(datetime.strptime(value, "%M:%S")),
+    "player_date": lambda value: datetime.strptime(value, "%Y-%m-%d").strftime("%m/%d/%y"),
+    "schedule_date": lambda value: datetime.strptime(value, "%a, %b %d, %Y").strftime("%m/%d/%y"),
+}
+
+
+# builds realistic values of each field for timing: a season's worth of dates and the usual spread of minutes, ages and results
+def make_benchmark_values(parser_name: str, value_count: int, seed: int = 0) -> list:
+    rng = random.Random(seed)
+    season_days = [date(1980, 10, 10) + timedelta(days=day) for day in range(180)]
+
+    match parser_name:
+        case "playtime":
+            return [f"{rng.randint(0, 48)}:{rng.randint(0, 59):02d}" for _ in range(value_count)]
+        case "player_date":
+            return [f"{rng.choice(season_days):%Y-%m-%d}" for _ in range(value_count)]
+        case "schedule_date":
+            return [
+                f"{game_day:%a, %b} {game_day.day}, {game_day.year}"
+                for game_day in (rng.choice(season_days) for _ in range(value_count))
+            ]
+        case "age":
+            return [f"{rng.randint(19, 40)}-{rng.randint(0, 364):03d}" for _ in range(value_count)]
+        case "margin":
+            margins = [rng.choice([-1, 1]) * rng.randint(1, 40) for _ in range(value_count)]
+            return [f"{'W' if margin > 0 else 'L'} ({margin:+d})" for margin in margins]
+
+
+# times each parser on value_count realistic values; prints nanoseconds per value
+def run_field_parser_benchmarks(value_count: int = 100_000, repeat: int = 5):
+    print(f"{'parser':<14}{'scalar':>12}{'column':>12}{'strptime':>12}   (ns per value, best of {repeat})")
+    for parser_name, (scalar_parser, series_parser) in FIELD_PARSERS.items():
+        values = make_benchmark_values(parser_name, value_count)
+        value_column = pd.Series(values, dtype="str")
+
+        timings = [
+            min(timeit.repeat(lambda: [scalar_parser(v) for v in values], number=1, repeat=repeat)),
+            min(timeit.repeat(lambda: series_parser(value_column), number=1, repeat=repeat)),
+        ]
+        if parser_name in STRPTIME_REFERENCES:
+            reference_parser = STRPTIME_REFERENCES[parser_name]
+            timings.append(
+                min(timeit.repeat(lambda: [reference_parser(v) for v in values], number=1, repeat=repeat))
+            )
+
+        timing_columns = "".join(f"{timing / value_count * 1e9:>12.0f}" for timing in timings)
+        print(f"{parser_name:<14}{timing_columns}")
+
+
+# seconds taken by an import statement in a fresh interpreter (interpreter start up not included) and the heavy libraries it loaded
+def time_import_statement(statement: str) -> tuple:
+    timing_script = (
+        "import sys, time\n"
+        "start = time.perf_counter()\n"
+        f"{statement}\n"
+        "print(time.perf_counter() - start)\n"
+        f"print(','.join(name for name in {HEAVY_LIBRARIES!r} if name in sys.modules))\n"
+    )
+    timing_output = subprocess.run(
+        [sys.executable, "-c", timing_script],
+        cwd=Path(__file__).resolve().parent,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.splitlines()
+    return float(timing_output[0]), timing_output[1]
+
+
+# times every import statement; prints milliseconds (best of repeat) and the heavy libraries loaded
+def run_import_benchmarks(repeat: int = 5):
+    print(f"{'import':<22}{'ms':>8}   libraries loaded (best of {repeat})")
+    for label, statement in IMPORT_BENCHMARK_STATEMENTS:
+        import_timings = [time_import_statement(statement) for _ in range(repeat)]
+        best_seconds, loaded_libraries = min(import_timings)
+        print(f"{label:<22}{best_seconds * 1000:>8.0f}   {loaded_libraries or '-'}")
+
+
+# loads every page once with a fresh driver of the given profile; returns one {"seconds", "bytes", "requests"} dictionary per page, where seconds is how long driver.get blocked (what selenium_request waits for before reading the page)
+def measure_page_loads(page_urls: list, lean_profile: bool) -> list:
+    web_driver = scrape.initialize_selenium_driver(load_config(), lean_profile=lean_profile)
+    page_loads = []
+    try:
+        for page_url in page_urls:
+            load_start = time.perf_counter()
+            web_driver.get(page_url)
+            load_seconds = time.perf_counter() - load_start
+
+            document_bytes, resource_bytes, request_count = web_driver.execute_script(PAGE_TRANSFER_SCRIPT)
+            page_loads.append(
+                {
+                    "seconds": load_seconds,
+                    "bytes": document_bytes + resource_bytes,
+                    # the page itself is a request too
+                    "requests": request_count + 1,
+                }
+            )
+            time.sleep(BROWSER_BENCHMARK_DELAY)
+    finally:
+        web_driver.quit()
+
+    return page_loads
+
+
+# loads the pages with the stock and the lean browser profile and prints both side by side, per page and in total
+def run_browser_benchmarks(page_paths: list):
+    page_urls = [rf"{scrape.BASELINE_URL}{page_path}" for page_path in page_paths]
+    profile_loads = {
+        "stock": measure_page_loads(page_urls, lean_profile=False),
+        "lean": measure_page_loads(page_urls, lean_profile=True),
+    }
+
+    print(f"{'page':<40}" + "".join(f"{profile + ' ms':>11}{'KiB':>9}{'requests':>10}" for profile in profile_loads))
+    for page_number, page_path in enumerate([*page_paths, "total"]):
+        page_columns = []
+        for page_loads in profile_loads.values():
+            loads = page_loads if page_path == "total" else [page_loads[page_number]]
+            page_columns.append(
+                f"{sum(load['seconds'] for load in loads) * 1000:>11.0f}"
+                f"{sum(load['bytes'] for load in loads) / 1024:>9.0f}"
+                f"{sum(load['requests'] for load in loads):>10}"
+            )
+        print(f"{page_path:<40}" + "".join(page_columns))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Check and time the table field parsers, or time the module imports or browser page loads."
+    )
+    parser.add_argument("--values", type=int, default=100_000, help="values parsed per timing run")
+    parser.add_argument("--repeat", type=int, default=5, help="timing runs per parser or import (best is reported)")
+    parser.add_argument(
+        "--imports", action="store_true", help="time the module imports instead of the field parsers"
+    )
+    parser.add_argument(
+        "--browser",
+        action="store_true",
+        help="compare page loads of the stock and lean firefox profiles instead of timing the field parsers",
+    )
+    parser.add_argument(
+        "--pages", nargs="+", default=BROWSER_BENCHMARK_PAGES, help="page paths loaded by --browser"
+    )
+    arguments = parser.parse_args()
+
+    if arguments.imports:
+        run_import_benchmarks(arguments.repeat)
+    elif arguments.browser:
+        run_browser_benchmarks(arguments.pages)
+    else:
+        run_field_parser_benchmarks(arguments.values, arguments.repeat)
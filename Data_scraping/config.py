@@ -0,0 +1,159 @@
+import json
+import os
+from dataclasses import dataclass, fields, replace
+from pathlib import Path
+
+# central location for every path the scraping functions read from or write to
+#
+# there are three data roots so that each kind of data can live on the storage that suits it:
+#   raw_cache_root     html pages saved from basketball-reference (large, rarely re-read, fine on slow disks)
+#   intermediate_root  per player / per season csv and json files produced from the raw pages
+#   compiled_root      pickled and exported data built from the intermediate files (hot, suits fast local disks or tmpfs)
+#
+# values are taken, lowest priority first, from: the defaults (everything inside the project folder), a JSON config file, environment variables, then keyword overrides passed to load_config (the command line uses these)
+#
+# config file: DATA_SCRAPING_CONFIG, or data_scraping_config.json next to this file when it exists; keys are the field names below, plus "data_root" to move all three roots at once; relative paths are relative to the config file
+# environment variables: DATA_SCRAPING_ROOT, DATA_SCRAPING_RAW_CACHE, DATA_SCRAPING_INTERMEDIATE, DATA_SCRAPING_COMPILED, GECKODRIVER_PATH
+
+# folder containing this file, the nba_team_names.txt reference data and (by default) all the data folders
+PROJECT_DIRECTORY = Path(__file__).resolve().parent
+
+# config file looked for when DATA_SCRAPING_CONFIG is not set
+DEFAULT_CONFIG_FILE = PROJECT_DIRECTORY / "data_scraping_config.json"
+
+# environment variable -> config field
+ENVIRONMENT_VARIABLES = {
+    "DATA_SCRAPING_RAW_CACHE": "raw_cache_root",
+    "DATA_SCRAPING_INTERMEDIATE": "intermediate_root",
+    "DATA_SCRAPING_COMPILED": "compiled_root",
+    "GECKODRIVER_PATH": "gecko_path",
+}
+
+
+@dataclass(frozen=True)
+class ScrapeConfig:
+    raw_cache_root: Path = PROJECT_DIRECTORY
+    intermediate_root: Path = PROJECT_DIRECTORY
+    compiled_root: Path = PROJECT_DIRECTORY
+    # None lets selenium look for geckodriver on the PATH
+    gecko_path: Path = None
+    team_names_file: Path = PROJECT_DIRECTORY / "nba_team_names.txt"
+
+    # raw html pages
+    @property
+    def letter_pages_directory(self) -> Path:
+        return self.raw_cache_root / "alphabetic_players_grouped"
+
+    @property
+    def player_pages_directory(self) -> Path:
+        return self.raw_cache_root / "player_specific_data"
+
+    @property
+    def schedule_pages_directory(self) -> Path:
+        return self.raw_cache_root / "season_schedule"
+
+    @property
+    def box_score_pages_directory(self) -> Path:
+        return self.raw_cache_root / "box_scores"
+
+    # files the browser is started with (the proxy auto-config host blocklist)
+    @property
+    def browser_directory(self) -> Path:
+        return self.raw_cache_root / "browser"
+
+    # intermediate files
+    @property
+    def player_lists_directory(self) -> Path:
+        return self.intermediate_root / "alphabetic_players_grouped"
+
+    @property
+    def player_labels_directory(self) -> Path:
+        return self.intermediate_root / "unique_player_labels"
+
+    @property
+    def season_games_directory(self) -> Path:
+        return self.intermediate_root / "season_schedule"
+
+    # compiled files
+    @property
+    def pickled_data_directory(self) -> Path:
+        return self.compiled_root / "pickled_data"
+
+    @property
+    def features_directory(self) -> Path:
+        return self.compiled_root / "features"
+
+    @property
+    def training_data_directory(self) -> Path:
+        return self.compiled_root / "training_data"
+
+    @property
+    def ratings_directory(self) -> Path:
+        return self.compiled_root / "ratings"
+
+
+# turns a config value into an absolute path; relative paths are taken relative to base_directory
+def resolve_path(value, base_directory: Path) -> Path:
+    path = Path(os.path.expandvars(str(value))).expanduser()
+    if not path.is_absolute():
+        path = base_directory / path
+    return path.resolve()
+
+
+# settings from a config file, with "data_root" expanded into the three data roots
+def read_config_file(config_file: Path) -> dict:
+    with open(config_file, "r", encoding="utf-8") as file:
+        file_settings = json.load(file)
+
+    valid_keys = {config_field.name for config_field in fields(ScrapeConfig)} | {"data_root"}
+    unknown_keys = set(file_settings) - valid_keys
+    if unknown_keys:
+        raise ValueError(
+            f"Unknown setting(s) {sorted(unknown_keys)} in {config_file}; expected some of {sorted(valid_keys)}"
+        )
+
+    settings = {}
+    if file_settings.get("data_root"):
+        data_root = resolve_path(file_settings["data_root"], config_file.parent)
+        settings = dict.fromkeys(("raw_cache_root", "intermediate_root", "compiled_root"), data_root)
+    for key, value in file_settings.items():
+        if key != "data_root" and value:
+            settings[key] = resolve_path(value, config_file.parent)
+
+    return settings
+
+
+# builds the configuration from the defaults, config file, environment and overrides (None overrides are ignored so command line options can be passed straight through)
+def load_config(config_file: str = None, **overrides) -> ScrapeConfig:
+    settings = {}
+
+    # config file
+    if config_file is None:
+        config_file = os.environ.get("DATA_SCRAPING_CONFIG")
+    if config_file is not None:
+        settings.update(read_config_file(resolve_path(config_file, Path.cwd())))
+    elif DEFAULT_CONFIG_FILE.is_file():
+        settings.update(read_config_file(DEFAULT_CONFIG_FILE))
+
+    # environment variables
+    if os.environ.get("DATA_SCRAPING_ROOT"):
+        data_root = resolve_path(os.environ["DATA_SCRAPING_ROOT"], Path.cwd())
+        settings.update(
+            dict.fromkeys(("raw_cache_root", "intermediate_root", "compiled_root"), data_root)
+        )
+    for variable_name, setting_name in ENVIRONMENT_VARIABLES.items():
+        if os.environ.get(variable_name):
+            settings[setting_name] = resolve_path(os.environ[variable_name], Path.cwd())
+
+    # explicit overrides
+    for setting_name, value in overrides.items():
+        if value is not None:
+            settings[setting_name] = resolve_path(value, Path.cwd())
+
+    return replace(ScrapeConfig(), **settings)
+
+
+# creates the folder a file will be written to and returns the file path
+def prepare_file_path(file_path: Path) -> Path:
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    return file_path
@@ -0,0 +1,241 @@
+import pandas as pd
+
+# local library
+import scraping_functions as scrape
+from config import ScrapeConfig, load_config, prepare_file_path
+
+# pre-game "form" features for the prediction models: the average of each stat over a player's / team's last N games of the season, using only the games played before the one the row belongs to (a row never sees its own game)
+#
+# players come from the consolidated {season}_player_games.csv game logs and teams from the {season}_season_games.csv schedules; the features of each season are saved to {season}_player_form.csv / {season}_team_form.csv under the compiled root, and an update only computes the rows of games that are not in those files yet (plus the last few games before them, which the windows need)
+#
+# windows are computed with running totals per player / team: the sum of the N games before game i is total(i - 1) - total(i - 1 - N), so every window of every entity is a handful of vectorized column operations
+
+# last-N game windows
+FORM_WINDOWS = (5, 10)
+
+# game log stats averaged for players
+PLAYER_FORM_STATS = [
+    "Points",
+    "Game Score",
+    "Minutes Played",
+    "Field Goal Attempts",
+    "Total Rebounds",
+    "Assists",
+    "Turnovers",
+    "Plus/Minus",
+]
+
+# per game team results averaged for teams (Win is 1.0 / 0.0, so its average is the recent win rate)
+TEAM_FORM_STATS = ["Points", "Points_allowed", "Margin", "Win"]
+
+# digits kept in the saved averages; the running totals leave float noise past these
+FORM_DECIMALS = 6
+
+# month a season's games start in; earlier months belong to the year after the season's start year
+SEASON_START_MONTH = 7
+
+
+# "mm/dd/yy" dates of one season's games as datetimes; the year comes from the season (start year convention) instead of the two digit year, which pandas would put in the wrong century for the early seasons
+def season_game_dates(season_year: int, date_column: pd.Series) -> pd.Series:
+    date_parts = date_column.str.split("/", expand=True).astype("int64")
+    return pd.to_datetime(
+        pd.DataFrame(
+            {
+                "year": season_year + (date_parts[0] < SEASON_START_MONTH),
+                "month": date_parts[0],
+                "day": date_parts[1],
+            }
+        )
+    )
+
+
+# one row per player game of the season, in (player, date) order; None when the season has no saved game logs
+def player_form_games(season_year: int, config: ScrapeConfig = None) -> pd.DataFrame:
+    season_games_df = scrape.read_player_season_games(season_year, config)
+    if season_games_df is None or season_games_df.empty:
+        return None
+
+    form_games_df = season_games_df[["Player_id", "Team", "Date", *PLAYER_FORM_STATS]].copy()
+    form_games_df["Game_date"] = season_game_dates(season_year, form_games_df["Date"])
+    return form_games_df.sort_values(["Player_id", "Game_date"], ignore_index=True)
+
+
+# one row per team game of the season (each schedule game gives a home and an away row), in (team, date) order; games without a score (not played yet) are left out; None when there is no saved schedule
+def team_form_games(season_year: int, config: ScrapeConfig = None) -> pd.DataFrame:
+    config = config or load_config()
+    schedule_file = config.season_games_directory / rf"{season_year}_season_games.csv"
+    if not schedule_file.is_file():
+        return None
+
+    schedule_df = pd.read_csv(schedule_file).dropna(subset=["Away_points", "Home_points"])
+    if schedule_df.empty:
+        return None
+
+    team_sides = []
+    for team_column, opponent_column, game_location in (
+        ("Home", "Away", "Home"),
+        ("Away", "Home", "Away"),
+    ):
+        team_sides.append(
+            pd.DataFrame(
+                {
+                    "Team": schedule_df[team_column].str.strip(),
+                    "Opponent": schedule_df[opponent_column].str.strip(),
+                    "Game_location": game_location,
+                    "Date": schedule_df["Date"],
+                    "Points": schedule_df[rf"{team_column}_points"].astype("float64"),
+                    "Points_allowed": schedule_df[rf"{opponent_column}_points"].astype("float64"),
+                }
+            )
+        )
+
+    form_games_df = pd.concat(team_sides, ignore_index=True)
+    form_games_df["Margin"] = form_games_df["Points"] - form_games_df["Points_allowed"]
+    form_games_df["Win"] = (form_games_df["Margin"] > 0).astype("float64")
+    form_games_df["Game_date"] = season_game_dates(season_year, form_games_df["Date"])
+    return form_games_df.sort_values(["Team", "Game_date"], ignore_index=True)
+
+
+# form kind -> (games loader, key column, columns copied from the games, averaged stats)
+FORM_KINDS = {
+    "player": (player_form_games, "Player_id", ["Team"], PLAYER_FORM_STATS),
+    "team": (team_form_games, "Team", ["Opponent", "Game_location"], TEAM_FORM_STATS),
+}
+
+
+# pre-game averages over FORM_WINDOWS for games sorted by (key, date); games_before_offset gives, per key, how many earlier games of the season are not in games_df (incremental updates only pass the last few)
+def rolling_form(
+    games_df: pd.DataFrame,
+    key_column: str,
+    copied_columns: list,
+    stat_columns: list,
+    games_before_offset: pd.Series = None,
+) -> pd.DataFrame:
+    group_keys = games_df[key_column]
+    stat_values = games_df[stat_columns].astype("float64")
+
+    # running totals / counts of the non-missing values, per key, up to and including each game
+    value_totals = stat_values.fillna(0.0).groupby(group_keys).cumsum()
+    value_counts = stat_values.notna().astype("int64").groupby(group_keys).cumsum()
+    total_groups = value_totals.groupby(group_keys)
+    count_groups = value_counts.groupby(group_keys)
+
+    form_df = games_df[[key_column, *copied_columns, "Date"]].copy()
+    games_before = group_keys.groupby(group_keys).cumcount()
+    if games_before_offset is not None:
+        games_before = games_before + group_keys.map(games_before_offset).fillna(0).astype("int64")
+    form_df["Games_before"] = games_before
+
+    for window in FORM_WINDOWS:
+        # totals of the window games before each game: running total at the previous game minus running total window + 1 games back (0 before the first game)
+        window_totals = total_groups.shift(1, fill_value=0.0) - total_groups.shift(window + 1, fill_value=0.0)
+        window_counts = count_groups.shift(1, fill_value=0) - count_groups.shift(window + 1, fill_value=0)
+        window_means = (window_totals / window_counts.where(window_counts > 0)).round(FORM_DECIMALS)
+        form_df[[rf"{stat}_last_{window}" for stat in stat_columns]] = window_means.to_numpy()
+
+    return form_df
+
+
+# location of the saved form features of one season
+def form_features_file(season_year: int, form_kind: str, config: ScrapeConfig):
+    return config.features_directory / rf"{season_year}_{form_kind}_form.csv"
+
+
+# saved form features of one season, or None when they have not been built
+def read_form_features(
+    season_year: int, form_kind: str, config: ScrapeConfig = None
+) -> pd.DataFrame:
+    config = config or load_config()
+    form_file = form_features_file(season_year, form_kind, config)
+    if not form_file.is_file():
+        return None
+    return pd.read_csv(form_file)
+
+
+# brings the saved form features of one season up to date with its games and returns how many rows were computed; only new games (and the last max(FORM_WINDOWS) games of the same player / team before them) go through rolling_form, except for keys whose saved games no longer match (games removed or added before the last saved one), which are computed again from the start of the season
+def update_form_features(
+    season_year: int,
+    form_kind: str,
+    config: ScrapeConfig = None,
+    rebuild: bool = False,
+) -> int:
+    config = config or load_config()
+    games_loader, key_column, copied_columns, stat_columns = FORM_KINDS[form_kind]
+
+    games_df = games_loader(season_year, config)
+    if games_df is None:
+        print(rf"No {form_kind} games saved for {season_year}")
+        return 0
+
+    form_file = form_features_file(season_year, form_kind, config)
+    saved_form_df = None if rebuild else read_form_features(season_year, form_kind, config)
+
+    if saved_form_df is None:
+        form_df = rolling_form(games_df, key_column, copied_columns, stat_columns)
+        form_df.to_csv(prepare_file_path(form_file), index=False)
+        return len(form_df)
+
+    # games that already have saved features
+    is_saved = (
+        games_df[[key_column, "Date"]]
+        .merge(saved_form_df[[key_column, "Date"]], how="left", indicator=True)["_merge"]
+        .eq("both")
+        .to_numpy()
+    )
+    if is_saved.all() and len(saved_form_df) == len(games_df):
+        return 0
+
+    # keys whose new games are not all after their saved ones, or that lost saved games, are computed again in full
+    games_dates = games_df["Game_date"]
+    last_saved_date = games_dates[is_saved].groupby(games_df[key_column][is_saved]).max()
+    first_new_date = games_dates[~is_saved].groupby(games_df[key_column][~is_saved]).min()
+    out_of_order_keys = first_new_date.index[
+        first_new_date <= last_saved_date.reindex(first_new_date.index)
+    ]
+    saved_game_counts = saved_form_df[key_column].value_counts()
+    present_game_counts = games_df[key_column][is_saved].value_counts()
+    missing_game_keys = saved_game_counts.index[
+        saved_game_counts != present_game_counts.reindex(saved_game_counts.index, fill_value=0)
+    ]
+    rebuilt_keys = out_of_order_keys.union(missing_game_keys)
+    is_rebuilt = games_df[key_column].isin(rebuilt_keys).to_numpy()
+    is_saved = is_saved & ~is_rebuilt
+
+    # saved games that fall inside a window of a new game of the same key
+    saved_from_end = (
+        games_df[key_column][is_saved].groupby(games_df[key_column][is_saved]).cumcount(ascending=False)
+    )
+    is_window_history = pd.Series(False, index=games_df.index)
+    is_window_history[saved_from_end.index] = (saved_from_end < max(FORM_WINDOWS)).to_numpy()
+    is_window_history &= games_df[key_column].isin(games_df[key_column][~is_saved])
+
+    update_games_df = games_df[is_window_history.to_numpy() | ~is_saved]
+    history_counts = update_games_df[key_column][is_window_history].value_counts()
+    saved_counts = games_df[key_column][is_saved].value_counts()
+    games_before_offset = saved_counts.sub(history_counts, fill_value=0)
+
+    update_form_df = rolling_form(
+        update_games_df, key_column, copied_columns, stat_columns, games_before_offset
+    )
+    new_form_df = update_form_df[~is_saved[update_games_df.index]]
+
+    form_df = pd.concat(
+        [saved_form_df[~saved_form_df[key_column].isin(rebuilt_keys)], new_form_df],
+        ignore_index=True,
+    )
+    # same (key, date) order as a full build
+    form_df["Game_date"] = season_game_dates(season_year, form_df["Date"])
+    form_df = form_df.sort_values([key_column, "Game_date"]).drop(columns="Game_date")
+    form_df.to_csv(prepare_file_path(form_file), index=False)
+    return len(new_form_df)
+
+
+# updates the player and team form features of every season in the list
+def update_season_form_features(
+    season_list: list, config: ScrapeConfig = None, rebuild: bool = False
+):
+    config = config or load_config()
+    for season_year in season_list:
+        for form_kind in FORM_KINDS:
+            computed_rows = update_form_features(season_year, form_kind, config, rebuild)
+            print(rf"{form_kind} form features for {season_year}: {computed_rows} game(s) computed")
@@ -0,0 +1,217 @@
+import cProfile
+import linecache
+import os
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from pathlib import Path
+
+# resident memory is read through getrusage, which only exists on unix
+try:
+    import resource
+except ImportError:
+    resource = None
+
+# profiling helpers for running a section of Data_scraping.py under cProfile or tracemalloc; output is written in a flamegraph-compatible "folded stacks" format (one "frame;frame;frame count" line per stack) that flamegraph.pl, speedscope and inferno all read
+
+
+# turns a pstats function key (file, line, name) into a single flamegraph frame label
+def frame_label(function_key: tuple) -> str:
+    file_name, line_number, function_name = function_key
+    # builtins are recorded with "~" as the file name
+    if file_name == "~":
+        return function_name.replace(";", ",")
+    return rf"{os.path.basename(file_name)}:{line_number}:{function_name}".replace(";", ",")
+
+
+# converts cProfile statistics into folded stacks; cProfile only records caller/callee pairs, so the time of each call edge is split between stacks in proportion to how often each caller made the call
+# a stack is only followed while its share of the time is at least min_time (seconds, one microsecond by default, the unit of the output); the time passed down to the callees never exceeds the caller's, so the walk stays proportional to the profiled time instead of listing every path of a large call graph
+def pstats_to_folded_stacks(
+    profile_stats: pstats.Stats, max_depth: int = 64, min_time: float = 1e-6
+) -> dict:
+    # pstats.Stats.stats maps function -> (primitive calls, total calls, own time, cumulative time, callers)
+    all_stats = profile_stats.stats
+    frame_labels = {function_key: frame_label(function_key) for function_key in all_stats}
+
+    # invert the caller information into callee lists
+    callees = {}
+    for function_key, (_, _, _, _, callers) in all_stats.items():
+        for caller_key, caller_values in callers.items():
+            # caller values are (primitive calls, total calls, own time, cumulative time) for this edge
+            callees.setdefault(caller_key, []).append((function_key, caller_values[3]))
+
+    folded_stacks = {}
+    # labels of the current stack, and its functions as a set for the recursion check
+    stack = []
+    functions_on_stack = set()
+
+    def walk(function_key: tuple, edge_time: float):
+        if edge_time < min_time:
+            return
+
+        _, _, own_time, cumulative_time, _ = all_stats[function_key]
+        # share of this function's time that belongs to the current stack
+        share = edge_time / cumulative_time if cumulative_time else 0.0
+        stack.append(frame_labels[function_key])
+        functions_on_stack.add(function_key)
+
+        # record own time in microseconds, which is what the folded format counts
+        own_microseconds = int(own_time * share * 1_000_000)
+        if own_microseconds > 0:
+            stack_key = ";".join(stack)
+            folded_stacks[stack_key] = folded_stacks.get(stack_key, 0) + own_microseconds
+
+        if len(stack) < max_depth:
+            for callee_key, callee_time in callees.get(function_key, []):
+                # skip recursion back into a function already on the stack
+                if callee_key not in functions_on_stack:
+                    walk(callee_key, callee_time * share)
+
+        stack.pop()
+        functions_on_stack.remove(function_key)
+
+    # start from functions nobody called (the profiled entry points)
+    for function_key, (_, _, _, cumulative_time, callers) in all_stats.items():
+        if not callers:
+            walk(function_key, cumulative_time)
+
+    return folded_stacks
+
+
+# converts a tracemalloc snapshot into folded stacks weighted by bytes still allocated
+def snapshot_to_folded_stacks(snapshot: tracemalloc.Snapshot) -> dict:
+    folded_stacks = {}
+    for statistic in snapshot.statistics("traceback"):
+        # tracemalloc tracebacks are ordered from the oldest frame to the most recent, which is the root-first order flamegraphs expect
+        frames = [
+            rf"{os.path.basename(frame.filename)}:{frame.lineno}".replace(";", ",")
+            for frame in statistic.traceback
+        ]
+        stack_key = ";".join(frames)
+        folded_stacks[stack_key] = folded_stacks.get(stack_key, 0) + statistic.size
+
+    return folded_stacks
+
+
+# writes folded stacks sorted by weight so the file diffs well between runs
+def write_folded_stacks(folded_stacks: dict, file_path: Path):
+    with open(file_path, "w", encoding="utf-8") as file:
+        for stack_key, weight in sorted(folded_stacks.items(), key=lambda item: -item[1]):
+            file.write(f"{stack_key} {weight}\n")
+
+
+# runs a function under cProfile; saves the raw .prof file (for snakeviz/pstats), folded stacks and a text summary of the top functions
+def run_with_cpu_profile(function, output_prefix: Path, top_count: int = 25):
+    profiler = cProfile.Profile()
+    start_time = time.perf_counter()
+    try:
+        result = profiler.runcall(function)
+    finally:
+        elapsed_time = time.perf_counter() - start_time
+
+        profiler.dump_stats(rf"{output_prefix}.prof")
+        profile_stats = pstats.Stats(profiler)
+        write_folded_stacks(pstats_to_folded_stacks(profile_stats), Path(rf"{output_prefix}.cpu.folded"))
+
+        with open(rf"{output_prefix}.cpu.txt", "w", encoding="utf-8") as file:
+            file.write(f"elapsed: {elapsed_time:.3f} s\n\n")
+            summary_stats = pstats.Stats(profiler, stream=file)
+            summary_stats.sort_stats("cumulative").print_stats(top_count)
+            summary_stats.sort_stats("tottime").print_stats(top_count)
+
+        print(rf"CPU profile written to {output_prefix}.prof, {output_prefix}.cpu.folded and {output_prefix}.cpu.txt ({elapsed_time:.2f} s)")
+
+    return result
+
+
+# filters out the allocations made by tracemalloc and the import machinery
+def filter_snapshot(snapshot: tracemalloc.Snapshot) -> tracemalloc.Snapshot:
+    return snapshot.filter_traces(
+        [
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+        ]
+    )
+
+
+# runs a function under tracemalloc; a background thread keeps the snapshot taken closest to the peak so the top allocation sites reflect the high-water mark rather than what is left at the end
+def run_with_memory_profile(
+    function,
+    output_prefix: Path,
+    top_count: int = 25,
+    frame_count: int = 25,
+    sample_interval: float = 1.0,
+):
+    tracemalloc.start(frame_count)
+    # [traced memory when taken, snapshot]
+    peak_snapshot = [0, None]
+    run_finished = threading.Event()
+
+    def sample_memory():
+        while not run_finished.wait(sample_interval):
+            current_memory, _ = tracemalloc.get_traced_memory()
+            if current_memory > peak_snapshot[0]:
+                peak_snapshot[0] = current_memory
+                peak_snapshot[1] = tracemalloc.take_snapshot()
+
+    sampler = threading.Thread(target=sample_memory, daemon=True)
+    sampler.start()
+    start_time = time.perf_counter()
+    try:
+        result = function()
+    finally:
+        elapsed_time = time.perf_counter() - start_time
+        run_finished.set()
+        sampler.join()
+        current_memory, peak_memory = tracemalloc.get_traced_memory()
+        if current_memory >= peak_snapshot[0] or peak_snapshot[1] is None:
+            peak_snapshot = [current_memory, tracemalloc.take_snapshot()]
+        tracemalloc.stop()
+
+        snapshot = filter_snapshot(peak_snapshot[1])
+        write_folded_stacks(snapshot_to_folded_stacks(snapshot), Path(rf"{output_prefix}.memory.folded"))
+
+        with open(rf"{output_prefix}.memory.txt", "w", encoding="utf-8") as file:
+            file.write(f"elapsed: {elapsed_time:.3f} s\n")
+            file.write(f"peak traced memory: {peak_memory / 2**20:.1f} MiB\n")
+            file.write(f"traced memory when sampled: {peak_snapshot[0] / 2**20:.1f} MiB\n\n")
+            file.write(f"top {top_count} allocation sites:\n")
+            for rank, statistic in enumerate(snapshot.statistics("lineno")[:top_count], start=1):
+                frame = statistic.traceback[0]
+                file.write(
+                    f"#{rank}: {frame.filename}:{frame.lineno}: {statistic.size / 1024:.1f} KiB in {statistic.count} blocks\n"
+                )
+                source_line = linecache.getline(frame.filename, frame.lineno).strip()
+                if source_line:
+                    file.write(f"    {source_line}\n")
+
+        print(rf"Memory profile written to {output_prefix}.memory.folded and {output_prefix}.memory.txt (peak {peak_memory / 2**20:.1f} MiB)")
+
+    return result
+
+
+# peak resident memory (MiB) of this process, or with children=True of the largest finished child process (worker processes); None where getrusage is not available
+def peak_rss_mib(children: bool = False) -> float:
+    if resource is None:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_CHILDREN if children else resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on linux, bytes on macOS
+    return max_rss / 2**20 if sys.platform == "darwin" else max_rss / 2**10
+
+
+# runs a function with the chosen profiler ("cpu" or "memory"); output file names start with run_label inside output_directory
+def profile_run(function, profile_mode: str, output_directory: str, run_label: str, top_count: int = 25):
+    output_path = Path(output_directory)
+    output_path.mkdir(parents=True, exist_ok=True)
+    output_prefix = output_path / rf"{run_label}_{time.strftime('%Y%m%d_%H%M%S')}"
+
+    match profile_mode:
+        case "cpu":
+            return run_with_cpu_profile(function, output_prefix, top_count)
+        case "memory":
+            return run_with_memory_profile(function, output_prefix, top_count)
+        case _:
+            raise ValueError(f"Unknown profile mode {profile_mode!r}; expected 'cpu' or 'memory'")
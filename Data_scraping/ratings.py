@@ -0,0 +1,326 @@
+import json
+
+import numpy as np
+import pandas as pd
+
+# local library
+import features
+from config import ScrapeConfig, load_config, prepare_file_path
+
+# Elo style team ratings computed from the {season}_season_games.csv schedules
+#
+# games are processed one day at a time: a team plays at most once per day, so every game of a day is rated at once with numpy arrays (expected results, margin multipliers and rating changes for the whole day) from the ratings the teams had before that day
+#
+# every rated game adds two rows (one per team, with the rating before and after the game) to rating_history.csv, and the ratings after the last processed day are kept in ratings_checkpoint.json; an update only rates the games that are not in the history yet, starting from the checkpoint. Games that turn up for a day that was already processed (late results, corrected scores) rewind the history to the day before them, rebuild the ratings from the history rows up to that day, and rate everything from there
+#
+# the history also answers point-in-time questions: the rating a team had going into any date is looked up with a binary search (see ratings_before)
+#
+# teams are identified by their abbreviation, so a franchise that changed abbreviation starts again from INITIAL_RATING
+
+# rating of a team's first game
+INITIAL_RATING = 1500.0
+# rating points a game can move (before the margin multiplier)
+K_FACTOR = 20.0
+# rating points added to the home team when computing the expected result
+HOME_ADVANTAGE = 100.0
+# share of each rating's distance from INITIAL_RATING removed at the start of a new season
+SEASON_REVERSION = 0.25
+
+# file names inside config.ratings_directory
+RATING_HISTORY_FILE = "rating_history.csv"
+CHECKPOINT_FILE = "ratings_checkpoint.json"
+
+RATING_HISTORY_COLUMNS = [
+    "Season",
+    "Date",
+    "Team",
+    "Opponent",
+    "Game_location",
+    "Rating_before",
+    "Rating_after",
+]
+
+
+# ratings moved SEASON_REVERSION of the way back to INITIAL_RATING
+def revert_to_mean(ratings):
+    return ratings + SEASON_REVERSION * (INITIAL_RATING - ratings)
+
+
+# season (start year convention) of game dates; months before features.SEASON_START_MONTH belong to the season that started the year before
+def season_of_dates(game_dates: pd.Series) -> pd.Series:
+    return game_dates.dt.year - (game_dates.dt.month < features.SEASON_START_MONTH)
+
+
+# played games of the seasons in the list, one row per game in (date, schedule) order
+def played_schedule_games(season_list: list, config: ScrapeConfig) -> pd.DataFrame:
+    season_parts = []
+    for season_year in season_list:
+        schedule_file = config.season_games_directory / rf"{season_year}_season_games.csv"
+        if not schedule_file.is_file():
+            continue
+
+        schedule_df = pd.read_csv(schedule_file).dropna(subset=["Away_points", "Home_points"])
+        season_parts.append(
+            pd.DataFrame(
+                {
+                    "Season": season_year,
+                    "Game_date": features.season_game_dates(season_year, schedule_df["Date"]),
+                    "Home": schedule_df["Home"].str.strip(),
+                    "Away": schedule_df["Away"].str.strip(),
+                    "Home_points": schedule_df["Home_points"].astype("float64"),
+                    "Away_points": schedule_df["Away_points"].astype("float64"),
+                }
+            )
+        )
+
+    if not season_parts:
+        return pd.DataFrame(
+            columns=["Season", "Game_date", "Home", "Away", "Home_points", "Away_points"]
+        )
+    return pd.concat(season_parts, ignore_index=True).sort_values(
+        "Game_date", kind="stable", ignore_index=True
+    )
+
+
+# the saved rating history with its dates as datetimes, or an empty one
+def load_rating_history(config: ScrapeConfig = None) -> pd.DataFrame:
+    config = config or load_config()
+    history_file = config.ratings_directory / RATING_HISTORY_FILE
+    if not history_file.is_file():
+        return pd.DataFrame(columns=RATING_HISTORY_COLUMNS)
+
+    # round_trip so ratings carried over from the history are exactly the ones that were saved
+    history_df = pd.read_csv(history_file, float_precision="round_trip")
+    history_df["Date"] = pd.to_datetime(history_df["Date"], format="%Y-%m-%d")
+    return history_df
+
+
+# ratings state to continue from: {"last_date": "YYYY-MM-DD" or None, "last_season": int or None, "ratings": {team: rating}}
+def load_ratings_checkpoint(config: ScrapeConfig = None) -> dict:
+    config = config or load_config()
+    checkpoint_file = config.ratings_directory / CHECKPOINT_FILE
+    if not checkpoint_file.is_file():
+        return {"last_date": None, "last_season": None, "ratings": {}}
+
+    with open(checkpoint_file, "r") as file:
+        return json.load(file)
+
+
+# ratings state at the end of the history (used after a rewind): each team's rating after its last game, and the last processed day / season
+# rate_games moves every rating back toward the mean when a new season starts, so a team whose last game is in an earlier season than the last processed one gets the reversion of every season started since then, as a full replay would have given it
+def checkpoint_from_history(history_df: pd.DataFrame) -> dict:
+    if history_df.empty:
+        return {"last_date": None, "last_season": None, "ratings": {}}
+
+    last_games_df = history_df.groupby("Team").tail(1)
+    ratings = last_games_df["Rating_after"].to_numpy(dtype="float64")
+    history_seasons = np.unique(history_df["Season"].to_numpy())
+    season_starts_missed = len(history_seasons) - np.searchsorted(
+        history_seasons, last_games_df["Season"].to_numpy(), side="right"
+    )
+    for reversion_number in range(season_starts_missed.max()):
+        ratings = np.where(
+            season_starts_missed > reversion_number, revert_to_mean(ratings), ratings
+        )
+
+    return {
+        "last_date": f"{history_df['Date'].max():%Y-%m-%d}",
+        "last_season": int(history_seasons[-1]),
+        "ratings": dict(zip(last_games_df["Team"], ratings.tolist())),
+    }
+
+
+# rates the games in date order, one day per batch, starting from the checkpoint; returns the history rows of the games and the checkpoint after the last day
+def rate_games(games_df: pd.DataFrame, checkpoint: dict) -> tuple:
+    # team -> position in the ratings array; teams seen for the first time start at INITIAL_RATING
+    team_positions = {team: position for position, team in enumerate(checkpoint["ratings"])}
+    for team in pd.unique(games_df[["Home", "Away"]].to_numpy().ravel()):
+        team_positions.setdefault(team, len(team_positions))
+    ratings = np.full(len(team_positions), INITIAL_RATING)
+    ratings[: len(checkpoint["ratings"])] = list(checkpoint["ratings"].values())
+
+    home_positions = games_df["Home"].map(team_positions).to_numpy()
+    away_positions = games_df["Away"].map(team_positions).to_numpy()
+    margins = (games_df["Home_points"] - games_df["Away_points"]).to_numpy()
+    game_seasons = games_df["Season"].to_numpy()
+    home_before = np.empty(len(games_df))
+    away_before = np.empty(len(games_df))
+    home_after = np.empty(len(games_df))
+    away_after = np.empty(len(games_df))
+
+    current_season = checkpoint["last_season"]
+    # [first, last) rows of every day
+    day_starts = np.flatnonzero(
+        np.r_[True, games_df["Game_date"].to_numpy()[1:] != games_df["Game_date"].to_numpy()[:-1]]
+    )
+    for day_start, day_end in zip(day_starts, np.r_[day_starts[1:], len(games_df)]):
+        if current_season is not None and game_seasons[day_start] > current_season:
+            ratings = revert_to_mean(ratings)
+        current_season = game_seasons[day_start]
+
+        day_home = home_positions[day_start:day_end]
+        day_away = away_positions[day_start:day_end]
+        day_margins = margins[day_start:day_end]
+
+        rating_difference = ratings[day_home] + HOME_ADVANTAGE - ratings[day_away]
+        expected_home_result = 1.0 / (1.0 + 10.0 ** (-rating_difference / 400.0))
+        home_result = (day_margins > 0).astype("float64")
+        # bigger wins move the ratings more, damped when the favourite wins so strong teams do not run away
+        winner_rating_difference = np.where(day_margins > 0, rating_difference, -rating_difference)
+        margin_multiplier = (np.abs(day_margins) + 3.0) ** 0.8 / (
+            7.5 + 0.006 * winner_rating_difference
+        )
+        rating_change = K_FACTOR * margin_multiplier * (home_result - expected_home_result)
+
+        home_before[day_start:day_end] = ratings[day_home]
+        away_before[day_start:day_end] = ratings[day_away]
+        # add.at so a team listed twice on one day (bad data) still gets both changes
+        np.add.at(ratings, day_home, rating_change)
+        np.add.at(ratings, day_away, -rating_change)
+        home_after[day_start:day_end] = ratings[day_home]
+        away_after[day_start:day_end] = ratings[day_away]
+
+    game_dates = games_df["Game_date"].dt.strftime("%Y-%m-%d")
+    history_rows_df = pd.concat(
+        [
+            pd.DataFrame(
+                {
+                    "Season": games_df["Season"],
+                    "Date": game_dates,
+                    "Team": games_df[team_column],
+                    "Opponent": games_df[opponent_column],
+                    "Game_location": game_location,
+                    "Rating_before": rating_before,
+                    "Rating_after": rating_after,
+                }
+            )
+            for team_column, opponent_column, game_location, rating_before, rating_after in (
+                ("Home", "Away", "Home", home_before, home_after),
+                ("Away", "Home", "Away", away_before, away_after),
+            )
+        ]
+    ).sort_index(kind="stable")
+
+    new_checkpoint = {
+        "last_date": game_dates.iloc[-1] if len(games_df) else checkpoint["last_date"],
+        "last_season": None if current_season is None else int(current_season),
+        "ratings": {team: float(ratings[position]) for team, position in team_positions.items()},
+    }
+    return history_rows_df, new_checkpoint
+
+
+# brings the ratings up to date with the schedules of the seasons in the list, and of every season from the first of them to the last one already rated; returns the number of games rated
+def update_ratings(season_list: list, config: ScrapeConfig = None) -> int:
+    config = config or load_config()
+    history_file = config.ratings_directory / RATING_HISTORY_FILE
+    checkpoint_file = config.ratings_directory / CHECKPOINT_FILE
+    checkpoint = load_ratings_checkpoint(config)
+
+    # the season of the checkpoint may have new games, and new games in an earlier season rewind through every season after it
+    loaded_seasons = set(season_list)
+    if checkpoint["last_season"] is not None:
+        loaded_seasons.add(checkpoint["last_season"])
+    games_df = played_schedule_games(
+        list(range(min(loaded_seasons), max(loaded_seasons) + 1)), config
+    )
+
+    # games already in the history (looked up through the home team's rows)
+    history_df = load_rating_history(config)
+    home_history_df = history_df.loc[
+        history_df["Game_location"] == "Home", ["Date", "Team", "Opponent"]
+    ].rename(columns={"Date": "Game_date", "Team": "Home", "Opponent": "Away"})
+    is_rated = (
+        games_df[["Game_date", "Home", "Away"]]
+        .merge(home_history_df, how="left", indicator=True)["_merge"]
+        .eq("both")
+        .to_numpy()
+    )
+    if is_rated.all():
+        return 0
+
+    first_new_date = games_df["Game_date"][~is_rated].min()
+    if checkpoint["last_date"] is not None and first_new_date <= pd.Timestamp(checkpoint["last_date"]):
+        # games for days already processed: rewind to the day before them and rate everything from there
+        print(rf"Ratings rewound to before {first_new_date:%Y-%m-%d}")
+        history_df = history_df[history_df["Date"] < first_new_date]
+        checkpoint = checkpoint_from_history(history_df)
+        history_df.assign(Date=history_df["Date"].dt.strftime("%Y-%m-%d")).to_csv(
+            prepare_file_path(history_file), index=False
+        )
+        games_df = games_df[games_df["Game_date"] >= first_new_date]
+    else:
+        games_df = games_df[~is_rated]
+
+    history_rows_df, checkpoint = rate_games(games_df.reset_index(drop=True), checkpoint)
+
+    # only the new rows are written; the history so far stays as it is on disk
+    history_rows_df.to_csv(
+        prepare_file_path(history_file),
+        mode="a",
+        header=not history_file.is_file() or history_file.stat().st_size == 0,
+        index=False,
+    )
+    with open(checkpoint_file, "w") as file:
+        json.dump(checkpoint, file, indent=1)
+
+    return len(games_df)
+
+
+# point-in-time team ratings read from a rating history (see load_rating_history)
+class RatingLookup:
+    def __init__(self, history_df: pd.DataFrame):
+        history_df = history_df.sort_values(["Team", "Date"], kind="stable", ignore_index=True)
+        self.team_codes = {team: code for code, team in enumerate(pd.unique(history_df["Team"]))}
+        # one sortable integer per (team, day)
+        self.history_keys = self.lookup_keys(history_df["Team"], history_df["Date"])
+        self.history_teams = history_df["Team"].map(self.team_codes).to_numpy()
+        self.history_seasons = history_df["Season"].to_numpy()
+        self.rating_before = history_df["Rating_before"].to_numpy(dtype="float64")
+        self.rating_after = history_df["Rating_after"].to_numpy(dtype="float64")
+
+    def lookup_keys(self, teams: pd.Series, dates: pd.Series) -> np.ndarray:
+        # unknown teams get code -1, which sorts before every known team and never matches
+        team_codes = teams.map(self.team_codes).fillna(-1).to_numpy(dtype="int64")
+        day_numbers = pd.to_datetime(dates).to_numpy().astype("datetime64[D]").astype("int64")
+        return team_codes * 1_000_000 + day_numbers
+
+    # rating each team had going into each date: the rating before its game that day, otherwise the rating after its previous game (moved back toward the mean when that game was in an earlier season), otherwise INITIAL_RATING
+    def ratings_before(self, teams, dates) -> np.ndarray:
+        teams = pd.Series(teams).reset_index(drop=True)
+        dates = pd.Series(pd.to_datetime(dates)).reset_index(drop=True)
+        query_keys = self.lookup_keys(teams, dates)
+        team_codes = teams.map(self.team_codes).fillna(-1).to_numpy(dtype="int64")
+
+        ratings = np.full(len(query_keys), INITIAL_RATING)
+        if not len(self.history_keys):
+            return ratings
+
+        positions = np.searchsorted(self.history_keys, query_keys, side="left")
+
+        # a game on the date itself
+        same_day_positions = np.minimum(positions, len(self.history_keys) - 1)
+        is_game_day = self.history_keys[same_day_positions] == query_keys
+        ratings[is_game_day] = self.rating_before[same_day_positions[is_game_day]]
+
+        # otherwise the team's previous game
+        previous_positions = positions - 1
+        has_previous_game = (
+            ~is_game_day
+            & (previous_positions >= 0)
+            & (self.history_teams[np.maximum(previous_positions, 0)] == team_codes)
+        )
+        previous_rows = previous_positions[has_previous_game]
+        previous_ratings = self.rating_after[previous_rows]
+        is_new_season = (
+            self.history_seasons[previous_rows]
+            < season_of_dates(dates[has_previous_game]).to_numpy()
+        )
+        ratings[has_previous_game] = np.where(
+            is_new_season, revert_to_mean(previous_ratings), previous_ratings
+        )
+        return ratings
+
+
+# ratings of the teams going into the dates, straight from the saved history; build a RatingLookup once when asking many times
+def ratings_before(teams, dates, config: ScrapeConfig = None) -> np.ndarray:
+    return RatingLookup(load_rating_history(config)).ratings_before(teams, dates)
@@ -0,0 +1,203 @@
+import hashlib
+from dataclasses import dataclass, field
+
+# registry of the basketball-reference tables the scraper reads; each table type records its columns (keyed by the data-stat attribute every cell carries), their dtypes and the names they are saved under
+#
+# the header of each page is checked against the schema through a fingerprint of its data-stat layout: a layout that was already checked is accepted with a single set lookup, a new one is compared column by column once and then remembered, and a layout that does not fit the schema raises SchemaDriftError instead of silently producing shifted or missing columns
+
+
+# data-stat of each counting stat column in basketball-reference tables -> column name used in the saved data (the same names the game log headers resolve to)
+STAT_COLUMN_NAMES = {
+    "mp": "Minutes Played",
+    "fg": "Field Goals",
+    "fga": "Field Goal Attempts",
+    "fg_pct": "Field Goal Percentage",
+    "fg3": "3-Point Field Goals",
+    "fg3a": "3-Point Field Goal Attempts",
+    "fg3_pct": "3-Point Field Goal Percentage",
+    "ft": "Free Throws",
+    "fta": "Free Throw Attempts",
+    "ft_pct": "Free Throw Percentage",
+    "orb": "Offensive Rebounds",
+    "drb": "Defensive Rebounds",
+    "trb": "Total Rebounds",
+    "ast": "Assists",
+    "stl": "Steals",
+    "blk": "Blocks",
+    "tov": "Turnovers",
+    "pf": "Personal Fouls",
+    "pts": "Points",
+    "game_score": "Game Score",
+    "plus_minus": "Plus/Minus",
+}
+
+# data-stat -> (column name, dtype) of the game log columns kept by parse_player_game_log, in the order they are saved
+PLAYER_GAME_LOG_COLUMNS = {
+    "date_game": ("Date", "str"),
+    "age": ("Player_age", "float64"),
+    "team_id": ("Team", "str"),
+    "game_location": ("Game_location", "str"),
+    "opp_id": ("Opponent", "str"),
+    "game_result": ("Win_loss_margin", "float64"),
+    "gs": ("Games Started", "bool"),
+    "mp": ("Minutes Played", "float64"),
+    **{
+        data_stat: (column_name, "float64")
+        for data_stat, column_name in STAT_COLUMN_NAMES.items()
+        if data_stat != "mp"
+    },
+}
+
+
+# raised when a page's table header no longer matches the registered schema (basketball-reference renamed, added or removed a column)
+class SchemaDriftError(Exception):
+    def __init__(
+        self,
+        table_type: str,
+        missing_columns: list,
+        unexpected_columns: list,
+        page_label: str = None,
+    ):
+        self.table_type = table_type
+        self.missing_columns = missing_columns
+        self.unexpected_columns = unexpected_columns
+        self.page_label = page_label
+
+        location = rf" on {page_label}" if page_label else ""
+        super().__init__(
+            f"Schema drift in the {table_type!r} table{location}: "
+            f"missing columns {missing_columns}, unexpected columns {unexpected_columns}; "
+            f"update TABLE_SCHEMAS in schemas.py if the change is intended"
+        )
+
+    # keeps the details when the error is sent back from a worker process
+    def __reduce__(self):
+        return (
+            SchemaDriftError,
+            (self.table_type, self.missing_columns, self.unexpected_columns, self.page_label),
+        )
+
+
+@dataclass(frozen=True)
+class TableSchema:
+    table_type: str
+    # data-stat -> (column name, dtype), in the order the columns are saved
+    columns: dict
+    # data-stats only some seasons have (plus/minus, start times); left empty when a page does not have them
+    optional_columns: frozenset = frozenset()
+    # data-stats that are on the page but not kept
+    ignored_columns: frozenset = frozenset()
+    # fingerprints of the header layouts already checked against this schema
+    known_fingerprints: set = field(default_factory=set, compare=False, repr=False)
+
+    @property
+    def column_names(self) -> list:
+        return [column_name for column_name, _ in self.columns.values()]
+
+    @property
+    def dtypes(self) -> dict:
+        return {column_name: column_dtype for column_name, column_dtype in self.columns.values()}
+
+    @property
+    def renames(self) -> dict:
+        return {data_stat: column_name for data_stat, (column_name, _) in self.columns.items()}
+
+    # accepts a header layout (the data-stats of the header row, in order) or raises SchemaDriftError
+    def validate_header(self, header_stats: tuple, page_label: str = None):
+        fingerprint = header_fingerprint(header_stats)
+        if fingerprint in self.known_fingerprints:
+            return
+
+        header_stat_set = set(header_stats)
+        required_columns = set(self.columns) - self.optional_columns
+        missing_columns = sorted(required_columns - header_stat_set)
+        unexpected_columns = sorted(
+            header_stat_set - set(self.columns) - self.ignored_columns
+        )
+        if missing_columns or unexpected_columns:
+            raise SchemaDriftError(
+                self.table_type, missing_columns, unexpected_columns, page_label
+            )
+
+        self.known_fingerprints.add(fingerprint)
+
+
+# short stable id of a header layout
+def header_fingerprint(header_stats: tuple) -> str:
+    return hashlib.sha1("|".join(header_stats).encode("utf-8")).hexdigest()
+
+
+# data-stats of a table's column header row; tables with grouped columns have an extra "over_header" row above it, so the last header row is used
+def header_data_stats(table) -> tuple:
+    table_head = table.find("thead")
+    if table_head is None:
+        return ()
+    header_rows = table_head.find_all("tr")
+    if not header_rows:
+        return ()
+
+    return tuple(
+        header_cell.get("data-stat", "")
+        for header_cell in header_rows[-1].find_all(["th", "td"])
+    )
+
+
+# table type -> schema
+TABLE_SCHEMAS = {
+    "players": TableSchema(
+        "players",
+        {
+            "player": ("Player", "str"),
+            "year_min": ("Year_min", "int64"),
+            "year_max": ("Year_max", "int64"),
+            "pos": ("Position", "str"),
+            "height": ("Height", "str"),
+            "weight": ("Weight", "str"),
+            "birth_date": ("Birth_date", "str"),
+            "colleges": ("Colleges", "str"),
+        },
+    ),
+    "pgl_basic": TableSchema(
+        "pgl_basic",
+        PLAYER_GAME_LOG_COLUMNS,
+        optional_columns=frozenset({"plus_minus"}),
+        ignored_columns=frozenset({"ranker", "game_season"}),
+    ),
+    "schedule": TableSchema(
+        "schedule",
+        {
+            "date_game": ("Date", "str"),
+            "visitor_team_name": ("Away", "str"),
+            "visitor_pts": ("Away_points", "Int64"),
+            "home_team_name": ("Home", "str"),
+            "home_pts": ("Home_points", "Int64"),
+            "attendance": ("Attendance", "str"),
+            "arena_name": ("Arena", "str"),
+        },
+        optional_columns=frozenset({"attendance", "arena_name"}),
+        ignored_columns=frozenset(
+            {"game_start_time", "box_score_text", "overtimes", "game_duration", "game_remarks"}
+        ),
+    ),
+    "box_score": TableSchema(
+        "box_score",
+        {
+            "player": ("Player", "str"),
+            **{
+                data_stat: (column_name, "float64")
+                for data_stat, column_name in STAT_COLUMN_NAMES.items()
+            },
+        },
+        optional_columns=frozenset({"plus_minus", "game_score"}),
+    ),
+}
+
+# the playoff game log has the same layout as the regular season one
+TABLE_SCHEMAS["pgl_basic_playoffs"] = TABLE_SCHEMAS["pgl_basic"]
+
+
+# checks a parsed table's header against the schema registered for its type; returns the schema
+def validate_table(table, table_type: str, page_label: str = None) -> TableSchema:
+    schema = TABLE_SCHEMAS[table_type]
+    schema.validate_header(header_data_stats(table), page_label)
+    return schema
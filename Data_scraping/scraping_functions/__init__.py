@@ -0,0 +1,156 @@
+import importlib
+
+# local library
+from schemas import SchemaDriftError
+
+# contains all the functions necessary for Data_scraping on https://www.basketball-reference.com, split by stage:
+#   fetch      requesting pages and the scraping steps built on them (letter pages, game logs, schedules, box scores)
+#   parse      html and table text to python / pandas values
+#   transform  compiled game data, team totals, player labels, and splitting work between shards and processes
+#   store      the files kept between runs (player season index, consolidated game logs, compiled seasons, exports)
+# every name is still used as scraping_functions.<name>; a submodule is only imported the first time one of its names is used, so "import scraping_functions" costs nothing and a job only loads the stages (and libraries) it needs
+
+# submodule -> names it provides
+SUBMODULE_NAMES = {
+    "fetch": [
+        "BASELINE_URL",
+        "REQUEST_HEADERS",
+        "LEAN_BROWSER_PREFERENCES",
+        "BLOCKED_BROWSER_HOSTS",
+        "BLOCKED_HOST_PROXY",
+        "blocked_hosts_pac",
+        "selenium_request",
+        "retry_after_seconds",
+        "static_response",
+        "static_request",
+        "fetch_page",
+        "page_validators_file",
+        "load_page_validators",
+        "refresh_cached_page",
+        "initialize_selenium_driver",
+        "find_players",
+        "refresh_index_letter",
+        "update_player_season_index",
+        "find_players_by_year",
+        "player_gamelog_url",
+        "player_gamelog_urls",
+        "player_gamelog_file",
+        "get_player_season_stats",
+        "full_games_schedule",
+        "get_box_scores",
+    ],
+    "parse": [
+        "PLAYER_METRIC_COLUMNS",
+        "PLAYER_GAME_FLOAT_COLUMNS",
+        "BOX_SCORE_TABLE_ID",
+        "MONTH_NUMBERS",
+        "WEEKDAY_NAMES",
+        "PLAYER_DATE_PATTERN",
+        "SCHEDULE_DATE_PATTERN",
+        "PLAYER_AGE_PATTERN",
+        "WIN_LOSS_MARGIN_PATTERN",
+        "GAME_SCORE_PATTERN",
+        "CM_PER_FOOT",
+        "CM_PER_INCH",
+        "KG_PER_POUND",
+        "table_to_dictionary",
+        "iterate_table_rows",
+        "find_commented_table",
+        "find_table",
+        "player_id_from_url",
+        "game_id_from_url",
+        "playtime_conversion",
+        "playtime_conversion_series",
+        "date_change",
+        "date_change_series",
+        "reformat_player_age",
+        "reformat_player_age_series",
+        "reformat_win_loss_margin",
+        "reformat_win_loss_margin_series",
+        "parse_unique_values",
+        "normalize_player_bios",
+        "letter_page_players",
+        "career_gamelog_urls",
+        "player_metrics",
+        "parse_player_game_log",
+        "parse_box_score",
+    ],
+    "transform": [
+        "TEAM_GAME_TOTAL_COLUMNS",
+        "TEAM_GAME_PERCENTAGE_COLUMNS",
+        "COMPILE_WORKER_MEMORY_ESTIMATES",
+        "shard_items",
+        "iterate_shard_items",
+        "run_in_workers",
+        "player_label",
+        "load_season_player_games",
+        "build_team_game_totals",
+        "iterate_season_game_chunks",
+        "compile_season_games",
+        "compile_seasons",
+        "compile_worker_estimate",
+        "season_chunks_within_budget",
+        "workers_within_budget",
+        "compile_seasons_over_budget",
+        "collect_players_in_game",
+    ],
+    "store": [
+        "PLAYER_SEASON_INDEX_VERSION",
+        "PlayerSeasonIndex",
+        "CompiledSeason",
+        "basic_error_handling",
+        "pickle_data",
+        "variable_to_string_literal",
+        "get_team_abbreviations",
+        "full_to_abbreviation",
+        "player_season_index_file",
+        "load_player_season_index",
+        "save_player_season_index",
+        "player_season_games_files",
+        "load_player_games_index",
+        "rebuild_player_games_index",
+        "season_games_index",
+        "remove_player_blocks",
+        "append_player_season_games",
+        "save_player_season_games",
+        "read_player_season_games",
+        "compiled_season_file",
+        "compiled_seasons_manifest_file",
+        "load_compiled_seasons_manifest",
+        "iterate_compiled_season_chunks",
+        "read_compiled_season",
+        "iterate_compiled_seasons",
+        "read_compiled_seasons",
+        "pickled_players_in_games_to_csv",
+        "team_stats_to_dictionary",
+        "pickled_players_in_games_to_json",
+    ],
+}
+
+# name -> submodule providing it
+NAME_SUBMODULES = {
+    name: submodule_name
+    for submodule_name, names in SUBMODULE_NAMES.items()
+    for name in names
+}
+
+__all__ = ["SchemaDriftError", *NAME_SUBMODULES]
+
+
+# called for names the package does not have yet (PEP 562): imports the submodule that provides the name and keeps the name on the package, so later lookups are plain attribute reads; also what lets player season indexes pickled as scraping_functions.PlayerSeasonIndex load
+def __getattr__(name: str):
+    if name in SUBMODULE_NAMES:
+        return importlib.import_module(rf"{__name__}.{name}")
+
+    submodule_name = NAME_SUBMODULES.get(name)
+    if submodule_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(rf"{__name__}.{submodule_name}"), name)
+    globals()[name] = value
+    return value
+
+
+# lists the lazily imported names too
+def __dir__() -> list:
+    return sorted({*globals(), *NAME_SUBMODULES})
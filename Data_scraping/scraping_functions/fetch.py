@@ -0,0 +1,1003 @@
+import hashlib
+import json
+import os
+import random
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pandas as pd
+from pandas import DataFrame
+
+# local library
+from config import ScrapeConfig, load_config, prepare_file_path
+from schemas import validate_table
+from scraping_functions.parse import (
+    PLAYER_GAME_FLOAT_COLUMNS,
+    career_gamelog_urls,
+    date_change_series,
+    game_id_from_url,
+    parse_box_score,
+    parse_player_game_log,
+    player_id_from_url,
+    player_metrics,
+    playtime_conversion_series,
+)
+from scraping_functions.store import (
+    PlayerSeasonIndex,
+    basic_error_handling,
+    full_to_abbreviation,
+    load_player_season_index,
+    player_season_games_files,
+    save_player_season_index,
+    save_player_season_games,
+    season_games_index,
+)
+
+if TYPE_CHECKING:
+    from selenium import webdriver
+
+# fetch: requesting pages from basketball-reference (firefox through selenium, or static requests) and the scraping steps built on them; letter pages, player game logs, season schedules and box scores
+# selenium, requests and BeautifulSoup are imported inside the functions that use them, so only a job that actually loads pages pays for them
+
+# site every page is requested from; page links on the site are relative to it
+BASELINE_URL = "https://www.basketball-reference.com"
+
+
+# use selenium to load page for given url for dynamic html scraping; if saving the html data from a page it does not return a string
+def selenium_request(
+    firefox_driver: "webdriver.Firefox",
+    request_url: str,
+    save_html: bool = False,
+    file_path: str = None,
+) -> str:
+    from selenium.common.exceptions import TimeoutException, WebDriverException
+
+    # max retries
+    retry = 10
+
+    for attempt in range(retry):
+        try:
+
+            # open URL
+            firefox_driver.get(request_url)
+
+            # allow time for JavaScript to load
+            time.sleep(10)
+
+            # page source
+            html_source = firefox_driver.page_source
+
+            # if saving html data
+            if save_html and file_path:
+                with open(file_path, "w", encoding="utf-8") as file:
+                    file.write(html_source)
+                print(f"HTML saved to {file_path}")
+
+            # quit driver and return HTML if not saving
+            if not save_html:
+                return html_source
+
+            # break the loop if successful
+            break
+        # exponential backoff
+        except (WebDriverException, TimeoutException) as e:
+            # handle Selenium-specific exceptions
+            wait = 2**attempt + random.uniform(0, 1)
+            print(f"Attempt {attempt + 1} failed: {e}. Retrying in {wait:.2f} seconds.")
+            time.sleep(wait)
+
+
+# headers sent with static requests; basketball-reference refuses requests without a browser-like user agent
+REQUEST_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (X11; Linux x86_64; rv:128.0) Gecko/20100101 Firefox/128.0",
+    "Accept": "text/html,application/xhtml+xml",
+}
+
+
+# seconds a 429 / 503 response asks to wait before the next request (Retry-After is either a number of seconds or an http date), or None when it does not say
+def retry_after_seconds(response) -> float:
+    retry_after = response.headers.get("Retry-After")
+    if retry_after is None:
+        return None
+    if retry_after.strip().isdigit():
+        return float(retry_after)
+
+    try:
+        retry_time = parsedate_to_datetime(retry_after)
+    except (TypeError, ValueError):
+        return None
+    if retry_time.tzinfo is None:
+        retry_time = retry_time.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_time - datetime.now(timezone.utc)).total_seconds())
+
+
+# GET request with retries; extra_headers are sent on top of REQUEST_HEADERS (conditional requests add their validators there)
+# only what can succeed on a later attempt is retried: connection errors, timeouts, 429 (too many requests) and server errors, waiting as long as Retry-After asks when the site sends it; any other answer is returned at once, so callers get the page, a 304 when a conditional request found the page unchanged, or a client error (404 for a page that does not exist) to check with response.ok; None when every attempt failed
+def static_response(request_url: str, extra_headers: dict = None, request_delay: float = 3.0):
+    import requests
+
+    # max retries
+    retry = 10
+
+    for attempt in range(retry):
+        # exponential backoff
+        wait = 2**attempt + random.uniform(0, 1)
+        try:
+            response = requests.get(
+                request_url, headers={**REQUEST_HEADERS, **(extra_headers or {})}, timeout=30
+            )
+        except (requests.ConnectionError, requests.Timeout) as e:
+            print(f"Attempt {attempt + 1} failed: {e}. Retrying in {wait:.2f} seconds.")
+            time.sleep(wait)
+            continue
+
+        if response.status_code == 429 or response.status_code >= 500:
+            wait = retry_after_seconds(response) or wait
+            print(
+                f"Attempt {attempt + 1} failed: {response.status_code} for {request_url}. Retrying in {wait:.2f} seconds."
+            )
+            time.sleep(wait)
+            continue
+
+        if not response.ok:
+            print(f"{response.status_code} for {request_url}; not retrying")
+
+        # basketball-reference allows roughly 20 requests a minute
+        time.sleep(request_delay)
+        return response
+
+    return None
+
+
+# use requests to load the static html for a given url; no browser or JavaScript wait is needed for tables that are in the page source, including the ones hidden inside html comments (see find_table); if saving the html data from a page it does not return a string
+def static_request(
+    request_url: str,
+    save_html: bool = False,
+    file_path: str = None,
+    request_delay: float = 3.0,
+) -> str:
+    response = static_response(request_url, request_delay=request_delay)
+    if response is None or not response.ok:
+        return None
+
+    # page source
+    html_source = response.text
+
+    # if saving html data
+    if save_html and file_path:
+        with open(file_path, "w", encoding="utf-8") as file:
+            file.write(html_source)
+        print(f"HTML saved to {file_path}")
+
+    # return HTML if not saving
+    if not save_html:
+        return html_source
+
+
+# loads a page with the browser when a driver is given, otherwise with a static request
+def fetch_page(
+    request_url: str,
+    firefox_driver: "webdriver.Firefox" = None,
+    save_html: bool = False,
+    file_path: str = None,
+) -> str:
+    if firefox_driver is not None:
+        return selenium_request(firefox_driver, request_url, save_html, file_path)
+    return static_request(request_url, save_html, file_path)
+
+
+# validators of a saved page ({"url", "etag", "last_modified", "sha1"}, or {"url", "status": 404} for a page the site does not have), kept in a file next to the page
+def page_validators_file(file_path: Path) -> Path:
+    return file_path.with_name(rf"{file_path.name}.validators.json")
+
+
+# validators saved for a page; pages saved before validators were kept only get the hash of their contents
+def load_page_validators(file_path: Path) -> dict:
+    validators_file = page_validators_file(file_path)
+    if validators_file.is_file():
+        with open(validators_file, "r", encoding="utf-8") as file:
+            return json.load(file)
+
+    if file_path.is_file():
+        with open(file_path, "rb") as file:
+            return {"sha1": hashlib.sha1(file.read()).hexdigest()}
+
+    return {}
+
+
+# brings a saved page up to date with the site and returns True when the saved copy is new or changed, False when it is unchanged (or could not be loaded), so callers only parse and write what changed
+# static requests are conditional: the ETag / Last-Modified the site sent with the saved copy go back as If-None-Match / If-Modified-Since and a 304 answer costs no download; pages loaded with the browser, or sent without validators, are compared by the sha1 of their contents instead, and an identical page is not written again
+# a 404 is recorded in the validators file and the page is not requested again (e.g. the game log of a season inside a player's career span that they missed) unless recheck_missing is set
+def refresh_cached_page(
+    request_url: str,
+    file_path: Path,
+    firefox_driver: "webdriver.Firefox" = None,
+    recheck_missing: bool = False,
+) -> bool:
+    file_path = Path(file_path)
+    validators = load_page_validators(file_path)
+    if validators.get("status") == 404 and not file_path.is_file() and not recheck_missing:
+        return False
+
+    response_headers = {}
+    if firefox_driver is not None:
+        page_contents = selenium_request(firefox_driver, request_url)
+    else:
+        conditional_headers = {}
+        # validators only mean something while the page they describe is on disk
+        if file_path.is_file():
+            if validators.get("etag"):
+                conditional_headers["If-None-Match"] = validators["etag"]
+            if validators.get("last_modified"):
+                conditional_headers["If-Modified-Since"] = validators["last_modified"]
+
+        response = static_response(request_url, conditional_headers)
+        if response is not None and response.status_code == 304:
+            return False
+        if response is not None and response.status_code == 404:
+            with open(prepare_file_path(page_validators_file(file_path)), "w", encoding="utf-8") as file:
+                json.dump({"url": request_url, "status": 404}, file)
+            print(rf"{request_url} does not exist; it is not requested again")
+            return False
+        # a client error is not a page
+        if response is not None and not response.ok:
+            response = None
+        page_contents = response.text if response is not None else None
+        response_headers = response.headers if response is not None else {}
+
+    if page_contents is None:
+        print(rf"Could not load {request_url}; keeping the saved copy")
+        return False
+
+    page_bytes = page_contents.encode("utf-8")
+    page_hash = hashlib.sha1(page_bytes).hexdigest()
+    page_changed = page_hash != validators.get("sha1") or not file_path.is_file()
+    if page_changed:
+        with open(prepare_file_path(file_path), "wb") as file:
+            file.write(page_bytes)
+        print(f"HTML saved to {file_path}")
+
+    page_validators = {
+        "url": request_url,
+        "etag": response_headers.get("ETag"),
+        "last_modified": response_headers.get("Last-Modified"),
+        "sha1": page_hash,
+    }
+    # an unchanged page with the same validators leaves the validators file as it is
+    if page_validators != validators:
+        with open(page_validators_file(file_path), "w", encoding="utf-8") as file:
+            json.dump(page_validators, file)
+
+    return page_changed
+
+
+# firefox preferences of the lean scraping profile; the scraper only reads page_source, so what is only drawn (images, audio / video, web fonts) is never downloaded, and the background traffic of a fresh profile (prefetching, safe browsing lists, telemetry) is turned off
+LEAN_BROWSER_PREFERENCES = {
+    # 2 = block images from every site
+    "permissions.default.image": 2,
+    # 5 = block all autoplay; no media is preloaded either
+    "media.autoplay.default": 5,
+    "media.autoplay.blocking_policy": 2,
+    "media.preload.default": 0,
+    # system fonts only
+    "gfx.downloadable_fonts.enabled": False,
+    "browser.display.use_document_fonts": 0,
+    "network.prefetch-next": False,
+    "network.dns.disablePrefetch": True,
+    "network.http.speculative-parallel-limit": 0,
+    "privacy.trackingprotection.enabled": True,
+    "browser.safebrowsing.malware.enabled": False,
+    "browser.safebrowsing.phishing.enabled": False,
+    "datareporting.healthreport.uploadEnabled": False,
+    "toolkit.telemetry.enabled": False,
+}
+
+# ad, analytics and web font hosts the pages pull in; requests to them and their subdomains are refused by the proxy auto-config script of the lean profile (see blocked_hosts_pac)
+BLOCKED_BROWSER_HOSTS = [
+    "doubleclick.net",
+    "googlesyndication.com",
+    "googletagmanager.com",
+    "googletagservices.com",
+    "google-analytics.com",
+    "adservice.google.com",
+    "amazon-adsystem.com",
+    "adnxs.com",
+    "rubiconproject.com",
+    "pubmatic.com",
+    "openx.net",
+    "casalemedia.com",
+    "criteo.com",
+    "criteo.net",
+    "moatads.com",
+    "quantserve.com",
+    "scorecardresearch.com",
+    "taboola.com",
+    "outbrain.com",
+    "facebook.net",
+    "hotjar.com",
+    "chartbeat.com",
+    "fonts.googleapis.com",
+    "fonts.gstatic.com",
+    "use.typekit.net",
+]
+
+# proxy given to blocked hosts; nothing listens on the discard port, so the connection is refused at once
+BLOCKED_HOST_PROXY = "PROXY 127.0.0.1:9"
+
+
+# proxy auto-config script that sends the blocked hosts (and their subdomains) to BLOCKED_HOST_PROXY and every other host direct
+def blocked_hosts_pac(blocked_hosts: list) -> str:
+    return (
+        "function FindProxyForURL(url, host) {\n"
+        f"  var blockedHosts = {json.dumps(blocked_hosts)};\n"
+        "  for (var i = 0; i < blockedHosts.length; i++) {\n"
+        "    if (host == blockedHosts[i] || dnsDomainIs(host, '.' + blockedHosts[i])) {\n"
+        f"      return '{BLOCKED_HOST_PROXY}';\n"
+        "    }\n"
+        "  }\n"
+        "  return 'DIRECT';\n"
+        "}\n"
+    )
+
+
+# only want to initialize the driver a single time within a function before iterating over a list of urls * make sure to quit the driver after use
+# lean_profile (the default) starts firefox with LEAN_BROWSER_PREFERENCES, the BLOCKED_BROWSER_HOSTS blocklist and the "eager" page load strategy, so driver.get returns once the html is parsed instead of after every image, script and frame has loaded; lean_profile=False gives a stock profile (see benchmarks.py --browser)
+def initialize_selenium_driver(
+    config: ScrapeConfig = None, lean_profile: bool = True
+) -> "webdriver.Firefox":
+    from selenium import webdriver
+    from selenium.webdriver.firefox.options import Options
+    from selenium.webdriver.firefox.service import Service
+
+    config = config or load_config()
+
+    options = Options()
+    # run without GUI, extensions, and gpu to reduce resource usage
+    options.add_argument("--headless")
+    options.add_argument("--disable-extensions")
+    options.add_argument("--disable-gpu")
+
+    if lean_profile:
+        options.page_load_strategy = "eager"
+        for preference_name, preference_value in LEAN_BROWSER_PREFERENCES.items():
+            options.set_preference(preference_name, preference_value)
+
+        pac_file = prepare_file_path(config.browser_directory / "blocked_hosts.pac")
+        with open(pac_file, "w", encoding="utf-8") as file:
+            file.write(blocked_hosts_pac(BLOCKED_BROWSER_HOSTS))
+        # 2 = proxy auto-config; without failover_direct a refused proxy is not retried direct
+        options.set_preference("network.proxy.type", 2)
+        options.set_preference("network.proxy.autoconfig_url", pac_file.as_uri())
+        options.set_preference("network.proxy.failover_direct", False)
+
+    # use a specific version of GeckoDriver when one is configured (manually installed), otherwise let selenium find it
+    if config.gecko_path is None:
+        service = Service()
+    else:
+        if not os.path.exists(config.gecko_path):
+            raise FileNotFoundError(
+                f"GeckoDriver not found at {config.gecko_path}. Please download it manually."
+            )
+        service = Service(str(config.gecko_path))
+
+    driver = webdriver.Firefox(service=service, options=options)
+
+    return driver
+
+
+# saves the html page listing every player whose last name starts with each letter in the range; refresh checks the pages already on disk against the site too (see refresh_cached_page), and the player season index only parses the ones that changed
+def find_players(
+    start_letter: str,
+    end_letter: str,
+    config: ScrapeConfig = None,
+    refresh: bool = False,
+    use_browser: bool = False,
+):
+    config = config or load_config()
+
+    # create array of letters
+    alphabet_range = [chr(i) for i in range(ord(start_letter), ord(end_letter) + 1)]
+
+    web_driver = None
+    for letter in alphabet_range:
+        player_last_name_letter_file = (
+            config.letter_pages_directory / rf"letter_{letter}_players.html"
+        )
+        # pages already on disk do not need to be requested again
+        if os.path.isfile(player_last_name_letter_file) and not refresh:
+            continue
+
+        # the players table is in the static html; only start the browser when asked for, and once there is something to fetch
+        if use_browser and web_driver is None:
+            web_driver = initialize_selenium_driver(config)
+
+        refresh_cached_page(
+            rf"{BASELINE_URL}/players/{letter}/",
+            player_last_name_letter_file,
+            web_driver,
+        )
+
+    # quit webdriver
+    if web_driver is not None:
+        web_driver.quit()
+
+
+# brings one letter of the index up to date with its letter page (fetched first if missing); also saves the letter's players as JSON when the letter is rebuilt
+def refresh_index_letter(
+    player_index: PlayerSeasonIndex, letter: str, config: ScrapeConfig
+) -> bool:
+    player_last_name_letter_file = (
+        config.letter_pages_directory / rf"letter_{letter}_players.html"
+    )
+
+    # check if the html file exists
+    if not os.path.isfile(player_last_name_letter_file):
+        find_players(letter, letter, config=config)
+
+    try:
+        with open(player_last_name_letter_file, "rb") as file:
+            page_contents = file.read()
+    except Exception as e:
+        basic_error_handling(e)
+        return False
+
+    if not player_index.refresh_letter(letter, page_contents):
+        return False
+
+    letter_players = player_index.letter_players[letter]
+    if not letter_players:
+        print(rf"Error with Json_data writing for letter {letter}")
+        return True
+
+    # save all players of a given letter into a JSON file
+    with open(
+        prepare_file_path(config.player_lists_directory / rf"letter_{letter}_players.json"),
+        "w",
+    ) as file:
+        json.dump(letter_players, file)
+
+    # heights / weights left unconverted are reported next to the letter's players rather than stopping the build
+    bio_errors = player_index.letter_bio_errors.get(letter, [])
+    bio_errors_file = config.player_lists_directory / rf"letter_{letter}_bio_errors.json"
+    if bio_errors:
+        with open(bio_errors_file, "w") as file:
+            json.dump(bio_errors, file, indent=1)
+        print(
+            rf"{len(bio_errors)} height / weight value(s) of letter {letter} not converted to metric; see {bio_errors_file}"
+        )
+    elif os.path.isfile(bio_errors_file):
+        os.remove(bio_errors_file)
+
+    return True
+
+
+# builds or updates the persisted player season index for a range of letters; only letters whose page changed since the last build are parsed again
+def update_player_season_index(
+    start_letter: str = "a", end_letter: str = "z", config: ScrapeConfig = None
+) -> PlayerSeasonIndex:
+    config = config or load_config()
+    player_index = load_player_season_index(config)
+
+    for letter in [chr(i) for i in range(ord(start_letter), ord(end_letter) + 1)]:
+        if refresh_index_letter(player_index, letter, config):
+            print(rf"Player season index rebuilt for letter {letter}")
+
+    save_player_season_index(player_index, config)
+    return player_index
+
+
+# find players based on the seasons that they have played, answered from the persisted player season index; letter pages that are missing or changed since the index was built are (re)parsed first
+# generator: players are yielded one letter at a time, so on a first build player pages can be fetched before every letter is parsed; pass the result to player_label to assign the integer labels
+def find_players_by_year(
+    start_letter: str,
+    end_letter: str,
+    start_year: int,
+    end_year: int,
+    config: ScrapeConfig = None,
+):
+    config = config or load_config()
+    player_index = load_player_season_index(config)
+
+    # create array of letters
+    alphabet_range = [chr(i) for i in range(ord(start_letter), ord(end_letter) + 1)]
+
+    try:
+        for letter in alphabet_range:
+            refresh_index_letter(player_index, letter, config)
+            yield from player_index.active_players(start_year, end_year, [letter])
+    finally:
+        # keep whatever was rebuilt, even if the caller stops early
+        save_player_season_index(player_index, config)
+
+
+# page url of a player's game log for one season (start year convention); basketball-reference names game log pages after the year the season ended ("/players/a/adamsal01.html", 1975 -> "/players/a/adamsal01/gamelog/1976")
+def player_gamelog_url(player_url: str, season_year: int) -> str:
+    return rf"{player_url.removesuffix('.html')}/gamelog/{season_year + 1}"
+
+
+# season -> game log url for the requested seasons a player took part in; when the career span is known (players from the player season index) the urls are built directly, otherwise they are read from the player's career page
+def player_gamelog_urls(
+    player_info: dict,
+    season_list: list,
+    config: ScrapeConfig,
+    web_driver: "webdriver.Firefox" = None,
+    refresh: bool = False,
+) -> dict:
+    # known career span; no need for the career page
+    if player_info.get("year_min") is not None and player_info.get("year_max") is not None:
+        return {
+            season_year: player_gamelog_url(player_info["player_url"], season_year)
+            for season_year in season_list
+            if player_info["year_min"] <= season_year <= player_info["year_max"]
+        }
+
+    # player html save file location
+    player_html_file = (
+        config.player_pages_directory / rf"{player_info["player"]}_data.html"
+    )
+
+    # a saved career page is only checked against the site again when refreshing; a retired player's page answers 304
+    if not os.path.isfile(player_html_file) or refresh:
+        # pass the full url after appending to the end of the baseline url from list, along with file save location
+        refresh_cached_page(
+            rf"{BASELINE_URL}{player_info["player_url"]}", player_html_file, web_driver
+        )
+    # a career page that could not be loaded (404, retries used up) skips the player
+    if not os.path.isfile(player_html_file):
+        print(rf"No career page saved for {player_info["player"]}; skipping")
+        return {}
+
+    # open player html page
+    with open(
+        player_html_file,
+        "r",
+        encoding="utf-8",
+    ) as file:
+        contents = file.read()
+
+    from bs4 import BeautifulSoup
+
+    # make the soup
+    soup_1 = BeautifulSoup(contents, "html.parser")
+    # find the table of all season stats
+    table_1 = soup_1.find("table", id="per_game_stats")
+    if table_1 is None:
+        print(rf"No season table found for {player_info["player"]}")
+        return {}
+
+    # the whole career table is read once, then the requested seasons are looked up in it
+    career_urls = career_gamelog_urls(table_1)
+
+    gamelog_urls = {}
+    for season_year in season_list:
+        if season_year in career_urls:
+            gamelog_urls[season_year] = career_urls[season_year]
+        else:
+            print(
+                rf"No player season data found for {player_info["player"]} in {season_year}"
+            )
+
+    return gamelog_urls
+
+
+# saved game log page of a player's season
+def player_gamelog_file(player_id: str, season_year: int, config: ScrapeConfig) -> Path:
+    return config.player_pages_directory / "gamelogs" / rf"{player_id}_{season_year}.html"
+
+
+# retrieve the player season statistics for all games in a given range of seasons using a list containing dictionaries of player info (as yielded by find_players_by_year); returns one DataFrame of games per player and, when save_games is set, also appends them to the consolidated season files (see append_player_season_games)
+# pass save_games=False when several processes scrape at once and let the parent process save the returned games, so only one process writes each season file
+# game log pages are saved and re-checked with conditional requests (see refresh_cached_page); a season whose page has not changed and whose games are already in the season file is not parsed or returned again, so the season file keeps the player's games as they are; refresh also re-checks saved career pages and requests the game logs the site answered 404 for again
+def get_player_season_stats(
+    player_name_with_url_list: list,
+    season_range: range,
+    config: ScrapeConfig = None,
+    use_browser: bool = False,
+    save_games: bool = True,
+    refresh: bool = False,
+) -> list:
+    config = config or load_config()
+
+    # make list from year range
+    season_list = list(season_range)
+
+    # every table used here is in the static html (the playoff table inside an html comment), so the browser is only started when asked for
+    web_driver = initialize_selenium_driver(config) if use_browser else None
+
+    # season -> players whose games are in the consolidated season file
+    saved_season_players = {
+        season_year: season_games_index(*player_season_games_files(season_year, config))["players"]
+        for season_year in season_list
+    }
+
+    player_games_dfs = []
+    # iterate over list of player info
+    for player_info in player_name_with_url_list:
+        player_id = player_info.get("player_id") or player_id_from_url(player_info.get("player_url"))
+
+        # every requested season of the player is gathered into one frame
+        player_season_dfs = []
+        unchanged_seasons = 0
+        for season_year, year_url in player_gamelog_urls(
+            player_info, season_list, config, web_driver, refresh
+        ).items():
+            if player_id is None:
+                # nothing to name the saved page after
+                page_contents = fetch_page(
+                    request_url=rf"{BASELINE_URL}{year_url}",
+                    firefox_driver=web_driver,
+                )
+                if page_contents is None:
+                    print(rf"Could not load {year_url}; skipping")
+                    continue
+            else:
+                gamelog_file = player_gamelog_file(player_id, season_year, config)
+                # seasons the player missed answer 404 once and are not requested again
+                page_changed = refresh_cached_page(
+                    rf"{BASELINE_URL}{year_url}", gamelog_file, web_driver, recheck_missing=refresh
+                )
+                if not page_changed and player_id in saved_season_players[season_year]:
+                    unchanged_seasons += 1
+                    continue
+                if not gamelog_file.is_file():
+                    continue
+
+                # get html data from specific season
+                with open(gamelog_file, "r", encoding="utf-8") as file:
+                    page_contents = file.read()
+
+            season_df = parse_player_game_log(
+                page_contents,
+                {
+                    "Season": season_year,
+                    "Player": player_info["player"],
+                    "Player_id": player_id,
+                    **player_metrics(player_info),
+                },
+                page_label=year_url,
+            )
+            # a season inside the career span can still be one the player missed entirely
+            if season_df is None:
+                print(
+                    rf"No player season data found for {player_info["player"]} in {season_year}"
+                )
+                continue
+
+            player_season_dfs.append(season_df)
+
+        if unchanged_seasons:
+            print(
+                rf"Game log data for {unchanged_seasons} season(s) of {player_info["player"]} unchanged"
+            )
+        if not player_season_dfs:
+            continue
+
+        player_games_dfs.append(pd.concat(player_season_dfs, ignore_index=True))
+        print(
+            rf"Game log data for {len(player_season_dfs)} season(s) found for {player_info["player"]}"
+        )
+
+    # quit web driver
+    if web_driver is not None:
+        web_driver.quit()
+
+    if save_games:
+        save_player_season_games(player_games_dfs, config)
+
+    return player_games_dfs
+
+
+# used to find full game schedules for the years in the given range
+# the season page and every month page are saved and re-checked with conditional requests (see refresh_cached_page); a season none of whose pages changed keeps its saved csv and is not parsed again, so a refresh of the current season only downloads and parses the months still being played
+def full_games_schedule(
+    start_year: int, end_year: int, config: ScrapeConfig = None, use_browser: bool = False
+) -> DataFrame:
+    from bs4 import BeautifulSoup
+
+    config = config or load_config()
+    # the schedule tables are in the static html, so the browser is only started when asked for
+    web_driver = initialize_selenium_driver(config) if use_browser else None
+    # list containing all DataFrames with each season's data; contains data of form: [year, season_schedule_df]
+    seasons_schedules_headers = ["Year", "Season_schedule_df"]
+    all_seasons_schedules_dfs = pd.DataFrame(columns=seasons_schedules_headers)
+
+    # iterate over year range
+    for year in range(start_year, (end_year + 1)):
+        schedule_html_file = config.schedule_pages_directory / rf"{year}_schedule.html"
+        season_schedule_file = config.season_games_directory / rf"{year}_season_games.csv"
+
+        # save the html data for the page; corrects for difference in url and season start year
+        season_page_changed = refresh_cached_page(
+            rf"{BASELINE_URL}/leagues/NBA_{(year + 1)}_games.html",
+            schedule_html_file,
+            web_driver,
+        )
+        if not schedule_html_file.is_file():
+            print(f"No schedule page saved for year {year}. Skipping...")
+            continue
+
+        # open file containing the HTML data (with error handles)
+        with open(
+            schedule_html_file,
+            "r",
+            encoding="utf-8",
+        ) as file:
+            contents = file.read()
+
+        # make soup
+        soup = BeautifulSoup(contents, "html.parser")
+        # find the div containing the month urls for a given season
+        month_data = soup.find("div", class_="filter")
+
+        # added to help with debugging
+        if month_data is None:
+            print(f"No month data found for year {year}. Skipping...")
+            continue
+
+        # every month page is brought up to date before deciding whether the season has to be parsed again ("/leagues/NBA_1981_games-october.html" is saved as NBA_1981_games-october.html)
+        month_links = month_data.find_all("a", href=True)
+        month_pages_changed = [
+            refresh_cached_page(
+                rf"{BASELINE_URL}{month['href']}",
+                config.schedule_pages_directory / Path(month["href"]).name,
+                web_driver,
+            )
+            for month in month_links
+        ]
+        if not season_page_changed and not any(month_pages_changed) and season_schedule_file.is_file():
+            season_schedule_df = pd.read_csv(season_schedule_file)
+            all_seasons_schedules_dfs = pd.concat(
+                [all_seasons_schedules_dfs, pd.DataFrame([[year, season_schedule_df]], columns=seasons_schedules_headers)]
+            )
+            print(rf"Schedule for {year} unchanged; keeping {year}_season_games.csv")
+            continue
+
+        schedule_schema = None
+        # data-stat -> cell text of every game, one list per column
+        raw_columns = {}
+        # (date, visitor, home) of the games already read; guards against a game listed twice
+        games_read = set()
+
+        for month in month_links:
+            month_html_file = config.schedule_pages_directory / Path(month["href"]).name
+            if not month_html_file.is_file():
+                print(f"No page saved for month {month['href']} in year {year}. Skipping...")
+                continue
+
+            # obtains the html data for the given month of the season
+            with open(month_html_file, "r", encoding="utf-8") as file:
+                season_month_data = file.read()
+            # make soup
+            soup_2 = BeautifulSoup(season_month_data, "html.parser")
+            # find table with season data
+            table = soup_2.find("table", id="schedule")
+
+            # added to help with debugging
+            if table is None:
+                print(
+                    f"No table found for month {month['href']} in year {year}. Skipping..."
+                )
+                continue
+
+            # the header is checked against the registered schema instead of being read for every month
+            schedule_schema = validate_table(table, "schedule", month["href"])
+            if not raw_columns:
+                raw_columns = {data_stat: [] for data_stat in [*schedule_schema.columns, "Box_score_url"]}
+
+            # extract rows, skipping any repeated header rows; records the games for the regular season
+            for row in table.find("tbody").find_all("tr"):
+                # skip rows that have header information
+                if "thead" in row.get("class", []):
+                    continue
+
+                row_cells = {
+                    cell.get("data-stat"): cell
+                    for cell in row.find_all(["th", "td"])
+                }
+                if "home_team_name" not in row_cells:
+                    continue
+
+                game_key = tuple(
+                    row_cells[data_stat].get_text()
+                    for data_stat in ("date_game", "visitor_team_name", "home_team_name")
+                    if data_stat in row_cells
+                )
+                if game_key in games_read:
+                    continue
+                games_read.add(game_key)
+
+                for data_stat in schedule_schema.columns:
+                    cell = row_cells.get(data_stat)
+                    raw_columns[data_stat].append(
+                        cell.get_text().replace("\xa0", " ").strip() if cell else ""
+                    )
+
+                # keep the box score link, its file name is basketball-reference's id for the game
+                box_score_cell = row_cells.get("box_score_text")
+                box_score_link = box_score_cell.find("a") if box_score_cell else None
+                raw_columns["Box_score_url"].append(
+                    box_score_link["href"] if box_score_link else None
+                )
+
+        if schedule_schema is None:
+            print(f"No schedule tables found for year {year}. Skipping...")
+            continue
+
+        # make DataFrame for the given season schedule, each column in its registered dtype
+        season_schedule_columns = {}
+        for data_stat, (column_name, column_dtype) in schedule_schema.columns.items():
+            if column_dtype == "str":
+                season_schedule_columns[column_name] = pd.Series(
+                    [value or None for value in raw_columns[data_stat]], dtype="str"
+                )
+            else:
+                # games not played yet have no points
+                season_schedule_columns[column_name] = pd.to_numeric(
+                    pd.Series(raw_columns[data_stat], dtype="str"), errors="coerce"
+                ).astype(column_dtype)
+        season_schedule_columns["Box_score_url"] = pd.Series(
+            raw_columns["Box_score_url"], dtype="object"
+        )
+        season_schedule_df = pd.DataFrame(season_schedule_columns)
+
+        # stable id for each game, e.g. "198010100BOS"; used to join box score player lines to the schedule
+        season_schedule_df["Game_id"] = season_schedule_df["Box_score_url"].apply(
+            game_id_from_url
+        )
+
+        # full team names to their abbreviations in Home
+        season_schedule_df["Home"] = season_schedule_df["Home"].apply(
+            lambda x: full_to_abbreviation(x, year, config)
+        )
+        # full team names to their abbreviations in Away
+        season_schedule_df["Away"] = season_schedule_df["Away"].apply(
+            lambda x: full_to_abbreviation(x, year, config)
+        )
+        # fix date format
+        season_schedule_df["Date"] = date_change_series(
+            season_schedule_df["Date"], is_player=False
+        )
+
+        # temp list to make season DataFrame
+        df_list = [[year, season_schedule_df]]
+        # creates new DataFrame that contains both the season year and season schedule using the same headers as all_season_schedules to concatenate
+        total_season_info_df = pd.DataFrame(df_list, columns=seasons_schedules_headers)
+        # add total_season_info_df to the full DataFrame of all seasons
+        all_seasons_schedules_dfs = pd.concat(
+            [all_seasons_schedules_dfs, total_season_info_df]
+        )
+        # save to CSV, removing row indexes and keeping the headers
+        season_schedule_df.to_csv(
+            prepare_file_path(
+                config.season_games_directory / rf"{year}_season_games.csv"
+            ),
+            index=False,
+            header=True,
+        )
+
+        print(rf"Season data saved to {year}_season_games.csv")
+
+    # quit web driver
+    if web_driver is not None:
+        web_driver.quit()
+    return all_seasons_schedules_dfs
+
+
+# fetches one box score page per game of each season in the range (end year inclusive) and saves every player line of both teams to {year}_box_scores.csv next to the season schedule; requires the schedule csv from full_games_schedule
+# the page of a finished game does not change, so games whose page was already saved keep their player lines from the existing csv and only newly fetched pages are parsed; the csv is not written again when no game was added; rebuild parses every saved page again
+# pages are fetched through refresh_cached_page, so each is saved with its validators; refresh checks the saved pages against the site too (one conditional request per game) and parses the ones that changed again
+def get_box_scores(
+    start_year: int,
+    end_year: int,
+    config: ScrapeConfig = None,
+    use_browser: bool = False,
+    rebuild: bool = False,
+    refresh: bool = False,
+):
+    config = config or load_config()
+    # box score tables are in the static html, so the browser is only started when asked for
+    web_driver = initialize_selenium_driver(config) if use_browser else None
+
+    for year in range(start_year, (end_year + 1)):
+        schedule_path = config.season_games_directory / rf"{year}_season_games.csv"
+        if not schedule_path.is_file():
+            print(rf"No schedule saved for {year}; run full_games_schedule first")
+            continue
+
+        season_game_schedule_df = pd.read_csv(schedule_path)
+        if "Game_id" not in season_game_schedule_df.columns:
+            print(rf"Schedule for {year} has no box score links; run full_games_schedule again")
+            continue
+
+        box_scores_file = config.season_games_directory / rf"{year}_box_scores.csv"
+        # player lines of the last run (round_trip so the reused values are written back unchanged); only the games still in the schedule are kept
+        saved_box_score_df = pd.DataFrame(columns=["Game_id"])
+        if box_scores_file.is_file() and not rebuild:
+            saved_box_score_df = pd.read_csv(box_scores_file, float_precision="round_trip")
+        kept_box_score_df = saved_box_score_df[
+            saved_box_score_df["Game_id"].isin(season_game_schedule_df["Game_id"])
+        ]
+        saved_game_ids = set(kept_box_score_df["Game_id"])
+        # games parsed again on this run; their saved rows are replaced
+        reparsed_game_ids = set()
+
+        season_player_rows = []
+        for game_from_schedule in season_game_schedule_df.itertuples():
+            # games not played yet have no box score
+            if not isinstance(game_from_schedule.Game_id, str):
+                continue
+
+            box_score_file = (
+                config.box_score_pages_directory / rf"{game_from_schedule.Game_id}.html"
+            )
+            # a played game's box score does not change, so saved pages are only checked against the site again when refreshing
+            page_changed = False
+            if refresh or not box_score_file.is_file():
+                page_changed = refresh_cached_page(
+                    rf"{BASELINE_URL}{game_from_schedule.Box_score_url}", box_score_file, web_driver
+                )
+            if not box_score_file.is_file():
+                continue
+            # saved page, already parsed into the csv
+            if not page_changed and game_from_schedule.Game_id in saved_game_ids:
+                continue
+            reparsed_game_ids.add(game_from_schedule.Game_id)
+
+            try:
+                with open(box_score_file, "r", encoding="utf-8") as file:
+                    contents = file.read()
+            except Exception as e:
+                basic_error_handling(e)
+                continue
+
+            home_team = game_from_schedule.Home.strip()
+            away_team = game_from_schedule.Away.strip()
+            for row_data in parse_box_score(contents, game_from_schedule.Game_id):
+                is_home = row_data["Team"] == home_team
+                row_data["Date"] = game_from_schedule.Date
+                row_data["Game_location"] = "Home" if is_home else "Away"
+                row_data["Opponent"] = away_team if is_home else home_team
+                season_player_rows.append(row_data)
+
+        kept_box_score_df = kept_box_score_df[~kept_box_score_df["Game_id"].isin(reparsed_game_ids)]
+        box_score_df = pd.DataFrame(season_player_rows)
+        if box_score_df.empty and kept_box_score_df.empty:
+            print(rf"No box score data found for {year}")
+            continue
+        if box_score_df.empty and len(kept_box_score_df) == len(saved_box_score_df):
+            print(rf"Box scores for {year} unchanged; keeping {year}_box_scores.csv")
+            continue
+
+        if not box_score_df.empty:
+            # same conversions as the player game logs
+            box_score_df["Minutes Played"] = playtime_conversion_series(
+                box_score_df["Minutes Played"]
+            )
+            numeric_columns = [
+                column
+                for column in [*PLAYER_GAME_FLOAT_COLUMNS, "Plus/Minus"]
+                if column in box_score_df.columns
+            ]
+            box_score_df[numeric_columns] = box_score_df[numeric_columns].apply(
+                pd.to_numeric, errors="coerce"
+            )
+
+        # reused and new player lines in schedule order, the order a full parse gives
+        schedule_positions = {
+            game_id: position for position, game_id in enumerate(season_game_schedule_df["Game_id"])
+        }
+        box_score_df = pd.concat(
+            [season_df for season_df in (kept_box_score_df, box_score_df) if not season_df.empty],
+            ignore_index=True,
+        ).sort_values("Game_id", key=lambda game_ids: game_ids.map(schedule_positions), kind="stable")
+
+        # save to CSV, removing row indexes and keeping the headers
+        box_score_df.to_csv(prepare_file_path(box_scores_file), index=False, header=True)
+        print(rf"Box score data saved to {year}_box_scores.csv")
+
+    # quit web driver
+    if web_driver is not None:
+        web_driver.quit()
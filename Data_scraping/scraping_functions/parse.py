@@ -0,0 +1,555 @@
+import re
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+# local library
+from schemas import STAT_COLUMN_NAMES, validate_table
+
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
+
+# parse: basketball-reference html and table text to python / pandas values; table rows, ids from page urls, the field parsers and the letter page, game log and box score tables; nothing here requests a page or writes a file
+# BeautifulSoup is imported inside the functions that make a soup, so the field parsers (used by the compile, features and benchmarks) do not load it
+
+# letter page data-stat -> column name for the player details copied onto every game of a player
+PLAYER_METRIC_COLUMNS = {
+    "pos": "Position",
+    "height": "Height",
+    "weight": "Weight",
+    "birth_date": "Birth_date",
+    "colleges": "Colleges",
+    # metric versions of height and weight added by normalize_player_bios
+    "height_cm": "Height_cm",
+    "weight_kg": "Weight_kg",
+}
+
+
+# numeric game log columns that get_player_season_stats converts to floats
+PLAYER_GAME_FLOAT_COLUMNS = [
+    "Field Goals",
+    "Field Goal Attempts",
+    "Field Goal Percentage",
+    "3-Point Field Goals",
+    "3-Point Field Goal Attempts",
+    "3-Point Field Goal Percentage",
+    "Free Throws",
+    "Free Throw Attempts",
+    "Free Throw Percentage",
+    "Offensive Rebounds",
+    "Defensive Rebounds",
+    "Total Rebounds",
+    "Assists",
+    "Steals",
+    "Blocks",
+    "Turnovers",
+    "Personal Fouls",
+    "Points",
+    "Game Score",
+]
+
+
+# id of each team's basic box score table, e.g. "box-BOS-game-basic"
+BOX_SCORE_TABLE_ID = re.compile(r"^box-([A-Z0-9]+)-game-basic$")
+
+
+# handles html table conversion to a dictionary; allows for transformation to JSON if needed
+def table_to_dictionary(table) -> list:
+    # *** in general the tables I target contain a thead section for headers, even if I don't extract the headers directly from there
+    if not table.find("thead"):
+        return None
+
+    return list(iterate_table_rows(table))
+
+
+# yields the rows of an html table one {data-stat : text} dictionary at a time, so callers can filter rows without holding the whole table
+def iterate_table_rows(table):
+    table_body = table.find("tbody")
+    if table_body is None:
+        return
+
+    for table_row in table_body.find_all("tr"):
+        # make dictionary for label assignments
+        row_data_dict = {}
+
+        # iterate over tags in table rows
+        for row_cell_data in table_row.find_all(["td", "th"]):
+            # .get() to retrieve data in a given attribute
+            single_cell_data = row_cell_data.get("data-stat")
+            if not single_cell_data:
+                continue
+
+            data_header = single_cell_data.replace("*", "")
+            main_data_text = row_cell_data.get_text().replace("*", "")
+            # add {header : main_text} pair to the dict
+            row_data_dict[data_header] = main_data_text
+
+            for a_attribute_cell_data in row_cell_data.find_all("a"):
+                if a_attribute_cell_data is None:
+                    continue
+
+                # assign url header and info into the dict
+                url_header = rf"{single_cell_data}_url"
+                url_data = a_attribute_cell_data["href"]
+                # check if key is already in dict
+                # append if it is
+                if row_data_dict.get(url_header):
+                    row_data_dict[url_header].append(url_data)
+                # create it if it isn't
+                else:
+                    row_data_dict[url_header] = [url_data]
+
+        # skip empty rows (spacers and repeated header rows)
+        if row_data_dict:
+            yield row_data_dict
+
+
+# basketball-reference ships many secondary tables (playoff game logs, advanced stats, box score extras) inside html comments that JavaScript un-comments in the browser; this finds such a table in the static html and returns it parsed, or None
+def find_commented_table(soup: "BeautifulSoup", table_id: str):
+    from bs4 import BeautifulSoup, Comment
+
+    table_id_marker = rf'id="{table_id}"'
+
+    for comment in soup.find_all(string=lambda text: isinstance(text, Comment)):
+        # cheap substring check so only the comment holding the table gets parsed
+        if table_id_marker not in comment:
+            continue
+
+        comment_soup = BeautifulSoup(comment, "html.parser")
+        table = comment_soup.find("table", id=table_id)
+        if table is not None:
+            return table
+
+    return None
+
+
+# finds a table by its id whether it is part of the page or hidden inside an html comment
+def find_table(soup: "BeautifulSoup", table_id: str):
+    table = soup.find("table", id=table_id)
+    if table is not None:
+        return table
+
+    return find_commented_table(soup, table_id)
+
+
+# basketball-reference's id for a player, taken from their page url ("/players/a/adamsal01.html" -> "adamsal01")
+def player_id_from_url(player_url: str) -> str:
+    if not player_url:
+        return None
+    player_id_search = re.search(r"/players/\w/([\w.]+?)(?:\.html|/|$)", player_url)
+    return player_id_search.group(1) if player_id_search else None
+
+
+# basketball-reference's id for a game, taken from its box score url ("/boxscores/198010100BOS.html" -> "198010100BOS")
+def game_id_from_url(box_score_url: str) -> str:
+    if not isinstance(box_score_url, str):
+        return None
+    game_id_search = re.search(r"/boxscores/(\w+)\.html", box_score_url)
+    return game_id_search.group(1) if game_id_search else None
+
+
+# field parsers for the text basketball-reference puts in its tables; each has a scalar version (one value, None when it cannot be read) built on precompiled patterns and integer arithmetic, and a _series version that converts a whole pandas column (NaN when it cannot be read)
+# a column of game log text repeats the same few hundred dates, ages and results, so the _series versions parse each distinct value once with the scalar parser and spread the results back with the factorize codes; the two versions can never disagree
+
+# "Oct" -> 10; schedule dates spell the month out
+MONTH_NUMBERS = {
+    month_name: month_number
+    for month_number, month_name in enumerate(
+        ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"],
+        start=1,
+    )
+}
+
+
+# "Sun"; schedule dates start with the weekday
+WEEKDAY_NAMES = {"Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"}
+
+
+# game log dates, "1980-10-12"
+PLAYER_DATE_PATTERN = re.compile(r"^(\d{4})-(\d{2})-(\d{2})$")
+
+
+# schedule dates, "Sun, Oct 12, 1980"
+SCHEDULE_DATE_PATTERN = re.compile(r"^([A-Za-z]{3}), ([A-Za-z]{3}) (\d{1,2}), (\d{4})$")
+
+
+# player age, "22-060" (years-days)
+PLAYER_AGE_PATTERN = re.compile(r"^(\d+)-(\d+)$")
+
+
+# game result, "W (+9)" / "L (-13)", or the final score form "W, 110-101" some pages use
+WIN_LOSS_MARGIN_PATTERN = re.compile(r"\(([+-]?\d+)\)")
+
+
+GAME_SCORE_PATTERN = re.compile(r"^([WL])\W*(\d+)-(\d+)")
+
+
+# handles time conversion from hours:minutes:seconds to just a floating point for minutes
+def playtime_conversion(time_str: str) -> float:
+    if not time_str:
+        return None
+
+    time_parts = time_str.strip().split(":")
+    if not all(time_part.isdigit() for time_part in time_parts):
+        return None
+
+    # whole minutes folded from the left (hours -> minutes), then the seconds added as a fraction, in the same order as the strptime version so the floats are identical
+    *whole_parts, seconds = (int(time_part) for time_part in time_parts)
+    minutes = 0
+    for time_part in whole_parts:
+        minutes = minutes * 60 + time_part
+
+    return minutes + seconds / 60.0
+
+
+# column version of playtime_conversion
+def playtime_conversion_series(time_series: pd.Series) -> pd.Series:
+    return parse_unique_values(time_series, playtime_conversion, "float64")
+
+
+# handles date conversion for date formats in schedule and player data; both become "mm/dd/yy"
+# the dates the site writes are read with the patterns above; anything else goes to datetime.strptime, so every value is read (or rejected with ValueError) exactly as strptime reads it
+def date_change(date: str, is_player: bool = False) -> str:
+    if is_player:
+        date_search = PLAYER_DATE_PATTERN.match(date)
+        if date_search is None:
+            return datetime.strptime(date, "%Y-%m-%d").strftime("%m/%d/%y")
+        year, month, day = (int(date_part) for date_part in date_search.groups())
+    else:
+        date_search = SCHEDULE_DATE_PATTERN.match(date)
+        if (
+            date_search is None
+            or date_search.group(1) not in WEEKDAY_NAMES
+            or date_search.group(2) not in MONTH_NUMBERS
+        ):
+            return datetime.strptime(date, "%a, %b %d, %Y").strftime("%m/%d/%y")
+        _, month_name, day, year = date_search.groups()
+        year, month, day = int(year), MONTH_NUMBERS[month_name], int(day)
+
+    # impossible dates ("1980-13-45", "Fri, Feb 30, 1981") raise ValueError like strptime does
+    datetime(year, month, day)
+    return rf"{month:02d}/{day:02d}/{year % 100:02d}"
+
+
+# column version of date_change; unreadable dates become NaN instead of raising
+def date_change_series(date_series: pd.Series, is_player: bool = False) -> pd.Series:
+    def date_or_none(date: str) -> str:
+        try:
+            return date_change(date, is_player)
+        except (TypeError, ValueError):
+            return None
+
+    return parse_unique_values(date_series, date_or_none, "str")
+
+
+# reformats player age from format "Year-days", to years as a float
+def reformat_player_age(age_as_str: str) -> float:
+    age_search = PLAYER_AGE_PATTERN.match(age_as_str.strip()) if age_as_str else None
+    if age_search is None:
+        return None
+
+    return int(age_search.group(1)) + int(age_search.group(2)) / 365.0
+
+
+# column version of reformat_player_age
+def reformat_player_age_series(age_series: pd.Series) -> pd.Series:
+    return parse_unique_values(age_series, reformat_player_age, "float64")
+
+
+# reformats Win_loss_margin to be a floating point, and removes the W/L, which can be read from the sign (positive for a win, negative for a loss)
+def reformat_win_loss_margin(game_result: str) -> float:
+    if not game_result:
+        return None
+
+    margin_search = WIN_LOSS_MARGIN_PATTERN.search(game_result)
+    if margin_search is not None:
+        return float(int(margin_search.group(1)))
+
+    # "W, 110-101": the team's own score comes first
+    score_search = GAME_SCORE_PATTERN.match(game_result.strip())
+    if score_search is not None:
+        return float(int(score_search.group(2)) - int(score_search.group(3)))
+
+    return None
+
+
+# column version of reformat_win_loss_margin
+def reformat_win_loss_margin_series(game_result_series: pd.Series) -> pd.Series:
+    return parse_unique_values(game_result_series, reformat_win_loss_margin, "float64")
+
+
+# runs a scalar field parser once per distinct value of a column and maps the results back onto every row; missing values stay missing
+def parse_unique_values(column: pd.Series, scalar_parser, dtype: str) -> pd.Series:
+    value_codes, unique_values = pd.factorize(column)
+    # the extra last entry is what code -1 (a missing value) picks up
+    parsed_values = [scalar_parser(value) for value in unique_values] + [None]
+    if dtype == "float64":
+        parsed_array = np.array(
+            [np.nan if value is None else value for value in parsed_values], dtype="float64"
+        )
+    else:
+        parsed_array = np.array(parsed_values, dtype="object")
+
+    return pd.Series(parsed_array[value_codes], index=column.index, dtype=dtype)
+
+
+# centimetres per foot / inch and kilograms per pound
+CM_PER_FOOT = 30.48
+
+
+CM_PER_INCH = 2.54
+
+
+KG_PER_POUND = 0.45359237
+
+
+# adds height_cm / weight_kg to every letter page player record, converted column-wise from the "6-10" heights and pound weights the page lists; values that are missing or cannot be read are left as None and returned as an error report (one dictionary per player and field) instead of stopping the conversion
+def normalize_player_bios(letter_players: list) -> list:
+    if not letter_players:
+        return []
+
+    bio_df = pd.DataFrame(
+        {
+            "height": [player.get("height") for player in letter_players],
+            "weight": [player.get("weight") for player in letter_players],
+        },
+        dtype="str",
+    )
+
+    # "6-10" -> feet, inches; reindex keeps both columns when no value has a hyphen
+    height_parts = bio_df["height"].str.split("-", n=1, expand=True).reindex(columns=[0, 1])
+    feet = pd.to_numeric(height_parts[0], errors="coerce")
+    inches = pd.to_numeric(height_parts[1], errors="coerce")
+    height_cm = (feet * CM_PER_FOOT + inches * CM_PER_INCH).round(2)
+    # inches past 11 mean the value is not a feet-inches height
+    height_cm = height_cm.where(inches.between(0, 11))
+
+    weight_kg = (pd.to_numeric(bio_df["weight"], errors="coerce") * KG_PER_POUND).round(2)
+
+    bio_errors = []
+    for field_name, metric_key, metric_column in (
+        ("height", "height_cm", height_cm),
+        ("weight", "weight_kg", weight_kg),
+    ):
+        raw_column = bio_df[field_name]
+        metric_values = metric_column.astype("object").where(metric_column.notna(), None).to_list()
+        for player, metric_value in zip(letter_players, metric_values):
+            player[metric_key] = metric_value
+
+        # only the failed rows are looked at one by one
+        is_blank = raw_column.isna() | (raw_column.str.strip() == "")
+        for row_number in metric_column.index[metric_column.isna()]:
+            bio_errors.append(
+                {
+                    "player": letter_players[row_number].get("player"),
+                    "player_id": letter_players[row_number].get("player_id"),
+                    "field": field_name,
+                    "value": None if is_blank[row_number] else raw_column[row_number],
+                    "problem": "missing" if is_blank[row_number] else "unreadable",
+                }
+            )
+
+    return bio_errors
+
+
+# letter page player rows reduced to the fields the rest of the scraper uses; year_min/year_max are converted from the season end years the page lists to the season start years used everywhere else (1981 -> 1980)
+def letter_page_players(page_contents: str, page_label: str = None) -> list:
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(page_contents, "html.parser")
+
+    letter_players = []
+    # stream the rows of every player table (there should only be one)
+    for table_info in soup.find_all("table", id="players"):
+        validate_table(table_info, "players", page_label)
+        for player_object in iterate_table_rows(table_info):
+            try:
+                year_min = int(player_object["year_min"]) - 1
+                year_max = int(player_object["year_max"]) - 1
+            except (KeyError, ValueError):
+                continue
+
+            # url list should always contain a single url
+            player_url = (player_object.get("player_url") or [None])[0]
+            letter_players.append(
+                {
+                    "player": player_object.get("player"),
+                    "player_url": player_url,
+                    "player_id": player_id_from_url(player_url),
+                    "year_min": year_min,
+                    "year_max": year_max,
+                    # player details used as constant columns of the player's game logs
+                    **{data_stat: player_object.get(data_stat) for data_stat in PLAYER_METRIC_COLUMNS},
+                }
+            )
+
+    return letter_players
+
+
+# season (start year) -> game log url for every season row of a career "per_game_stats" table, in a single pass over the rows
+def career_gamelog_urls(career_table) -> dict:
+    career_urls = {}
+    for element in career_table.find("tbody").find_all("tr"):
+        # check to see if element ends up being NoneType / None. jumps to next row
+        search_headers = element.find("th")
+        if search_headers is None:
+            continue
+        search_hyperlink = search_headers.find("a")
+        if search_hyperlink is None:
+            continue
+
+        # the season label looks like "1980-81"; the start year is the part before the hyphen
+        season_label = search_hyperlink.get_text()
+        hyphen_position = season_label.find("-")
+        if hyphen_position < 1 or not season_label[:hyphen_position].isdigit():
+            continue
+
+        # some pages contain multiple lines for the same year (one per team), all linking to the same game log, so the first one is kept
+        career_urls.setdefault(int(season_label[:hyphen_position]), search_hyperlink["href"])
+
+    return career_urls
+
+
+# player details from the letter page (height, weight, etc...) that are added as constant columns to every game the player played
+def player_metrics(player_info: dict) -> dict:
+    return {
+        metric_header: player_info.get(data_stat)
+        for data_stat, metric_header in PLAYER_METRIC_COLUMNS.items()
+    }
+
+
+# turns a game log page into a DataFrame with one row per regular season and playoff game, or None when the page has no regular season table
+# the header is only checked against the registered "pgl_basic" schema (see schemas.py); cells are collected straight into one list per column keyed by data-stat, converted column by column to the schema dtypes and the frame is built once; constant_columns (season, player, player details) are broadcast to every row
+def parse_player_game_log(
+    page_contents: str, constant_columns: dict, page_label: str = None
+) -> DataFrame:
+    from bs4 import BeautifulSoup
+
+    # Parse the HTML with BeautifulSoup
+    soup_2 = BeautifulSoup(page_contents, "html.parser")
+
+    # find the 'pgl_basic' table by its tag and ID
+    table_2 = find_table(soup_2, "pgl_basic")
+    # find the 'pgl_basic_playoffs' table by its tag and ID; static html has it inside a comment
+    table_3 = find_table(soup_2, "pgl_basic_playoffs")
+
+    # determines if the regular season table (table_2) exists in the html
+    if not table_2:
+        return None
+
+    # both tables must have the registered layout, otherwise the columns would be read wrongly
+    schema = validate_table(table_2, "pgl_basic", page_label)
+    if table_3:
+        validate_table(table_3, "pgl_basic_playoffs", page_label)
+
+    raw_columns = {data_stat: [] for data_stat in schema.columns}
+    # (date, team) of the games already read; guards against a game listed twice
+    games_read = set()
+
+    # records the regular season games, then the playoff games if the player made it to the playoffs that season
+    for table in (table_2, table_3):
+        if not table:
+            continue
+
+        for row in table.find("tbody").find_all("tr"):
+            # the header row is repeated inside the body every 20 games
+            if "thead" in (row.get("class") or []):
+                continue
+
+            row_cells = {
+                cell.get("data-stat"): cell.get_text().replace("\xa0", " ").strip()
+                for cell in row.find_all(["th", "td"])
+            }
+            # games the player missed have a single "reason" cell (Inactive, Did Not Play, ...) instead of stats
+            if "mp" not in row_cells or "date_game" not in row_cells:
+                continue
+
+            game_key = (row_cells["date_game"], row_cells.get("team_id"))
+            if game_key in games_read:
+                continue
+            games_read.add(game_key)
+
+            for data_stat, column_values in raw_columns.items():
+                # columns the page does not have (plus/minus before 1996-97) are left empty
+                column_values.append(row_cells.get(data_stat, ""))
+
+    # the text columns that need reformatting, converted a whole column at a time; every other column is numeric; blank cells become NaN, except for the location where blank means a home game
+    column_converters = {
+        # fix date format for ease of comparison later
+        "date_game": lambda column: date_change_series(column, is_player=True),
+        # fix age format to a floating point
+        "age": reformat_player_age_series,
+        "team_id": lambda column: column.mask(column == ""),
+        # change the default "@" in the location column
+        "game_location": lambda column: column.mask(column == "@", "Away").where(column == "@", "Home"),
+        "opp_id": lambda column: column.mask(column == ""),
+        # reformat win/loss margin as float
+        "game_result": reformat_win_loss_margin_series,
+        # change game started from 0/1 to T/F boolean
+        "gs": lambda column: column == "1",
+        # fix minutes played to a floating point
+        "mp": playtime_conversion_series,
+    }
+
+    season_columns = {}
+    for data_stat, (column_name, column_dtype) in schema.columns.items():
+        column_values = pd.Series(raw_columns[data_stat], dtype="str")
+        if data_stat in column_converters:
+            season_columns[column_name] = column_converters[data_stat](column_values).astype(column_dtype)
+        else:
+            # blank cells (no attempts) become NaN
+            season_columns[column_name] = pd.to_numeric(
+                column_values, errors="coerce"
+            ).astype(column_dtype)
+
+    return pd.DataFrame(
+        {**constant_columns, **season_columns},
+        index=pd.RangeIndex(len(raw_columns["date_game"])),
+    )
+
+
+# parses both teams' basic box score tables from a box score page; returns one dictionary per player line
+def parse_box_score(page_contents: str, game_id: str) -> list:
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(page_contents, "html.parser")
+    player_rows = []
+
+    for table in soup.find_all("table", id=BOX_SCORE_TABLE_ID):
+        validate_table(table, "box_score", rf"box score {game_id}")
+        team = BOX_SCORE_TABLE_ID.match(table["id"]).group(1)
+        # the first rows are the starters, until the "Reserves" header row
+        is_starter = True
+
+        for row in table.find("tbody").find_all("tr"):
+            if "thead" in row.get("class", []):
+                is_starter = False
+                continue
+
+            player_cell = row.find("th", attrs={"data-stat": "player"})
+            if player_cell is None:
+                continue
+            player_link = player_cell.find("a")
+
+            row_data = {
+                "Game_id": game_id,
+                "Team": team,
+                "Player": player_cell.get_text().strip(),
+                "Player_id": player_id_from_url(player_link["href"]) if player_link else None,
+                "Games Started": is_starter,
+                "Did_not_play_reason": None,
+            }
+            for row_cell in row.find_all("td"):
+                data_stat = row_cell.get("data-stat")
+                # players that did not play only have a reason cell ("Did Not Play", "Inactive", ...)
+                if data_stat == "reason":
+                    row_data["Did_not_play_reason"] = row_cell.get_text().strip()
+                elif data_stat in STAT_COLUMN_NAMES:
+                    row_data[STAT_COLUMN_NAMES[data_stat]] = row_cell.get_text().strip()
+
+            player_rows.append(row_data)
+
+    return player_rows
@@ -0,0 +1,676 @@
+import csv
+import hashlib
+import json
+import os
+import pickle
+from collections import namedtuple
+from dataclasses import dataclass, field
+from io import BytesIO
+from pathlib import Path
+
+import pandas as pd
+from pandas import DataFrame
+
+# local library
+from config import ScrapeConfig, load_config, prepare_file_path
+from scraping_functions.parse import letter_page_players, normalize_player_bios
+
+# store: the files the scraper keeps between runs; team names, the player season index, the consolidated player game files, the compiled seasons and their csv / json exports
+
+# version of the player records stored in the player season index; indexes saved with another version are rebuilt
+PLAYER_SEASON_INDEX_VERSION = 3
+
+
+# error handles for issues that may arise
+def basic_error_handling(possible_error):
+    if isinstance(possible_error, ValueError):
+        print("ValueError: Invalid value provided.")
+    elif isinstance(possible_error, ZeroDivisionError):
+        print("ZeroDivisionError: Division by zero is not allowed.")
+    elif isinstance(possible_error, FileNotFoundError):
+        print("File not found!")
+    elif isinstance(possible_error, PermissionError):
+        print("You don't have permission to access this file!")
+    else:
+        print(f"An unexpected error occurred: {possible_error}")
+
+
+# utilize the pickle library to save the contents of a list or other data structure for later use (*not for DataFrames)
+def pickle_data(data_for_later, file_name: str, config: ScrapeConfig = None):
+    config = config or load_config()
+    try:
+        with open(
+            prepare_file_path(config.pickled_data_directory / rf"{file_name}.pkl"),
+            "wb",
+        ) as file:
+            pickle.dump(data_for_later, file)
+    except Exception as e:
+        basic_error_handling(e)
+
+
+# retrieve the string literal of a variable name for ease of use when naming files
+def variable_to_string_literal(variable):
+    for name, value in globals().items():
+        if value is variable:
+            return name
+    return None
+
+
+# takes a text file containing information for all NBA teams and transfers the info to a DataFrame for comparisons; * These abbreviations are the ones used by basketball-reference, not necessarily the "official" ones
+def get_team_abbreviations(config: ScrapeConfig = None) -> DataFrame:
+    config = config or load_config()
+
+    # headers for the relevant data
+    team_headers = ["team_location", "team_abbreviation", "team_name", "year_active"]
+    # list to collect the rows of data
+    team_table = []
+    # open text file containing team name and abbreviations for all historical and current NBA teams, excluding only a few repeat teams that "re branded" circa ~1950's
+    try:
+        with open(config.team_names_file, "r") as file:
+            for line in file:
+                # strip leading/trailing whitespace and split by tab
+                row = line.strip().split("\t")
+                team_table.append(row)
+    except Exception as e:
+        basic_error_handling(e)
+
+    # place data into a DataFrame
+    team_name_df = pd.DataFrame(team_table, columns=team_headers)
+    # make all team abbreviations uppercase
+    team_name_df["team_abbreviation"] = team_name_df["team_abbreviation"].apply(
+        lambda x: x.upper()
+    )
+    # separate by comma for teams that have multiple abbreviations; makes the abbreviation elements into a list (some fields in the file have stray spaces)
+    team_name_df["team_abbreviation"] = team_name_df["team_abbreviation"].apply(
+        lambda x: [abbreviation.strip() for abbreviation in x.split(",")]
+    )
+
+    return team_name_df
+
+
+# takes in a full team name with the season year, returns the abbreviation
+def full_to_abbreviation(
+    full_name: str, year: int, config: ScrapeConfig = None
+) -> str:
+    # get abbreviations for all teams
+    team_abbreviations = get_team_abbreviations(config)
+    # strip team name and lower case for comparison
+    full_name = full_name.strip().lower()
+
+    for full_name_compare in team_abbreviations["team_name"]:
+        if full_name == full_name_compare.strip().lower():
+            row_index = team_abbreviations.index[
+                team_abbreviations["team_name"] == full_name_compare
+            ][0]
+
+            charlotte_hornets = "charlotte hornets"
+            if full_name_compare.strip().lower() == charlotte_hornets:
+                if 1989 <= year <= 2001:
+                    # CHH
+                    return team_abbreviations.loc[row_index, "team_abbreviation"][0]
+                else:
+                    # CHO
+                    return team_abbreviations.loc[row_index, "team_abbreviation"][1]
+            else:
+                # default abbreviation if not charlotte
+                return team_abbreviations.loc[row_index, "team_abbreviation"][0]
+    # return original name if no match
+    return full_name
+
+
+# persisted "who played in season X" index built from the letter pages; each letter keeps its players plus one integer bitset per season (bit i set = the letter's i-th player was active), so a query is a few integer ORs per letter instead of re-parsing 26 html pages
+@dataclass
+class PlayerSeasonIndex:
+    version: int = PLAYER_SEASON_INDEX_VERSION
+    # letter -> sha1 of the letter page the letter's entries were built from
+    letter_hashes: dict = field(default_factory=dict)
+    # letter -> list of player dictionaries (see letter_page_players)
+    letter_players: dict = field(default_factory=dict)
+    # letter -> {season start year : bitset of active players}
+    letter_season_bits: dict = field(default_factory=dict)
+    # letter -> bio values normalize_player_bios could not convert (see normalize_player_bios)
+    letter_bio_errors: dict = field(default_factory=dict)
+    # set when a letter was rebuilt and the index needs to be saved
+    changed: bool = False
+
+    # re-parses a letter page, but only when its contents differ from the last build
+    def refresh_letter(self, letter: str, page_contents: bytes) -> bool:
+        page_hash = hashlib.sha1(page_contents).hexdigest()
+        if self.letter_hashes.get(letter) == page_hash:
+            return False
+
+        letter_players = letter_page_players(
+            page_contents.decode("utf-8"), rf"letter page {letter}"
+        )
+        # heights and weights are converted here, once per page build, so nothing downstream parses them again
+        bio_errors = normalize_player_bios(letter_players)
+        season_bits = {}
+        for player_number, player in enumerate(letter_players):
+            for season_year in range(player["year_min"], player["year_max"] + 1):
+                season_bits[season_year] = season_bits.get(season_year, 0) | (1 << player_number)
+
+        self.letter_hashes[letter] = page_hash
+        self.letter_players[letter] = letter_players
+        self.letter_season_bits[letter] = season_bits
+        self.letter_bio_errors[letter] = bio_errors
+        self.changed = True
+        return True
+
+    # players of the given letters active in any season of the range (start year convention, end year inclusive)
+    def active_players(self, start_year: int, end_year: int, letters: list = None) -> list:
+        if letters is None:
+            letters = sorted(self.letter_players)
+
+        active_players = []
+        for letter in letters:
+            season_bits = self.letter_season_bits.get(letter, {})
+            active_bits = 0
+            for season_year in range(start_year, end_year + 1):
+                active_bits |= season_bits.get(season_year, 0)
+
+            letter_players = self.letter_players[letter]
+            # walk the set bits from the lowest up, which keeps the page order
+            while active_bits:
+                lowest_bit = active_bits & -active_bits
+                active_players.append(letter_players[lowest_bit.bit_length() - 1])
+                active_bits ^= lowest_bit
+
+        return active_players
+
+
+# location of the persisted player season index
+def player_season_index_file(config: ScrapeConfig) -> Path:
+    return config.player_lists_directory / "player_season_index.pkl"
+
+
+# loads the persisted player season index, or an empty one when it has not been built yet
+def load_player_season_index(config: ScrapeConfig = None) -> PlayerSeasonIndex:
+    config = config or load_config()
+    index_file = player_season_index_file(config)
+    if not os.path.isfile(index_file):
+        return PlayerSeasonIndex()
+
+    try:
+        with open(index_file, "rb") as file:
+            player_index = pickle.load(file)
+    except Exception as e:
+        # an unreadable index is simply rebuilt from the letter pages
+        basic_error_handling(e)
+        return PlayerSeasonIndex()
+
+    # the stored player records changed shape; rebuild every letter
+    if getattr(player_index, "version", None) != PLAYER_SEASON_INDEX_VERSION:
+        return PlayerSeasonIndex()
+
+    return player_index
+
+
+# writes the player season index if any letter was rebuilt
+def save_player_season_index(player_index: PlayerSeasonIndex, config: ScrapeConfig = None):
+    config = config or load_config()
+    if not player_index.changed:
+        return
+
+    player_index.changed = False
+    with open(prepare_file_path(player_season_index_file(config)), "wb") as file:
+        pickle.dump(player_index, file)
+
+
+# consolidated player game file of a season and its index; the index records the byte range and row count of each player's block of rows, so one player can be read without scanning the file
+def player_season_games_files(season_year: int, config: ScrapeConfig) -> tuple:
+    return (
+        config.season_games_directory / rf"{season_year}_player_games.csv",
+        config.season_games_directory / rf"{season_year}_player_games_index.json",
+    )
+
+
+# index of a consolidated season file: {"columns": [...], "players": {player id : [first byte, end byte, rows]}}
+def load_player_games_index(index_file: Path) -> dict:
+    if not index_file.is_file():
+        return {"columns": [], "players": {}}
+    with open(index_file, "r", encoding="utf-8") as file:
+        return json.load(file)
+
+
+# index of a consolidated season file rebuilt from the file itself, for a file whose index is missing: the header gives the columns and each run of rows with the same Player_id is a block; a file whose player rows are not in one block each cannot be indexed and raises ValueError
+def rebuild_player_games_index(games_file: Path) -> dict:
+    games_index = {"columns": [], "players": {}}
+    with open(games_file, "rb") as file:
+        header_line = file.readline()
+        games_index["columns"] = next(csv.reader([header_line.decode("utf-8")]))
+        player_id_position = games_index["columns"].index("Player_id")
+
+        position = len(header_line)
+        for row_line in file:
+            row_start = position
+            position += len(row_line)
+            if not row_line.strip():
+                continue
+
+            player_id = next(csv.reader([row_line.decode("utf-8")]))[player_id_position]
+            player_block = games_index["players"].get(player_id)
+            if player_block is None:
+                player_block = games_index["players"][player_id] = [row_start, row_start, 0]
+            elif player_block[1] != row_start:
+                raise ValueError(
+                    rf"The rows of {player_id} in {games_file.name} are not in one block, so the file cannot be indexed; delete it and scrape the season again"
+                )
+            player_block[1] = position
+            player_block[2] += 1
+
+    print(rf"Index of {games_file.name} rebuilt from the file")
+    return games_index
+
+
+# index of a consolidated season file, rebuilt from the file when the index file is missing
+def season_games_index(games_file: Path, index_file: Path) -> dict:
+    if games_file.is_file() and games_file.stat().st_size and not index_file.is_file():
+        return rebuild_player_games_index(games_file)
+    return load_player_games_index(index_file)
+
+
+# removes the blocks of some players from a consolidated season file (players that are being scraped again) and shifts the byte ranges of the players after them
+def remove_player_blocks(games_file: Path, games_index: dict, player_ids: set):
+    with open(games_file, "rb") as file:
+        file_contents = file.read()
+
+    kept_blocks = []
+    # the header line comes before the first player block
+    header_end = min(block[0] for block in games_index["players"].values())
+    new_contents = [file_contents[:header_end]]
+    position = header_end
+    for player_id, (block_start, block_end, row_count) in sorted(
+        games_index["players"].items(), key=lambda item: item[1][0]
+    ):
+        if player_id in player_ids:
+            continue
+        new_contents.append(file_contents[block_start:block_end])
+        kept_blocks.append((player_id, [position, position + block_end - block_start, row_count]))
+        position += block_end - block_start
+
+    with open(games_file, "wb") as file:
+        file.write(b"".join(new_contents))
+    games_index["players"] = dict(kept_blocks)
+
+
+# appends one season of player games to the season's consolidated file, one contiguous block of rows per player, and records each block in the index; players already in the file are replaced
+def append_player_season_games(
+    season_year: int, season_games_df: pd.DataFrame, config: ScrapeConfig = None
+):
+    config = config or load_config()
+    games_file, index_file = player_season_games_files(season_year, config)
+    # a data file without its index is indexed again from its rows, so its players are replaced rather than appended twice
+    games_index = season_games_index(games_file, index_file)
+
+    # a missing or empty data file makes any old index meaningless
+    if not games_file.is_file() or games_file.stat().st_size == 0:
+        games_index = {"columns": [], "players": {}}
+
+    season_columns = [str(column) for column in season_games_df.columns]
+    if games_index["columns"] and games_index["columns"] != season_columns:
+        raise ValueError(
+            f"Columns of the {season_year} player games do not match {games_file.name}: {season_columns} != {games_index['columns']}"
+        )
+
+    replaced_players = set(games_index["players"]) & set(season_games_df["Player_id"])
+    if replaced_players:
+        remove_player_blocks(games_file, games_index, replaced_players)
+
+    with open(prepare_file_path(games_file), "ab") as file:
+        if file.tell() == 0:
+            file.write(season_games_df.head(0).to_csv(index=False, lineterminator="\n").encode("utf-8"))
+            games_index["columns"] = season_columns
+
+        for player_id, player_games_df in season_games_df.groupby("Player_id", sort=False):
+            block_start = file.tell()
+            file.write(
+                player_games_df.to_csv(index=False, header=False, lineterminator="\n").encode("utf-8")
+            )
+            games_index["players"][player_id] = [block_start, file.tell(), len(player_games_df)]
+
+    with open(index_file, "w", encoding="utf-8") as file:
+        json.dump(games_index, file)
+
+
+# splits scraped player games by season and appends each season to its consolidated file
+def save_player_season_games(player_games_dfs: list, config: ScrapeConfig = None):
+    config = config or load_config()
+    if not player_games_dfs:
+        return
+
+    all_player_games_df = pd.concat(player_games_dfs, ignore_index=True)
+    for season_year, season_games_df in all_player_games_df.groupby("Season", sort=True):
+        append_player_season_games(int(season_year), season_games_df, config)
+        print(
+            rf"Game log data for {season_games_df["Player_id"].nunique()} player(s) saved to {season_year}_player_games.csv"
+        )
+
+
+# reads the player games of a season from its consolidated file in one sequential read, or only the blocks of the given players using the byte ranges in the index
+def read_player_season_games(
+    season_year: int, config: ScrapeConfig = None, player_ids: list = None
+) -> pd.DataFrame:
+    config = config or load_config()
+    games_file, index_file = player_season_games_files(season_year, config)
+    if not games_file.is_file():
+        return None
+
+    if player_ids is None:
+        return pd.read_csv(games_file)
+
+    games_index = season_games_index(games_file, index_file)
+    header_line = ",".join(games_index["columns"]).encode("utf-8")
+    player_blocks = [header_line, b"\n"]
+    with open(games_file, "rb") as file:
+        for player_id in player_ids:
+            if player_id not in games_index["players"]:
+                continue
+            block_start, block_end, _ = games_index["players"][player_id]
+            file.seek(block_start)
+            player_blocks.append(file.read(block_end - block_start))
+
+    return pd.read_csv(BytesIO(b"".join(player_blocks)))
+
+
+# location of one season's compiled game data
+def compiled_season_file(season_year: int, config: ScrapeConfig) -> Path:
+    return config.pickled_data_directory / rf"{season_year}_season_game_data.pkl"
+
+
+# location of the manifest listing the compiled seasons
+def compiled_seasons_manifest_file(config: ScrapeConfig) -> Path:
+    return config.pickled_data_directory / "compiled_seasons.json"
+
+
+# {"seasons": {season: {"file", "games", "chunks", "chunk", "peak_rss_mib" (or "process_peak_rss_mib", see compile_seasons), "compiled_at"}}} for every season compiled so far
+def load_compiled_seasons_manifest(config: ScrapeConfig = None) -> dict:
+    config = config or load_config()
+    manifest_file = compiled_seasons_manifest_file(config)
+    if not manifest_file.is_file():
+        return {"seasons": {}}
+
+    with open(manifest_file, "r") as file:
+        return json.load(file)
+
+
+# chunks of one compiled season as they were written by compile_seasons, one at a time
+def iterate_compiled_season_chunks(season_year: int, config: ScrapeConfig = None):
+    config = config or load_config()
+    with open(compiled_season_file(season_year, config), "rb") as file:
+        while True:
+            try:
+                yield pickle.load(file)
+            except EOFError:
+                return
+
+
+# compiled game data of one season in a single DataFrame
+def read_compiled_season(season_year: int, config: ScrapeConfig = None) -> pd.DataFrame:
+    return pd.concat(iterate_compiled_season_chunks(season_year, config), ignore_index=True)
+
+
+# one compiled season as yielded by iterate_compiled_seasons
+CompiledSeason = namedtuple("CompiledSeason", ["Season_year", "Season_game_data"])
+
+
+# CompiledSeason of every compiled season (only season_years when given), one season in memory at a time; falls back to All_seasons_game_data_df.pkl from before the per-season files
+def iterate_compiled_seasons(season_years: list = None, config: ScrapeConfig = None):
+    config = config or load_config()
+    manifest = load_compiled_seasons_manifest(config)
+
+    legacy_file = config.pickled_data_directory / "All_seasons_game_data_df.pkl"
+    if not manifest["seasons"] and legacy_file.is_file():
+        for season_data in pd.read_pickle(legacy_file).itertuples():
+            if season_years is None or season_data.Season_year in season_years:
+                yield CompiledSeason(season_data.Season_year, season_data.Season_game_data)
+        return
+
+    for season_year in manifest["seasons"]:
+        if season_years is None or int(season_year) in season_years:
+            yield CompiledSeason(int(season_year), read_compiled_season(int(season_year), config))
+
+
+# compiled seasons as one DataFrame of the nested form described in pickled_players_in_games_to_csv (every requested season in memory at once; iterate_compiled_seasons keeps one)
+def read_compiled_seasons(season_years: list = None, config: ScrapeConfig = None) -> pd.DataFrame:
+    return pd.DataFrame(
+        [
+            {"Season_year": season_year, "Season_game_data": season_game_data_df}
+            for season_year, season_game_data_df in iterate_compiled_seasons(season_years, config)
+        ],
+        columns=["Season_year", "Season_game_data"],
+    )
+
+
+# take the pickled seasons specifically from collect_players_in_game and convert to a csv to for easy readability; season_years limits the export to those seasons
+def pickled_players_in_games_to_csv(
+    season_years: list = None, config: ScrapeConfig = None
+):
+    config = config or load_config()
+
+    # the compiled seasons are read one at a time; each has data of the nested form:
+    # pickled_data Headers: ["Season_year", "Season_game_data"]
+    #       Season_year: int, Season_game_data: pd.DataFrame
+    # Season_game_data Headers: ["Game_date", "Home_team_stats", "Away_team_stats"]
+    #       Game_date: str = DD/MM/YY, Home_team_stats: pd.Series, Away_team_stats: pd.Series
+    # Home/Away _team_stats Headers/labels: ["Team", "Score", "Team_win", "Players_game_stats", "Team_totals"]
+    #       Team: str, Score: int, Team_win: bool, Players_game_stats: pd.DataFrame, Team_totals: pd.Series (see build_team_game_totals)
+    # Players_game_stats Headers: *Same Headers as those found in {season_year}_{player_info[0]}.csv, for get_player_season_stats
+
+    # iterate through season years
+    for season_data in iterate_compiled_seasons(season_years, config):
+        with open(
+            config.pickled_data_directory
+            / rf"{season_data.Season_year}_season_compiled.csv",
+            "w",
+            newline="",
+        ) as file:
+
+            # lots of perceivably "extra" brackets[] in the following region. To future self: I assure you, they are not extra. Keep them if you want the csv to format properly.
+
+            # iterate over the games in a given season
+            for game_data in season_data.Season_game_data.itertuples():
+
+                # error testing
+                # print(
+                #    season_data.Season_game_data
+                #    .loc[game_data.Index, "Home_team_stats"]
+                #   .loc["Players_game_stats"]
+                #    .columns
+                # )
+
+                # start writing into the csv file
+                writer = csv.writer(file)
+
+                # write in the season_year
+                writer.writerow(
+                    [season_data._fields[season_data._fields.index("Season_year")]]
+                )
+                writer.writerow([season_data.Season_year])
+
+                # blank line
+                writer.writerow([])
+
+                # write in game date
+                writer.writerow(
+                    [game_data._fields[game_data._fields.index("Game_date")]]
+                )
+                writer.writerow([game_data.Game_date])
+
+                # blank line
+                writer.writerow([])
+
+                # .get_loc gives the integer location for a label/index, while .loc[] allows you to directly access the data at that point
+
+                # home team stats
+
+                # team name
+                writer.writerow(
+                    [
+                        list(game_data.Home_team_stats.index)[
+                            game_data.Home_team_stats.index.get_loc("Team")
+                        ]
+                    ]
+                )
+                writer.writerow([game_data.Home_team_stats.Team])
+
+                # team score
+                writer.writerow(
+                    [
+                        list(game_data.Home_team_stats.index)[
+                            game_data.Home_team_stats.index.get_loc("Score")
+                        ]
+                    ]
+                )
+                writer.writerow([game_data.Home_team_stats.Score])
+
+                # team_win
+                writer.writerow(
+                    [
+                        list(game_data.Home_team_stats.index)[
+                            game_data.Home_team_stats.index.get_loc("Team_win")
+                        ]
+                    ]
+                )
+                writer.writerow([game_data.Home_team_stats.Team_win])
+
+                # take note that upon serialization and deserialization (pickling), nested structures (DataFrames) can lose their original type fidelity when accessed via itertuples().
+
+                # print(type(game_data.Home_team_stats.Players_game_stats))
+                # print(game_data.Home_team_stats.Players_game_stats)
+
+                # team player stats
+
+                # write the headers
+                writer.writerows(
+                    [
+                        season_data.Season_game_data
+                        .loc[game_data.Index, "Home_team_stats"]
+                        .loc["Players_game_stats"]
+                        .columns
+                    ]
+                )
+
+                # write the table data (.values returns an array of the table data)
+                writer.writerows(
+                    season_data.Season_game_data
+                    .loc[game_data.Index, "Home_team_stats"]
+                    .loc["Players_game_stats"]
+                    .values
+                )
+
+                # blank line
+                writer.writerow([])
+
+                # away team stats
+
+                # team name
+                writer.writerow(
+                    [
+                        list(game_data.Away_team_stats.index)[
+                            game_data.Away_team_stats.index.get_loc("Team")
+                        ]
+                    ]
+                )
+                writer.writerow([game_data.Away_team_stats.Team])
+
+                # team score
+                writer.writerow(
+                    [
+                        list(game_data.Away_team_stats.index)[
+                            game_data.Away_team_stats.index.get_loc("Score")
+                        ]
+                    ]
+                )
+                writer.writerow([game_data.Away_team_stats.Score])
+
+                # team_win
+                writer.writerow(
+                    [
+                        list(game_data.Away_team_stats.index)[
+                            game_data.Away_team_stats.index.get_loc("Team_win")
+                        ]
+                    ]
+                )
+                writer.writerow([game_data.Away_team_stats.Team_win])
+
+                # team player stats
+
+                # write the headers
+                writer.writerows(
+                    [
+                        season_data.Season_game_data
+                        .loc[game_data.Index, "Away_team_stats"]
+                        .loc["Players_game_stats"]
+                        .columns
+                    ]
+                )
+
+                # write the table data (.values returns an array of the table data)
+                writer.writerows(
+                    season_data.Season_game_data
+                    .loc[game_data.Index, "Away_team_stats"]
+                    .loc["Players_game_stats"]
+                    .values
+                )
+
+                # blank line
+                writer.writerow([])
+
+                # error check
+                if (
+                    season_data.Season_game_data
+                    .loc[game_data.Index, "Away_team_stats"]
+                    .loc["Players_game_stats"]
+                    .empty
+                ):
+
+                    print("TEAM DATA MISSING!!")
+
+
+# home/away team stats from the pickled game data as plain python objects for JSON output; games not played yet have no score and no winner (null)
+def team_stats_to_dictionary(team_stats: pd.Series) -> dict:
+    game_played = not pd.isna(team_stats["Score"])
+    return {
+        "Team": team_stats["Team"],
+        "Score": int(team_stats["Score"]) if game_played else None,
+        "Team_win": bool(team_stats["Team_win"]) if game_played else None,
+        # round trip through pandas JSON so that NaN becomes null
+        "Players_game_stats": json.loads(
+            team_stats["Players_game_stats"].to_json(orient="records")
+        ),
+        # data compiled before the team totals existed does not have them
+        "Team_totals": json.loads(
+            team_stats.get("Team_totals", pd.Series(dtype="float64")).to_json()
+        ),
+    }
+
+
+# take the pickled seasons specifically from collect_players_in_game and write one JSON file per season, keeping the home/away nesting
+def pickled_players_in_games_to_json(
+    season_years: list = None, config: ScrapeConfig = None
+):
+    config = config or load_config()
+
+    # one season in memory at a time
+    for season_data in iterate_compiled_seasons(season_years, config):
+        season_games = [
+            {
+                "Game_id": getattr(game_data, "Game_id", None),
+                "Game_date": game_data.Game_date,
+                "Home_team_stats": team_stats_to_dictionary(game_data.Home_team_stats),
+                "Away_team_stats": team_stats_to_dictionary(game_data.Away_team_stats),
+            }
+            for game_data in season_data.Season_game_data.itertuples()
+        ]
+
+        with open(
+            config.pickled_data_directory
+            / rf"{season_data.Season_year}_season_compiled.json",
+            "w",
+        ) as file:
+            json.dump(
+                {"Season_year": int(season_data.Season_year), "Games": season_games},
+                file,
+            )
+
+        print(rf"Season data saved to {season_data.Season_year}_season_compiled.json")
@@ -0,0 +1,522 @@
+import json
+import os
+import pickle
+import random
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+import pandas as pd
+
+# local library
+import profiling
+from config import ScrapeConfig, load_config, prepare_file_path
+from scraping_functions.store import (
+    compiled_season_file,
+    compiled_seasons_manifest_file,
+    load_compiled_seasons_manifest,
+    read_player_season_games,
+)
+
+# transform: the scraped tables turned into the data sets built from them; player labels, team totals per game and the compiled game data of each season, plus splitting work between shards and worker processes
+
+# player line columns summed into the team totals of each game
+TEAM_GAME_TOTAL_COLUMNS = [
+    "Minutes Played",
+    "Field Goals",
+    "Field Goal Attempts",
+    "3-Point Field Goals",
+    "3-Point Field Goal Attempts",
+    "Free Throws",
+    "Free Throw Attempts",
+    "Offensive Rebounds",
+    "Defensive Rebounds",
+    "Total Rebounds",
+    "Assists",
+    "Steals",
+    "Blocks",
+    "Turnovers",
+    "Personal Fouls",
+    "Points",
+]
+
+
+# team percentage column -> (made, attempted) totals it is computed from
+TEAM_GAME_PERCENTAGE_COLUMNS = {
+    "Field Goal Percentage": ("Field Goals", "Field Goal Attempts"),
+    "3-Point Field Goal Percentage": ("3-Point Field Goals", "3-Point Field Goal Attempts"),
+    "Free Throw Percentage": ("Free Throws", "Free Throw Attempts"),
+}
+
+
+# decides which items belong to a shard; crc32 is used instead of hash() so every machine makes the same split; key picks the part of an item that identifies it (the whole item by default)
+def shard_items(
+    items: list, shard_index: int = 0, shard_count: int = 1, key=None
+) -> list:
+    return list(iterate_shard_items(items, shard_index, shard_count, key))
+
+
+# lazy version of shard_items; works on generators and yields each item of the shard as soon as it arrives
+def iterate_shard_items(items, shard_index: int = 0, shard_count: int = 1, key=None):
+    if shard_count <= 1:
+        yield from items
+        return
+    if not 0 <= shard_index < shard_count:
+        raise ValueError(
+            f"shard_index must be between 0 and {shard_count - 1}, got {shard_index}"
+        )
+
+    for item in items:
+        if zlib.crc32(str(key(item) if key else item).encode("utf-8")) % shard_count == shard_index:
+            yield item
+
+
+# runs function once per chunk of work, in separate processes when more than one worker is requested; each call gets its own chunk as the first argument; chunk_per_item makes every item its own chunk, handed to whichever process is free next (better when items take very different times)
+# process_per_chunk starts a new process for every chunk (even with one worker) instead of reusing the workers, so what a process measures about itself (peak memory) belongs to its one chunk
+def run_in_workers(
+    function,
+    work_items: list,
+    worker_count: int = 1,
+    chunk_per_item: bool = False,
+    process_per_chunk: bool = False,
+    **kwargs,
+) -> list:
+    if not work_items:
+        return []
+    if worker_count <= 1 and not process_per_chunk:
+        return [function(work_items, **kwargs)]
+
+    if chunk_per_item:
+        work_chunks = [[work_item] for work_item in work_items]
+    else:
+        # round-robin split keeps the chunks close to the same size
+        work_chunks = [work_items[i::worker_count] for i in range(min(max(worker_count, 1), len(work_items)))]
+    worker_count = min(max(worker_count, 1), len(work_chunks))
+
+    with ProcessPoolExecutor(
+        max_workers=worker_count, max_tasks_per_child=1 if process_per_chunk else None
+    ) as executor:
+        futures = [
+            executor.submit(function, work_chunk, **kwargs)
+            for work_chunk in work_chunks
+        ]
+        return [future.result() for future in futures]
+
+
+# assigns all players a unique integer label for later model training; takes in a list of player dictionaries and returns a modified dictionary with the int label
+def player_label(player_name_url_list: list, config: ScrapeConfig = None) -> list:
+    config = config or load_config()
+
+    # range to pull random numbers from; ~4800 NBA players ever; want to avoid simply assigning ascending numbers according to players in alphabetical order
+    start_int_range: int = 1
+    range_scale: int = 20
+    end_int_range: int = range_scale * len(player_name_url_list)
+
+    # create list of random integer pulling from the population within the range; no repeats
+    random_numbers = random.sample(
+        range(start_int_range, end_int_range + 1), len(player_name_url_list)
+    )
+
+    # assigns random int within the specified range to each player
+    for i, player_data in enumerate(player_name_url_list):
+        if player_data.get("player_label"):
+            print(rf"Player already has a player_label")
+            continue
+
+        player_name_url_list[i]["player_label"] = random_numbers[i]
+
+    # write to text file
+    with open(
+        prepare_file_path(config.player_labels_directory / "labeled_players.json"),
+        "w",
+    ) as file:
+        json.dump(player_name_url_list, file)
+
+    # pickle data
+    with open(
+        prepare_file_path(config.player_labels_directory / "labeled_players.pkl"),
+        "wb",
+    ) as file:
+        pickle.dump(player_name_url_list, file)
+
+    return player_name_url_list
+
+
+# flat table of every player game in a season along with the columns used to match it to the schedule; the box scores (keyed by game id) are used when they have been scraped, otherwise the consolidated player game logs, matched on date and team
+def load_season_player_games(season_year: int, config: ScrapeConfig) -> tuple:
+    box_score_file = config.season_games_directory / rf"{season_year}_box_scores.csv"
+    if box_score_file.is_file():
+        return pd.read_csv(box_score_file), ["Game_id", "Team"]
+
+    # every player's games of the season are in one consolidated file
+    season_player_games_df = read_player_season_games(season_year, config)
+    if season_player_games_df is None or season_player_games_df.empty:
+        return pd.DataFrame(columns=["Date", "Team"]), ["Date", "Team"]
+
+    season_player_games_df["Team"] = season_player_games_df["Team"].str.strip()
+    return season_player_games_df, ["Date", "Team"]
+
+
+# one row per team per played game of the season with the team's summed player lines (box scores when saved, otherwise the game logs) next to its schedule score, saved to {year}_team_games.csv beside the schedule; Points_difference is the schedule score minus the summed player points, so games with players missing from the saved lines have Points_match False; player_games takes the result of load_season_player_games when it is already loaded
+def build_team_game_totals(
+    season_year: int, config: ScrapeConfig = None, player_games: tuple = None
+) -> pd.DataFrame:
+    config = config or load_config()
+    schedule_df = pd.read_csv(
+        config.season_games_directory / rf"{season_year}_season_games.csv"
+    ).dropna(subset=["Away_points", "Home_points"])
+
+    player_games_df, match_columns = player_games or load_season_player_games(season_year, config)
+    # box scores also list the players who did not play
+    played_df = player_games_df[
+        player_games_df.get("Minutes Played", pd.Series(dtype="float64")) > 0
+    ]
+    # a season without player lines (or lines without some stat) still gets one row per team-game, with empty totals
+    played_df = played_df.assign(
+        **{column: float("nan") for column in TEAM_GAME_TOTAL_COLUMNS if column not in played_df.columns}
+    )
+    team_game_groups = played_df.groupby(match_columns)
+    team_totals_df = team_game_groups[TEAM_GAME_TOTAL_COLUMNS].sum(min_count=1)
+    team_totals_df["Players"] = team_game_groups.size()
+
+    team_games_df = pd.concat(
+        [
+            pd.DataFrame(
+                {
+                    "Game_id": schedule_df.get("Game_id"),
+                    "Date": schedule_df["Date"],
+                    "Team": schedule_df[team_column].str.strip(),
+                    "Opponent": schedule_df[opponent_column].str.strip(),
+                    "Game_location": team_column,
+                    "Score": schedule_df[rf"{team_column}_points"].astype("float64"),
+                }
+            )
+            for team_column, opponent_column in (("Home", "Away"), ("Away", "Home"))
+        ]
+    ).sort_index(kind="stable", ignore_index=True)
+    team_games_df = team_games_df.merge(team_totals_df.reset_index(), on=match_columns, how="left")
+    team_games_df["Players"] = team_games_df["Players"].fillna(0).astype("int64")
+
+    for percentage_column, (made_column, attempted_column) in TEAM_GAME_PERCENTAGE_COLUMNS.items():
+        attempts = team_games_df[attempted_column]
+        team_games_df[percentage_column] = (
+            team_games_df[made_column] / attempts.where(attempts > 0)
+        ).round(3)
+
+    team_games_df["Points_difference"] = team_games_df["Score"] - team_games_df["Points"].fillna(0)
+    team_games_df["Points_match"] = team_games_df["Points_difference"] == 0
+
+    team_games_file = config.season_games_directory / rf"{season_year}_team_games.csv"
+    team_games_df.to_csv(prepare_file_path(team_games_file), index=False)
+
+    mismatched_games = int((~team_games_df["Points_match"]).sum())
+    if mismatched_games:
+        print(
+            rf"{mismatched_games} of {len(team_games_df)} team games of {season_year} have player points that do not add up to the schedule score (players missing); see Points_match in {team_games_file}"
+        )
+
+    return team_games_df
+
+
+# compiled game data of one season, one chunk at a time: each chunk has one row per schedule game with the home and away team stats (layout in pickled_players_in_games_to_csv); chunk is "season" (one chunk) or "month" (one chunk per calendar month, so only a month of nested player frames exists at once); assumes you already have all necessary player data saved for access; yields nothing when the season has no schedule
+def iterate_season_game_chunks(schedule_year: int, config: ScrapeConfig = None, chunk: str = "season"):
+    config = config or load_config()
+    all_game_headers = ["Game_id", "Game_date", "Home_team_stats", "Away_team_stats"]
+
+    # *** capitalized "Index" matters for accessing it as a label in a named tuple created from .itertuples() method
+
+    # open season schedule
+    schedule_path = config.season_games_directory / rf"{schedule_year}_season_games.csv"
+    if not schedule_path.is_file():
+        print(rf"No schedule saved for {schedule_year}; run full_games_schedule first")
+        return
+    season_game_schedule_df = pd.read_csv(schedule_path)
+
+    # the flat player lines and team totals of the whole season are small; only the nested frames built from them are chunked
+    season_player_games_df, match_columns = load_season_player_games(
+        schedule_year, config
+    )
+    # summed player lines of each team-game, saved next to the schedule and attached to the game data
+    team_games_df = build_team_game_totals(
+        schedule_year, config, (season_player_games_df, match_columns)
+    )
+    totals_by_team_game = {
+        team_game_key: team_game_row
+        for team_game_key, team_game_row in zip(
+            zip(*(team_games_df[column] for column in match_columns)),
+            team_games_df[["Players", *TEAM_GAME_TOTAL_COLUMNS, *TEAM_GAME_PERCENTAGE_COLUMNS]].to_dict("records"),
+        )
+    }
+    game_key_column = "Game_id" if match_columns[0] == "Game_id" else "Date"
+
+    match chunk:
+        case "season":
+            schedule_chunks = [season_game_schedule_df]
+        case "month":
+            # "mm/dd/yy" -> mm; the schedule is in date order, so each month is one run of rows
+            schedule_months = season_game_schedule_df["Date"].str[:2]
+            month_starts = schedule_months.ne(schedule_months.shift()).cumsum()
+            schedule_chunks = [
+                month_schedule_df for _, month_schedule_df in season_game_schedule_df.groupby(month_starts)
+            ]
+        case _:
+            raise ValueError(f"Unknown compile chunk {chunk!r}; expected 'season' or 'month'")
+
+    for schedule_chunk_df in schedule_chunks:
+        chunk_player_games_df = season_player_games_df[
+            season_player_games_df[game_key_column].isin(schedule_chunk_df[game_key_column])
+        ]
+        # the player lines of each team-game, looked up by (game id or date, team) instead of comparing every player row with every game
+        players_by_team_game = {
+            team_game_key: team_game_df.reset_index(drop=True)
+            for team_game_key, team_game_df in chunk_player_games_df.groupby(
+                match_columns
+            )
+        }
+
+        game_rows = []
+        for game_from_schedule in schedule_chunk_df.itertuples():
+            game_key = getattr(game_from_schedule, game_key_column, None)
+            home_team = game_from_schedule.Home.strip()
+            away_team = game_from_schedule.Away.strip()
+
+            # collect team stats
+            home_team_aggregate_series = pd.Series(
+                {
+                    "Team": game_from_schedule.Home,
+                    "Score": game_from_schedule.Home_points,
+                    "Team_win": game_from_schedule.Home_points
+                    > game_from_schedule.Away_points,
+                    "Players_game_stats": players_by_team_game.get(
+                        (game_key, home_team), pd.DataFrame()
+                    ),
+                    "Team_totals": pd.Series(
+                        totals_by_team_game.get((game_key, home_team), {}), dtype="float64"
+                    ),
+                }
+            )
+            away_team_aggregate_series = pd.Series(
+                {
+                    "Team": game_from_schedule.Away,
+                    "Score": game_from_schedule.Away_points,
+                    "Team_win": game_from_schedule.Away_points
+                    > game_from_schedule.Home_points,
+                    "Players_game_stats": players_by_team_game.get(
+                        (game_key, away_team), pd.DataFrame()
+                    ),
+                    "Team_totals": pd.Series(
+                        totals_by_team_game.get((game_key, away_team), {}), dtype="float64"
+                    ),
+                }
+            )
+
+            # add game data
+            game_rows.append(
+                {
+                    "Game_id": getattr(game_from_schedule, "Game_id", None),
+                    "Game_date": game_from_schedule.Date,
+                    "Home_team_stats": home_team_aggregate_series,
+                    "Away_team_stats": away_team_aggregate_series,
+                }
+            )
+
+        yield pd.DataFrame(game_rows, columns=all_game_headers)
+
+
+# compiled game data of one season in a single DataFrame; None when the season has no schedule
+def compile_season_games(schedule_year: int, config: ScrapeConfig = None) -> pd.DataFrame:
+    season_chunks = list(iterate_season_game_chunks(schedule_year, config))
+    return season_chunks[0] if season_chunks else None
+
+
+# compiles each season of the list and pickles it to its own file; used as the per-process work function; returns the manifest entries of the seasons compiled
+# each chunk is spilled to the season file as its own pickle as soon as it is built, so only one chunk is held in memory; the file is written under a temporary name and renamed at the end, so a failed compile leaves the previous file in place
+# the peak resident memory of the process is recorded as the season's own peak (peak_rss_mib) only with season_peaks, when the caller compiles every season in a new process; otherwise it is the peak of the process so far (process_peak_rss_mib), which includes every season compiled before it
+def compile_seasons(
+    season_list: list, config: ScrapeConfig = None, chunk: str = "season", season_peaks: bool = False
+) -> dict:
+    config = config or load_config()
+    manifest_entries = {}
+    for season_year in season_list:
+        season_file = compiled_season_file(season_year, config)
+        partial_file = prepare_file_path(season_file.with_suffix(".partial"))
+
+        game_count = 0
+        chunk_count = 0
+        with open(partial_file, "wb") as file:
+            for season_chunk_df in iterate_season_game_chunks(season_year, config, chunk):
+                # pickle data for easy access later, specifically to help maintain data types and structure
+                pickle.dump(season_chunk_df, file, protocol=pickle.HIGHEST_PROTOCOL)
+                game_count += len(season_chunk_df)
+                chunk_count += 1
+                del season_chunk_df
+
+        if not chunk_count:
+            os.remove(partial_file)
+            continue
+
+        os.replace(partial_file, season_file)
+        manifest_entries[str(season_year)] = {
+            "file": season_file.name,
+            "games": game_count,
+            "chunks": chunk_count,
+            "chunk": chunk,
+            "peak_rss_mib" if season_peaks else "process_peak_rss_mib": profiling.peak_rss_mib(),
+            "compiled_at": datetime.now().isoformat(timespec="seconds"),
+        }
+        print(rf"Season {season_year} compiled")
+
+    return manifest_entries
+
+
+# estimated peak memory (MiB) of one compile worker per chunk mode; replaced by the peaks recorded in the manifest once seasons have been compiled with that mode in workers of their own
+COMPILE_WORKER_MEMORY_ESTIMATES = {"season": 1024, "month": 384}
+
+
+# estimated peak memory (MiB) of a worker compiling the season with the chunk mode: the season's own recorded peak with that mode, otherwise the largest recorded peak of any season with it, otherwise the fixed estimate
+def compile_worker_estimate(season_year: int, chunk: str, manifest: dict) -> float:
+    recorded_peaks = {
+        season_key: season_entry["peak_rss_mib"]
+        for season_key, season_entry in manifest["seasons"].items()
+        if season_entry.get("chunk") == chunk and season_entry.get("peak_rss_mib")
+    }
+    if str(season_year) in recorded_peaks:
+        return recorded_peaks[str(season_year)]
+    return max(recorded_peaks.values(), default=COMPILE_WORKER_MEMORY_ESTIMATES[chunk])
+
+
+# chunk mode of every season of the list within the memory budget: a season whose worker would need more than what this process leaves of the budget when compiled at once is compiled a month at a time instead
+def season_chunks_within_budget(
+    season_list: list, memory_budget_mib: float, chunk: str, manifest: dict
+) -> dict:
+    available_memory = memory_budget_mib - (profiling.peak_rss_mib() or 0)
+    season_chunks = {}
+    for season_year in season_list:
+        season_chunks[season_year] = chunk
+        season_estimate = compile_worker_estimate(season_year, chunk, manifest)
+        if chunk == "season" and season_estimate > available_memory:
+            print(
+                rf"Season {season_year} needs about {season_estimate:.0f} MiB compiled at once, more than the {available_memory:.0f} MiB left of the budget; compiling it a month at a time"
+            )
+            season_chunks[season_year] = "month"
+    return season_chunks
+
+
+# number of compile workers that fit in the memory budget, given what this process already uses and the largest estimated worker peak of the seasons to compile (season -> chunk mode)
+def workers_within_budget(
+    worker_count: int, memory_budget_mib: float, season_chunks: dict, manifest: dict
+) -> int:
+    if not season_chunks:
+        return worker_count
+    worker_estimate = max(
+        compile_worker_estimate(season_year, season_chunk, manifest)
+        for season_year, season_chunk in season_chunks.items()
+    )
+    available_memory = memory_budget_mib - (profiling.peak_rss_mib() or 0)
+
+    budget_workers = int(available_memory // worker_estimate)
+    if budget_workers < 1:
+        print(
+            rf"A compile worker needs about {worker_estimate:.0f} MiB, more than the {available_memory:.0f} MiB left of the budget even a month at a time; compiling one season at a time"
+        )
+    return max(1, min(worker_count, budget_workers))
+
+
+# the budget is planned from estimates, so the peak each season's worker recorded is checked against its share of the budget afterwards: seasons that went over it compiled at once are compiled again a month at a time, and the ones still over it a month at a time are reported; returns the manifest entries of the seasons compiled again
+def compile_seasons_over_budget(
+    worker_results: list, memory_budget_mib: float, workers: int, config: ScrapeConfig
+) -> list:
+    worker_allowance = (memory_budget_mib - (profiling.peak_rss_mib() or 0)) / workers
+    season_entries = {}
+    for manifest_entries in worker_results:
+        season_entries.update(manifest_entries)
+
+    over_budget_seasons = [
+        int(season_key)
+        for season_key, season_entry in season_entries.items()
+        if season_entry["chunk"] == "season" and season_entry["peak_rss_mib"] > worker_allowance
+    ]
+    month_results = []
+    if over_budget_seasons:
+        print(
+            rf"Season(s) {over_budget_seasons} went over the {worker_allowance:.0f} MiB each worker has of the budget compiled at once; compiling them again a month at a time"
+        )
+        month_results = run_in_workers(
+            compile_seasons,
+            over_budget_seasons,
+            workers,
+            chunk_per_item=True,
+            process_per_chunk=True,
+            config=config,
+            chunk="month",
+            season_peaks=True,
+        )
+        for manifest_entries in month_results:
+            season_entries.update(manifest_entries)
+
+    for season_key, season_entry in season_entries.items():
+        if season_entry["chunk"] == "month" and season_entry["peak_rss_mib"] > worker_allowance:
+            print(
+                rf"Season {season_key} peaked at {season_entry['peak_rss_mib']:.0f} MiB even a month at a time, over the {worker_allowance:.0f} MiB each worker has of the budget"
+            )
+
+    return month_results
+
+
+# compiles every season of the range, each in its own worker process when workers > 1 or a memory budget is given, and records them in the manifest; seasons not in the range keep their files and manifest entries, so a single season can be compiled again on its own
+# chunk="month" spills every month of a season to disk as soon as it is built; memory_budget_mib (MiB) plans from the recorded (or estimated) peaks which seasons are compiled a month at a time and how many workers run at once, then compiles the seasons whose worker went over its share again a month at a time (see compile_seasons_over_budget); in_process compiles every season in this process (for profiling), so only the planned chunk modes apply; the peak resident memory of this process and of the largest worker is reported at the end
+def collect_players_in_game(
+    year_range: range,
+    config: ScrapeConfig = None,
+    workers: int = 1,
+    chunk: str = "season",
+    memory_budget_mib: float = None,
+    in_process: bool = False,
+) -> dict:
+    config = config or load_config()
+    manifest = load_compiled_seasons_manifest(config)
+
+    season_chunks = {season_year: chunk for season_year in year_range}
+    if memory_budget_mib:
+        season_chunks = season_chunks_within_budget(list(year_range), memory_budget_mib, chunk, manifest)
+        workers = workers_within_budget(workers, memory_budget_mib, season_chunks, manifest)
+
+    # with several workers, or a budget to keep to, every season gets a new process, so the peak each one records is its own
+    process_per_season = not in_process and (workers > 1 or bool(memory_budget_mib))
+    worker_results = []
+    for season_chunk in ("season", "month"):
+        worker_results.extend(
+            run_in_workers(
+                compile_seasons,
+                [season_year for season_year, chunk_mode in season_chunks.items() if chunk_mode == season_chunk],
+                workers,
+                chunk_per_item=True,
+                process_per_chunk=process_per_season,
+                config=config,
+                chunk=season_chunk,
+                season_peaks=process_per_season,
+            )
+        )
+
+    if memory_budget_mib and process_per_season:
+        worker_results.extend(
+            compile_seasons_over_budget(worker_results, memory_budget_mib, workers, config)
+        )
+
+    # only this process writes the manifest
+    for manifest_entries in worker_results:
+        manifest["seasons"].update(manifest_entries)
+    manifest["seasons"] = dict(sorted(manifest["seasons"].items()))
+    with open(prepare_file_path(compiled_seasons_manifest_file(config)), "w") as file:
+        json.dump(manifest, file, indent=1)
+
+    main_peak = profiling.peak_rss_mib()
+    worker_peak = profiling.peak_rss_mib(children=True) if process_per_season else None
+    if main_peak is not None:
+        print(
+            rf"Compile peak memory: {main_peak:.0f} MiB"
+            + (rf", largest worker {worker_peak:.0f} MiB" if worker_peak is not None else "")
+            + (rf" (budget {memory_budget_mib:.0f} MiB)" if memory_budget_mib else "")
+        )
+
+    return manifest
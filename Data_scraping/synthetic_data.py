@@ -0,0 +1,917 @@
+import argparse
+import csv
+import hashlib
+import json
+import random
+import string
+import time
+import tracemalloc
+from datetime import date, timedelta
+from pathlib import Path
+
+import pandas as pd
+
+# local library
+import schemas
+import scraping_functions as scrape
+from config import ScrapeConfig, load_config, prepare_file_path
+
+# generates basketball-reference shaped HTML and CSV data at a configurable scale so the parsing, storage and compile steps can be load-tested offline
+
+
+# visible header text of the table columns on basketball-reference pages; the scraper reads cells by their data-stat, so the text only makes the synthetic pages look like the real ones
+HEADER_TEXT = {
+    "ranker": "Rk",
+    "game_season": "G",
+    "date_game": "Date",
+    "age": "Age",
+    "team_id": "Tm",
+    "opp_id": "Opp",
+    "gs": "GS",
+    "mp": "MP",
+    "fg": "FG",
+    "fga": "FGA",
+    "fg_pct": "FG%",
+    "fg3": "3P",
+    "fg3a": "3PA",
+    "fg3_pct": "3P%",
+    "ft": "FT",
+    "fta": "FTA",
+    "ft_pct": "FT%",
+    "orb": "ORB",
+    "drb": "DRB",
+    "trb": "TRB",
+    "ast": "AST",
+    "stl": "STL",
+    "blk": "BLK",
+    "tov": "TOV",
+    "pf": "PF",
+    "pts": "PTS",
+    "game_score": "GmSc",
+    "plus_minus": "+/-",
+    "visitor_team_name": "Visitor/Neutral",
+    "visitor_pts": "PTS",
+    "home_team_name": "Home/Neutral",
+    "home_pts": "PTS",
+    "attendance": "Attend.",
+    "game_duration": "LOG",
+    "arena_name": "Arena",
+    "game_remarks": "Notes",
+    "player": "Player",
+    "year_min": "From",
+    "year_max": "To",
+    "pos": "Pos",
+    "height": "Ht",
+    "weight": "Wt",
+    "birth_date": "Birth Date",
+    "colleges": "Colleges",
+}
+
+# data-tip shown when hovering a header; the counting stats use their saved column names, which are the site's data-tips
+HEADER_TIPS = {
+    **schemas.STAT_COLUMN_NAMES,
+    "ranker": "Rank",
+    "game_season": "Season Game",
+    "age": "Player's age on February 1 of the season",
+    "team_id": "Team",
+    "opp_id": "Opponent",
+    "gs": "Games Started",
+    "visitor_pts": "Points",
+    "attendance": "Attendance",
+    "game_duration": "Length of Game",
+    "year_min": "First year",
+    "year_max": "Last year",
+    "pos": "Position",
+    "height": "Height",
+    "weight": "Weight",
+}
+
+
+# columns of a registered table as the synthetic pages lay them out, as (data-stat, visible header, data-tip): the schema's columns in order without omitted_stats, with page-only columns (which the schema must ignore) before and after them
+def page_table_columns(
+    table_type: str,
+    leading_stats: tuple = (),
+    trailing_stats: tuple = (),
+    omitted_stats: tuple = (),
+    header_text: dict = None,
+) -> list:
+    schema = schemas.TABLE_SCHEMAS[table_type]
+    unknown_stats = sorted({*leading_stats, *trailing_stats} - schema.ignored_columns)
+    if unknown_stats:
+        raise ValueError(rf"{unknown_stats} are not ignored columns of the {table_type!r} schema")
+
+    header_text = {**HEADER_TEXT, **(header_text or {})}
+    data_stats = [
+        *leading_stats,
+        *(data_stat for data_stat in schema.columns if data_stat not in omitted_stats),
+        *trailing_stats,
+    ]
+    return [
+        (data_stat, header_text.get(data_stat, ""), HEADER_TIPS.get(data_stat))
+        for data_stat in data_stats
+    ]
+
+
+# the "pgl_basic" game log table; there is no plus/minus before the 1996-97 season, so the synthetic seasons never have one
+GAME_LOG_TABLE_COLUMNS = page_table_columns(
+    "pgl_basic", leading_stats=("ranker", "game_season"), omitted_stats=("plus_minus",)
+)
+
+# the "schedule" table, with the columns full_games_schedule drops at the end
+SCHEDULE_TABLE_COLUMNS = page_table_columns(
+    "schedule", trailing_stats=("box_score_text", "overtimes", "game_duration", "game_remarks")
+)
+
+# the "players" table found on each letter index page
+PLAYER_INDEX_TABLE_COLUMNS = page_table_columns("players")
+
+# each team's "box-{TEAM}-game-basic" table on a box score page; the player column is headed "Starters"
+BOX_SCORE_TABLE_COLUMNS = page_table_columns(
+    "box_score", omitted_stats=("plus_minus",), header_text={"player": "Starters"}
+)
+
+# columns of the {season}_player_games.csv files saved from get_player_season_stats: the player columns, the player details and the game log columns
+PLAYER_CSV_HEADERS = [
+    "Season",
+    "Player",
+    "Player_id",
+    *scrape.PLAYER_METRIC_COLUMNS.values(),
+    *schemas.TABLE_SCHEMAS["pgl_basic"].column_names,
+]
+
+# columns written to {year}_season_games.csv by full_games_schedule: the schedule columns, the box score link and the game id taken from it
+SCHEDULE_CSV_HEADERS = [*schemas.TABLE_SCHEMAS["schedule"].column_names, "Box_score_url", "Game_id"]
+
+# months of a season in schedule order, with the month number used for dates
+SEASON_MONTHS = [
+    ("october", 10),
+    ("november", 11),
+    ("december", 12),
+    ("january", 1),
+    ("february", 2),
+    ("march", 3),
+    ("april", 4),
+]
+
+# a handful of name parts and colleges to make players look plausible
+FIRST_NAMES = [
+    "Alvan", "Bill", "Chris", "Darrell", "Earl", "Frank", "Greg", "Henry",
+    "Isaiah", "James", "Kevin", "Larry", "Moses", "Norm", "Otis", "Paul",
+    "Quinn", "Robert", "Sam", "Tom", "Walt", "Xavier", "Yogi", "Zach",
+]
+POSITIONS = ["G", "F", "C", "G-F", "F-C", "F-G", "C-F"]
+
+# counting stats of a generated player game line, as basketball-reference data-stat names
+STAT_KEYS = ("fg", "fga", "fg3", "fg3a", "ft", "fta", "orb", "drb", "trb", "ast", "stl", "blk", "tov", "pf", "pts", "game_score")
+COLLEGES = ["Duke", "UCLA", "Kentucky", "Kansas", "Indiana", "Oklahoma", "Syracuse", ""]
+
+
+# read the current franchises out of nba_team_names.txt; returns a list of (team name, abbreviation)
+def load_synthetic_teams(team_count: int) -> list:
+    teams = []
+    with open(load_config().team_names_file, "r") as file:
+        for line in file:
+            row = line.strip().split("\t")
+            # only franchises that still exist, so every season has a full league
+            if len(row) == 4 and "present" in row[3]:
+                abbreviation = row[1].strip().upper().split(",")[-1].strip()
+                teams.append((row[2].strip(), abbreviation))
+
+    return teams[:team_count]
+
+
+# percentages are shown like ".467" and "1.000" on basketball-reference; empty when there were no attempts
+def format_percentage(made: int, attempted: int) -> str:
+    if attempted == 0:
+        return ""
+    percentage = f"{made / attempted:.3f}"
+    return percentage[1:] if percentage.startswith("0") else percentage
+
+
+# writes a header row for a basketball-reference style table
+def table_head_html(columns: list) -> str:
+    header_cells = []
+    for data_stat, label, data_tip in columns:
+        tip = f' data-tip="{data_tip}"' if data_tip else ""
+        # blank headers hold a non-breaking space, which the header parsing strips before falling back to the data-stat
+        header_cells.append(
+            f'<th aria-label="{label}" class="poptip center" data-stat="{data_stat}"{tip} scope="col">{label or "&nbsp;"}</th>'
+        )
+    return f"<thead>\n<tr>\n{''.join(header_cells)}\n</tr>\n</thead>"
+
+
+# wraps the table in the minimal page structure the scraping functions look for
+def page_html(title: str, body: str) -> str:
+    return (
+        "<!DOCTYPE html>\n<html lang=\"en\">\n<head>\n<meta charset=\"utf-8\">\n"
+        f"<title>{title} | Basketball-Reference.com</title>\n</head>\n<body>\n"
+        f"<div id=\"wrap\">\n<div id=\"content\">\n<h1>{title}</h1>\n{body}\n</div>\n</div>\n</body>\n</html>\n"
+    )
+
+
+# creates the synthetic players; career years use the same "From"/"To" (season end year) convention as the letter index pages
+def make_synthetic_players(
+    rng: random.Random, players_per_letter: int, start_year: int, end_year: int
+) -> list:
+    players = []
+    for letter in string.ascii_lowercase:
+        for number in range(players_per_letter):
+            last_name = f"{letter.upper()}{''.join(rng.choices(string.ascii_lowercase, k=rng.randint(4, 8)))}"
+            first_name = rng.choice(FIRST_NAMES)
+            slug = f"{last_name[:5].lower()}{first_name[:2].lower()}{number:02d}"
+
+            # careers may start before the requested range, like real players
+            year_min = rng.randint(start_year - 10, end_year + 1)
+            year_max = min(year_min + rng.randint(0, 15), end_year + 1)
+            birth_date = date(year_min - rng.randint(19, 23), rng.randint(1, 12), rng.randint(1, 28))
+
+            players.append(
+                {
+                    "player": f"{first_name} {last_name}",
+                    "slug": slug,
+                    "player_url": f"/players/{letter}/{slug}.html",
+                    "year_min": year_min,
+                    "year_max": year_max,
+                    "pos": rng.choice(POSITIONS),
+                    "height": f"{rng.randint(5, 7)}-{rng.randint(0, 11)}",
+                    "weight": str(rng.randint(160, 290)),
+                    "birth_date": birth_date,
+                    "colleges": rng.choice(COLLEGES),
+                    # season -> [team abbreviation, games, points]
+                    "seasons": {},
+                }
+            )
+    return players
+
+
+# saves a synthetic page where the scraper saves the page of page_url, with the validators refresh_cached_page keeps for a downloaded page (no ETag / Last-Modified, so a check against the site compares the sha1)
+def save_synthetic_page(file_path: Path, page_url: str, page_contents: str):
+    page_bytes = page_contents.encode("utf-8")
+    with open(prepare_file_path(file_path), "wb") as file:
+        file.write(page_bytes)
+    with open(scrape.page_validators_file(file_path), "w", encoding="utf-8") as file:
+        json.dump(
+            {
+                "url": rf"{scrape.BASELINE_URL}{page_url}",
+                "etag": None,
+                "last_modified": None,
+                "sha1": hashlib.sha1(page_bytes).hexdigest(),
+            },
+            file,
+        )
+
+
+# one letter index page ("players" table) per letter
+def write_letter_pages(players: list, config: ScrapeConfig):
+
+    for letter in string.ascii_lowercase:
+        rows = []
+        for player in players:
+            if not player["slug"].startswith(letter):
+                continue
+            height_feet, height_inches = player["height"].split("-")
+            # data-stat -> cell, laid out in the table's column order
+            cells = {
+                "player": f'<th class="left" data-append-csv="{player["slug"]}" data-stat="player" scope="row"><a href="{player["player_url"]}">{player["player"]}</a></th>',
+                "year_min": f'<td class="right" data-stat="year_min">{player["year_min"]}</td>',
+                "year_max": f'<td class="right" data-stat="year_max">{player["year_max"]}</td>',
+                "pos": f'<td class="center" data-stat="pos">{player["pos"]}</td>',
+                "height": f'<td class="right" csk="{int(height_feet) * 12 + int(height_inches)}.0" data-stat="height">{player["height"]}</td>',
+                "weight": f'<td class="right" data-stat="weight">{player["weight"]}</td>',
+                "birth_date": f'<td class="left" csk="{player["birth_date"]:%Y%m%d}" data-stat="birth_date"><a href="/friv/birthdays.cgi?month={player["birth_date"].month}&amp;day={player["birth_date"].day}">{player["birth_date"]:%B} {player["birth_date"].day}, {player["birth_date"].year}</a></td>',
+                "colleges": f'<td class="left" data-stat="colleges">{player["colleges"]}</td>',
+            }
+            rows.append(
+                "<tr>" + "".join(cells[data_stat] for data_stat, _, _ in PLAYER_INDEX_TABLE_COLUMNS) + "</tr>"
+            )
+
+        table = (
+            f'<table class="sortable stats_table" id="players" data-cols-to-freeze=",1">\n'
+            f"{table_head_html(PLAYER_INDEX_TABLE_COLUMNS)}\n<tbody>\n"
+            + "\n".join(rows)
+            + "\n</tbody>\n</table>"
+        )
+        save_synthetic_page(
+            config.letter_pages_directory / rf"letter_{letter}_players.html",
+            rf"/players/{letter}/",
+            page_html(f"Players whose last name starts with {letter.upper()}", table),
+        )
+
+
+# builds the games for a season; each day a random subset of teams is paired so that every team plays close to games_per_team games
+def make_season_games(
+    rng: random.Random, season_year: int, teams: list, games_per_team: int
+) -> list:
+    season_start = date(season_year, 10, 10)
+    season_end = date(season_year + 1, 4, 15)
+    season_days = (season_end - season_start).days + 1
+
+    # number of teams playing on a given day (always even)
+    teams_per_day = max(2, round(len(teams) * games_per_team / season_days) // 2 * 2)
+
+    games = []
+    for day_offset in range(season_days):
+        game_day = season_start + timedelta(days=day_offset)
+        playing_teams = rng.sample(teams, min(teams_per_day, len(teams) // 2 * 2))
+        for i in range(0, len(playing_teams), 2):
+            away_team, home_team = playing_teams[i], playing_teams[i + 1]
+            games.append(
+                {
+                    "date": game_day,
+                    "game_id": f"{game_day:%Y%m%d}0{home_team[1]}",
+                    "away": away_team,
+                    "home": home_team,
+                    # filled in from the player lines
+                    "away_points": 0,
+                    "home_points": 0,
+                    "attendance": rng.randint(5000, 20000),
+                    "arena": f"{home_team[0].split()[-1]} Arena",
+                }
+            )
+    return games
+
+
+# generates a single box score line for a player; the counting stats are internally consistent (points, rebounds, game score)
+def make_player_game_line(rng: random.Random, minutes: int) -> dict:
+    fga = rng.randint(0, max(1, minutes // 2))
+    fg = rng.randint(0, fga)
+    fg3a = rng.randint(0, fga // 3)
+    fg3 = rng.randint(0, min(fg, fg3a))
+    fta = rng.randint(0, max(0, minutes // 5))
+    ft = rng.randint(0, fta)
+    orb = rng.randint(0, 4)
+    drb = rng.randint(0, 9)
+    ast = rng.randint(0, 10)
+    stl = rng.randint(0, 3)
+    blk = rng.randint(0, 3)
+    tov = rng.randint(0, 5)
+    pf = rng.randint(0, 6)
+    pts = 2 * (fg - fg3) + 3 * fg3 + ft
+    game_score = (
+        pts + 0.4 * fg - 0.7 * fga - 0.4 * (fta - ft) + 0.7 * orb + 0.3 * drb
+        + stl + 0.7 * ast + 0.7 * blk - 0.4 * pf - tov
+    )
+    return {
+        "mp": minutes, "fg": fg, "fga": fga, "fg3": fg3, "fg3a": fg3a, "ft": ft, "fta": fta,
+        "orb": orb, "drb": drb, "trb": orb + drb, "ast": ast, "stl": stl, "blk": blk,
+        "tov": tov, "pf": pf, "pts": pts, "game_score": round(game_score, 1),
+    }
+
+
+# assigns the active players of a season to teams and plays out every game; returns player slug -> list of game lines
+def play_season(
+    rng: random.Random, season_year: int, games: list, teams: list, players: list
+) -> dict:
+    # rosters for the season; players active in the season (start year convention) are spread across the teams
+    rosters = {team[1]: [] for team in teams}
+    for player in players:
+        if player["year_min"] - 1 <= season_year <= player["year_max"] - 1:
+            rosters[rng.choice(teams)[1]].append(player)
+
+    player_game_lines = {}
+    for game in games:
+        for side, opponent_side in (("home", "away"), ("away", "home")):
+            team_name, team_abbreviation = game[side]
+            roster = rosters[team_abbreviation]
+            team_points = 0
+            # up to ten players see the floor; the first five start
+            for roster_position, player in enumerate(roster[:10]):
+                line = make_player_game_line(rng, rng.randint(5, 40))
+                line["gs"] = 1 if roster_position < 5 else 0
+                line["player"] = player
+                line["game"] = game
+                line["team"] = team_abbreviation
+                line["opponent"] = game[opponent_side][1]
+                line["game_location"] = "" if side == "home" else "@"
+                team_points += line["pts"]
+                player_game_lines.setdefault(player["slug"], []).append(line)
+
+            # teams without a synthetic roster still need a believable score
+            game[f"{side}_points"] = team_points if roster else rng.randint(85, 125)
+
+    return player_game_lines
+
+
+# writes the season schedule page (with the month filter), the month pages and the {year}_season_games.csv file
+def write_schedule(games: list, season_year: int, config: ScrapeConfig):
+
+    month_links = "".join(
+        f'<div class=""><a href="/leagues/NBA_{season_year + 1}_games-{month_name}.html">{month_name.title()}</a></div>'
+        for month_name, _ in SEASON_MONTHS
+    )
+    filter_html = f'<div class="filter">{month_links}</div>'
+
+    for month_name, month_number in SEASON_MONTHS:
+        rows = []
+        for game in games:
+            if game["date"].month != month_number:
+                continue
+            away_name, away_abbreviation = game["away"]
+            home_name, home_abbreviation = game["home"]
+            # data-stat -> cell, laid out in the table's column order
+            cells = {
+                "date_game": f'<th class="left" csk="{game["game_id"]}" data-stat="date_game" scope="row"><a href="/boxscores/index.fcgi?month={game["date"].month}&amp;day={game["date"].day}&amp;year={game["date"].year}">{game["date"]:%a, %b} {game["date"].day}, {game["date"].year}</a></th>',
+                "visitor_team_name": f'<td class="left" csk="{away_abbreviation}.{game["game_id"]}" data-stat="visitor_team_name"><a href="/teams/{away_abbreviation}/{season_year + 1}.html">{away_name}</a></td>',
+                "visitor_pts": f'<td class="right" data-stat="visitor_pts">{game["away_points"]}</td>',
+                "home_team_name": f'<td class="left" csk="{home_abbreviation}.{game["game_id"]}" data-stat="home_team_name"><a href="/teams/{home_abbreviation}/{season_year + 1}.html">{home_name}</a></td>',
+                "home_pts": f'<td class="right" data-stat="home_pts">{game["home_points"]}</td>',
+                "box_score_text": f'<td class="center" data-stat="box_score_text"><a href="/boxscores/{game["game_id"]}.html">Box Score</a></td>',
+                "overtimes": '<td class="center iz" data-stat="overtimes"></td>',
+                "attendance": f'<td class="right" data-stat="attendance">{game["attendance"]:,}</td>',
+                "game_duration": '<td class="right" data-stat="game_duration"></td>',
+                "arena_name": f'<td class="left" data-stat="arena_name">{game["arena"]}</td>',
+                "game_remarks": '<td class="left iz" data-stat="game_remarks"></td>',
+            }
+            rows.append(
+                "<tr>" + "".join(cells[data_stat] for data_stat, _, _ in SCHEDULE_TABLE_COLUMNS) + "</tr>"
+            )
+
+        table = (
+            f'<table class="suppress_glossary sortable stats_table" id="schedule">\n'
+            f"{table_head_html(SCHEDULE_TABLE_COLUMNS)}\n<tbody>\n"
+            + "\n".join(rows)
+            + "\n</tbody>\n</table>"
+        )
+        month_url = rf"/leagues/NBA_{season_year + 1}_games-{month_name}.html"
+        save_synthetic_page(
+            config.schedule_pages_directory / Path(month_url).name,
+            month_url,
+            page_html(f"{season_year}-{str(season_year + 1)[2:]} NBA Schedule", filter_html + table),
+        )
+
+    # the season page only needs the month filter; full_games_schedule follows the month links from there
+    save_synthetic_page(
+        config.schedule_pages_directory / rf"{season_year}_schedule.html",
+        rf"/leagues/NBA_{season_year + 1}_games.html",
+        page_html(f"{season_year}-{str(season_year + 1)[2:]} NBA Schedule", filter_html),
+    )
+
+    with open(
+        prepare_file_path(config.season_games_directory / rf"{season_year}_season_games.csv"),
+        "w",
+        newline="",
+        encoding="utf-8",
+    ) as file:
+        writer = csv.writer(file)
+        writer.writerow(SCHEDULE_CSV_HEADERS)
+        for game in games:
+            game_values = {
+                "Date": f"{game['date']:%m/%d/%y}",
+                "Away": game["away"][1],
+                "Away_points": game["away_points"],
+                "Home": game["home"][1],
+                "Home_points": game["home_points"],
+                "Attendance": f"{game['attendance']:,}",
+                "Arena": game["arena"],
+                "Box_score_url": f"/boxscores/{game['game_id']}.html",
+                "Game_id": game["game_id"],
+            }
+            writer.writerow([game_values[column_name] for column_name in SCHEDULE_CSV_HEADERS])
+
+
+# writes one box score page per game with a "box-{TEAM}-game-basic" table for each side; starters come first, then a "Reserves" header row and the bench
+def write_box_scores(player_game_lines: dict, config: ScrapeConfig):
+
+    # game id -> team -> player lines, in the order the players were generated (starters first)
+    lines_by_game = {}
+    for lines in player_game_lines.values():
+        for line in lines:
+            lines_by_game.setdefault(line["game"]["game_id"], {}).setdefault(line["team"], []).append(line)
+
+    for game_id, lines_by_team in lines_by_game.items():
+        tables = []
+        for team, lines in lines_by_team.items():
+            rows = []
+            for line_number, line in enumerate(sorted(lines, key=lambda line: -line["gs"])):
+                if line_number == 5:
+                    rows.append(
+                        '<tr class="thead"><th data-stat="player">Reserves</th>'
+                        + "".join(f"<th>{label}</th>" for _, label, _ in BOX_SCORE_TABLE_COLUMNS[1:])
+                        + "</tr>"
+                    )
+                cells = {
+                    **{key: line[key] for key in STAT_KEYS},
+                    "mp": f"{line['mp']}:00",
+                    "fg_pct": format_percentage(line["fg"], line["fga"]),
+                    "fg3_pct": format_percentage(line["fg3"], line["fg3a"]),
+                    "ft_pct": format_percentage(line["ft"], line["fta"]),
+                }
+                rows.append(
+                    f'<tr><th class="left" csk="{line["player"]["slug"]}" data-stat="player" scope="row"><a href="{line["player"]["player_url"]}">{line["player"]["player"]}</a></th>'
+                    + "".join(
+                        f'<td class="right" data-stat="{data_stat}">{cells[data_stat]}</td>'
+                        for data_stat, _, _ in BOX_SCORE_TABLE_COLUMNS[1:]
+                    )
+                    + "</tr>"
+                )
+            tables.append(
+                f'<table class="sortable stats_table" id="box-{team}-game-basic">\n'
+                f"{table_head_html(BOX_SCORE_TABLE_COLUMNS)}\n<tbody>\n"
+                + "\n".join(rows)
+                + "\n</tbody>\n</table>"
+            )
+
+        save_synthetic_page(
+            config.box_score_pages_directory / rf"{game_id}.html",
+            rf"/boxscores/{game_id}.html",
+            page_html(f"Box Score {game_id}", "\n".join(tables)),
+        )
+
+
+# formats the player's age on a given day the way the game logs do ("years-days")
+def age_on_date(birth_date: date, game_date: date) -> tuple:
+    years = game_date.year - birth_date.year
+    if (game_date.month, game_date.day) < (birth_date.month, birth_date.day):
+        years -= 1
+    last_birthday = birth_date.replace(year=birth_date.year + years)
+    return years, (game_date - last_birthday).days
+
+
+# writes the game log page ("pgl_basic" table) for each player of the season and the season's cleaned games to the consolidated {season}_player_games.csv (with its index) under output_config
+def write_player_game_logs(
+    player_game_lines: dict,
+    season_year: int,
+    output_config: ScrapeConfig,
+    write_html: bool,
+    write_csv: bool,
+):
+    # rows of every player of the season, in player order so each player's rows form one block
+    csv_rows = []
+    for slug, lines in player_game_lines.items():
+        player = lines[0]["player"]
+        player["seasons"][season_year] = [
+            lines[0]["team"],
+            len(lines),
+            sum(line["pts"] for line in lines),
+        ]
+        # metric height / weight, rounded the same way normalize_player_bios rounds them
+        height_feet, height_inches = (int(part) for part in player["height"].split("-"))
+        height_cm, weight_kg = pd.Series(
+            [
+                height_feet * scrape.CM_PER_FOOT + height_inches * scrape.CM_PER_INCH,
+                int(player["weight"]) * scrape.KG_PER_POUND,
+            ]
+        ).round(2)
+        # letter page data-stat -> player detail copied onto every game
+        player_details = {
+            "pos": player["pos"],
+            "height": player["height"],
+            "weight": player["weight"],
+            "birth_date": f"{player['birth_date']:%B} {player['birth_date'].day}, {player['birth_date'].year}",
+            "colleges": player["colleges"],
+            "height_cm": height_cm,
+            "weight_kg": weight_kg,
+        }
+
+        html_rows = []
+        for game_number, line in enumerate(lines, start=1):
+            game = line["game"]
+            own_points = game["home_points"] if line["game_location"] == "" else game["away_points"]
+            other_points = game["away_points"] if line["game_location"] == "" else game["home_points"]
+            margin = own_points - other_points
+            result = f"{'W' if margin > 0 else 'L'} ({margin:+d})"
+            age_years, age_days = age_on_date(player["birth_date"], game["date"])
+            percentages = {
+                "fg_pct": format_percentage(line["fg"], line["fga"]),
+                "fg3_pct": format_percentage(line["fg3"], line["fg3a"]),
+                "ft_pct": format_percentage(line["ft"], line["fta"]),
+            }
+
+            if write_html:
+                # basketball-reference repeats the header row inside the body every 20 games
+                if game_number % 20 == 0:
+                    html_rows.append(
+                        '<tr class="thead">'
+                        + "".join(
+                            f'<th data-stat="{data_stat}">{label}</th>'
+                            for data_stat, label, _ in GAME_LOG_TABLE_COLUMNS
+                        )
+                        + "</tr>"
+                    )
+                cells = {
+                    "game_season": game_number,
+                    "date_game": f'<a href="/boxscores/{game["game_id"]}.html">{game["date"]:%Y-%m-%d}</a>',
+                    "age": f"{age_years}-{age_days:03d}",
+                    "team_id": f'<a href="/teams/{line["team"]}/{season_year + 1}.html">{line["team"]}</a>',
+                    "game_location": line["game_location"],
+                    "opp_id": f'<a href="/teams/{line["opponent"]}/{season_year + 1}.html">{line["opponent"]}</a>',
+                    "game_result": result,
+                    "mp": f"{line['mp']}:00",
+                    **percentages,
+                    **{key: line[key] for key in ("gs", *STAT_KEYS)},
+                }
+                html_rows.append(
+                    f'<tr id="pgl_basic.{game_number}"><th class="right" data-stat="ranker" scope="row">{game_number}</th>'
+                    + "".join(
+                        f'<td data-stat="{data_stat}">{cells[data_stat]}</td>'
+                        for data_stat, _, _ in GAME_LOG_TABLE_COLUMNS[1:]
+                    )
+                    + "</tr>"
+                )
+
+            if write_csv:
+                # data-stat -> saved value, in the types parse_player_game_log gives them
+                game_values = {
+                    "date_game": f"{game['date']:%m/%d/%y}",
+                    "age": age_years + age_days / 365.0,
+                    "team_id": line["team"],
+                    "game_location": "Away" if line["game_location"] == "@" else "Home",
+                    "opp_id": line["opponent"],
+                    "game_result": float(margin),
+                    "gs": bool(line["gs"]),
+                    "mp": float(line["mp"]),
+                    **{
+                        data_stat: float(value) if value != "" else None
+                        for data_stat, value in {**percentages, **{key: line[key] for key in STAT_KEYS}}.items()
+                    },
+                    # no plus/minus before the 1996-97 season
+                    "plus_minus": None,
+                }
+                csv_rows.append(
+                    [
+                        season_year,
+                        player["player"],
+                        slug,
+                        *(player_details[data_stat] for data_stat in scrape.PLAYER_METRIC_COLUMNS),
+                        *(game_values[data_stat] for data_stat in schemas.TABLE_SCHEMAS["pgl_basic"].columns),
+                    ]
+                )
+
+        if write_html:
+            table = (
+                f'<table class="row_summable sortable stats_table" id="pgl_basic">\n'
+                f"{table_head_html(GAME_LOG_TABLE_COLUMNS)}\n<tbody>\n"
+                + "\n".join(html_rows)
+                + "\n</tbody>\n</table>"
+            )
+            save_synthetic_page(
+                scrape.player_gamelog_file(slug, season_year, output_config),
+                scrape.player_gamelog_url(player["player_url"], season_year),
+                page_html(f"{player['player']} {season_year}-{str(season_year + 1)[2:]} Game Log", table),
+            )
+
+    if write_csv and csv_rows:
+        scrape.append_player_season_games(
+            season_year, pd.DataFrame(csv_rows, columns=PLAYER_CSV_HEADERS), output_config
+        )
+
+
+# writes a career page for every player with a "per_game_stats" row (and game log link) for each season played
+def write_career_pages(players: list, config: ScrapeConfig):
+
+    for player in players:
+        rows = []
+        for season_year, (team, games, points) in sorted(player["seasons"].items()):
+            age_years, _ = age_on_date(player["birth_date"], date(season_year + 1, 2, 1))
+            rows.append(
+                f'<tr id="per_game_stats.{season_year + 1}"><th class="left" data-stat="year_id" scope="row"><a href="/players/{player["slug"][0]}/{player["slug"]}/gamelog/{season_year + 1}/">{season_year}-{str(season_year + 1)[2:]}</a></th>'
+                f'<td class="right" data-stat="age">{age_years}</td>'
+                f'<td class="left" data-stat="team_name_abbr"><a href="/teams/{team}/{season_year + 1}.html">{team}</a></td>'
+                f'<td class="left" data-stat="comp_name_abbr">NBA</td>'
+                f'<td class="center" data-stat="pos">{player["pos"]}</td>'
+                f'<td class="right" data-stat="games">{games}</td>'
+                f'<td class="right" data-stat="pts_per_g">{points / games:.1f}</td></tr>'
+            )
+
+        table = (
+            '<table class="stats_table sortable" id="per_game_stats">\n<thead> <tr> '
+            '<th aria-label="Season" class="poptip center" data-stat="year_id" scope="col">Season</th> '
+            '<th data-stat="age" data-tip="Player\'s age on February 1 of the season" scope="col">Age</th> '
+            '<th data-stat="team_name_abbr" scope="col">Team</th> <th data-stat="comp_name_abbr" scope="col">Lg</th> '
+            '<th data-stat="pos" data-tip="Position" scope="col">Pos</th> <th data-stat="games" data-tip="Games" scope="col">G</th> '
+            '<th data-stat="pts_per_g" data-tip="Points Per Game" scope="col">PTS</th> </tr> </thead>\n<tbody>\n'
+            + "\n".join(rows)
+            + "\n</tbody>\n</table>"
+        )
+        save_synthetic_page(
+            config.player_pages_directory / rf"{player['player']}_data.html",
+            player["player_url"],
+            page_html(player["player"], table),
+        )
+
+
+# the intermediate and compiled files are written with the scraper's own writers, so they need a config rooted at the output folder
+def synthetic_config(output_directory: str) -> ScrapeConfig:
+    output_root = Path(output_directory)
+    return ScrapeConfig(
+        raw_cache_root=output_root, intermediate_root=output_root, compiled_root=output_root
+    )
+
+
+# generates a full synthetic dataset under output_directory, with every page saved where the scraper saves it (with its validators) and every csv where the scraper writes it; seasons use the start year convention (1980 -> 1980-81)
+# with DATA_SCRAPING_ROOT pointed at it, the steps that read saved pages (players, box-scores without --refresh, compile and the steps after it) run offline; schedule and player-stats still check their pages against the site with conditional requests
+def generate_synthetic_dataset(
+    output_directory: str,
+    start_year: int,
+    end_year: int,
+    players_per_letter: int = 20,
+    team_count: int = 30,
+    games_per_team: int = 82,
+    write_html: bool = True,
+    write_csv: bool = True,
+    seed: int = 0,
+) -> dict:
+    rng = random.Random(seed)
+    output_config = synthetic_config(output_directory)
+    teams = load_synthetic_teams(team_count)
+    players = make_synthetic_players(rng, players_per_letter, start_year, end_year)
+
+    # counts of what was written, for throughput numbers
+    generated_counts = {"seasons": 0, "games": 0, "players": len(players), "player_seasons": 0, "player_games": 0}
+
+    if write_html:
+        write_letter_pages(players, output_config)
+
+    # one season at a time so that memory use does not grow with the number of seasons
+    for season_year in range(start_year, end_year + 1):
+        games = make_season_games(rng, season_year, teams, games_per_team)
+        player_game_lines = play_season(rng, season_year, games, teams, players)
+
+        write_schedule(games, season_year, output_config)
+        write_player_game_logs(
+            player_game_lines,
+            season_year,
+            output_config,
+            write_html,
+            write_csv,
+        )
+        if write_html:
+            write_box_scores(player_game_lines, output_config)
+
+        generated_counts["seasons"] += 1
+        generated_counts["games"] += len(games)
+        generated_counts["player_seasons"] += len(player_game_lines)
+        generated_counts["player_games"] += sum(len(lines) for lines in player_game_lines.values())
+        print(rf"Synthetic season {season_year} written ({len(games)} games)")
+
+    if write_html:
+        write_career_pages(players, output_config)
+
+    return generated_counts
+
+
+# runs a function while recording the elapsed time and the peak traced memory
+def measure_run(label: str, function, *args, **kwargs):
+    tracemalloc.start()
+    start_time = time.perf_counter()
+    result = function(*args, **kwargs)
+    elapsed_time = time.perf_counter() - start_time
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(rf"{label}: {elapsed_time:.2f} s, peak memory {peak_memory / 2**20:.1f} MiB")
+    return result, elapsed_time, peak_memory
+
+
+# parses every synthetic page with the parser the scraping functions use for it; returns the number of rows parsed and the parsed game logs (season -> list of player game DataFrames) for the store step
+def parse_synthetic_pages(output_directory: str) -> tuple:
+    from bs4 import BeautifulSoup
+
+    output_config = synthetic_config(output_directory)
+    rows_parsed = 0
+
+    # player id -> letter page record, for the constant columns of the game logs
+    letter_players = {}
+    for page_path in sorted(output_config.letter_pages_directory.glob("letter_*_players.html")):
+        with open(page_path, "r", encoding="utf-8") as file:
+            page_players = scrape.letter_page_players(file.read(), page_path.name)
+        scrape.normalize_player_bios(page_players)
+        letter_players.update((player["player_id"], player) for player in page_players)
+        rows_parsed += len(page_players)
+
+    for page_path in sorted(output_config.schedule_pages_directory.glob("NBA_*_games-*.html")):
+        with open(page_path, "r", encoding="utf-8") as file:
+            table = BeautifulSoup(file.read(), "html.parser").find("table", id="schedule")
+        if table is not None:
+            rows_parsed += len(scrape.table_to_dictionary(table) or [])
+
+    # game log pages are looked up the way get_player_season_stats saves them, from each player's career span
+    season_game_dfs = {}
+    for player_id, player_info in letter_players.items():
+        for season_year in range(player_info["year_min"], player_info["year_max"] + 1):
+            gamelog_file = scrape.player_gamelog_file(player_id, season_year, output_config)
+            if not gamelog_file.is_file():
+                continue
+            with open(gamelog_file, "r", encoding="utf-8") as file:
+                season_df = scrape.parse_player_game_log(
+                    file.read(),
+                    {
+                        "Season": season_year,
+                        "Player": player_info["player"],
+                        "Player_id": player_id,
+                        **scrape.player_metrics(player_info),
+                    },
+                    page_label=gamelog_file.name,
+                )
+            if season_df is not None:
+                season_game_dfs.setdefault(season_year, []).append(season_df)
+                rows_parsed += len(season_df)
+
+    for page_path in sorted(output_config.box_score_pages_directory.glob("*.html")):
+        with open(page_path, "r", encoding="utf-8") as file:
+            rows_parsed += len(scrape.parse_box_score(file.read(), page_path.stem))
+
+    return rows_parsed, season_game_dfs
+
+
+# saves the parsed game logs to the {season}_player_games.csv files the way get_player_season_stats does; returns the number of player games saved
+def store_synthetic_game_logs(season_game_dfs: dict, output_directory: str) -> int:
+    output_config = synthetic_config(output_directory)
+    player_games_saved = 0
+    for season_year in sorted(season_game_dfs):
+        scrape.save_player_season_games(season_game_dfs[season_year], output_config)
+        player_games_saved += sum(len(season_df) for season_df in season_game_dfs[season_year])
+    return player_games_saved
+
+
+# generates a dataset and runs it through the parse, store and compile steps, reporting the throughput and peak memory of each step
+def run_load_test(
+    output_directory: str,
+    start_year: int,
+    end_year: int,
+    players_per_letter: int,
+    team_count: int = 30,
+    games_per_team: int = 82,
+    seed: int = 0,
+):
+    # only the pages are generated; the game log CSVs are written by the store step
+    generated_counts, generate_time, _ = measure_run(
+        "generate",
+        generate_synthetic_dataset,
+        output_directory,
+        start_year,
+        end_year,
+        players_per_letter,
+        team_count,
+        games_per_team,
+        write_csv=False,
+        seed=seed,
+    )
+    print(generated_counts)
+    print(rf"generated {generated_counts['player_games'] / generate_time:,.0f} player games per second")
+
+    (rows_parsed, season_game_dfs), parse_time, _ = measure_run(
+        "parse", parse_synthetic_pages, output_directory
+    )
+    print(rf"parsed {rows_parsed:,} table rows ({rows_parsed / parse_time:,.0f} rows per second)")
+
+    player_games_saved, store_time, _ = measure_run(
+        "store", store_synthetic_game_logs, season_game_dfs, output_directory
+    )
+    print(rf"stored {player_games_saved:,} player games ({player_games_saved / store_time:,.0f} per second)")
+    del season_game_dfs
+
+    _, compile_time, _ = measure_run(
+        "compile",
+        scrape.collect_players_in_game,
+        range(start_year, end_year + 1),
+        synthetic_config(output_directory),
+    )
+    print(
+        rf"compiled {generated_counts['seasons']} season(s), {generated_counts['games']:,} games "
+        rf"({generated_counts['games'] / compile_time:,.0f} games per second)"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Generate basketball-reference shaped data for offline load testing."
+    )
+    parser.add_argument("output_directory")
+    parser.add_argument("--start-year", type=int, default=1980)
+    parser.add_argument("--end-year", type=int, default=1980)
+    parser.add_argument("--players-per-letter", type=int, default=20)
+    parser.add_argument("--teams", type=int, default=30)
+    parser.add_argument("--games-per-team", type=int, default=82)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-html", action="store_true", help="only write the CSV files")
+    parser.add_argument(
+        "--load-test",
+        action="store_true",
+        help="time generation, parsing, storing and compiling (always writes the pages)",
+    )
+    arguments = parser.parse_args()
+
+    if arguments.load_test:
+        run_load_test(
+            arguments.output_directory,
+            arguments.start_year,
+            arguments.end_year,
+            arguments.players_per_letter,
+            team_count=arguments.teams,
+            games_per_team=arguments.games_per_team,
+            seed=arguments.seed,
+        )
+    else:
+        print(
+            generate_synthetic_dataset(
+                arguments.output_directory,
+                arguments.start_year,
+                arguments.end_year,
+                players_per_letter=arguments.players_per_letter,
+                team_count=arguments.teams,
+                games_per_team=arguments.games_per_team,
+                write_html=not arguments.no_html,
+                seed=arguments.seed,
+            )
+        )
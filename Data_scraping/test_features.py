@@ -0,0 +1,74 @@
+import random
+from datetime import date, timedelta
+
+import pandas as pd
+import pytest
+
+# local library
+import features
+import scraping_functions as scrape
+from test_transform import temporary_config
+
+# tests of the pre-game form features; run with "python -m pytest" from this folder
+
+TEAMS = ["ATL", "BOS", "DAL", "LAL", "NYK", "PHI"]
+
+
+# a season of games on consecutive days from October 10, every team playing once a day: one (date, away, home, away points, home points) tuple per game
+def season_games(day_count: int) -> list:
+    rng = random.Random(1980)
+    games = []
+    for day_number in range(day_count):
+        game_day = date(1980, 10, 10) + timedelta(days=day_number)
+        day_teams = rng.sample(TEAMS, len(TEAMS))
+        for away_team, home_team in zip(day_teams[::2], day_teams[1::2]):
+            games.append((f"{game_day:%m/%d/%y}", away_team, home_team, rng.randint(80, 130), rng.randint(80, 130)))
+    return games
+
+
+# saves the games as the season's schedule and as one game log line per team and game (the team stands in for a player)
+def save_games(config, games: list):
+    schedule_df = pd.DataFrame(games, columns=["Date", "Away", "Home", "Away_points", "Home_points"])
+    config.season_games_directory.mkdir(parents=True, exist_ok=True)
+    schedule_df.to_csv(config.season_games_directory / "1980_season_games.csv", index=False)
+
+    player_rows = []
+    for game_date, away_team, home_team, away_points, home_points in games:
+        for team, points in ((away_team, away_points), (home_team, home_points)):
+            player_rows.append(
+                {
+                    "Season": 1980,
+                    "Player_id": rf"{team.lower()}01",
+                    "Team": team,
+                    "Date": game_date,
+                    **{stat: float(points % 17) for stat in features.PLAYER_FORM_STATS},
+                    "Points": float(points),
+                }
+            )
+    games_file, index_file = scrape.player_season_games_files(1980, config)
+    games_file.unlink(missing_ok=True)
+    index_file.unlink(missing_ok=True)
+    scrape.append_player_season_games(1980, pd.DataFrame(player_rows), config)
+
+
+# an incremental update (new games at the end, a game that arrived late for a day already saved, and a saved game that was removed) saves the same features as a rebuild from scratch, and only computes part of them
+@pytest.mark.parametrize("form_kind", list(features.FORM_KINDS))
+def test_incremental_form_features_match_rebuild(tmp_path, form_kind):
+    config = temporary_config(tmp_path)
+    all_games = season_games(30)
+    late_game = all_games[20]
+    removed_game = all_games[7]
+
+    save_games(config, [game for game in all_games[:40] if game != late_game])
+    features.update_form_features(1980, form_kind, config)
+    save_games(config, [game for game in all_games if game != removed_game])
+    computed_rows = features.update_form_features(1980, form_kind, config)
+    incremental_form_df = features.read_form_features(1980, form_kind, config)
+
+    rebuilt_rows = features.update_form_features(1980, form_kind, config, rebuild=True)
+
+    assert 0 < computed_rows < rebuilt_rows
+    pd.testing.assert_frame_equal(
+        incremental_form_df.reset_index(drop=True),
+        features.read_form_features(1980, form_kind, config).reset_index(drop=True),
+    )
@@ -0,0 +1,215 @@
+import os
+import types
+
+import pandas as pd
+import requests
+
+# local library
+import scraping_functions.fetch as fetch
+from synthetic_data import BOX_SCORE_TABLE_COLUMNS, page_html, table_head_html
+from test_transform import save_schedule, temporary_config
+
+# tests of the request helpers in scraping_functions.fetch; requests.get and time.sleep are replaced, so nothing is sent and nothing waits; run with "python -m pytest" from this folder
+
+
+# replaces requests.get with one answering the given (status code, headers) or (status code, headers, page) answers in turn (an exception instance is raised instead) and records the waits; returns the list of requested urls and the list of waits
+def fake_requests(monkeypatch, answers: list, request_headers: list = None) -> tuple:
+    requested_urls = []
+    waits = []
+
+    def fake_get(request_url, headers=None, timeout=None):
+        requested_urls.append(request_url)
+        if request_headers is not None:
+            request_headers.append(headers)
+        answer = answers[len(requested_urls) - 1]
+        if isinstance(answer, Exception):
+            raise answer
+        status_code, response_headers, page_contents = (*answer, "<html></html>")[:3]
+        return types.SimpleNamespace(
+            status_code=status_code,
+            ok=status_code < 400,
+            headers=response_headers,
+            text=page_contents,
+        )
+
+    monkeypatch.setattr(requests, "get", fake_get)
+    monkeypatch.setattr(fetch.time, "sleep", waits.append)
+    return requested_urls, waits
+
+
+# a page that does not exist is requested once, not retried
+def test_static_response_does_not_retry_client_errors(monkeypatch):
+    requested_urls, waits = fake_requests(monkeypatch, [(404, {}), (403, {})])
+
+    response = fetch.static_response("https://example.com/missing.html", request_delay=3.0)
+
+    assert response.status_code == 404
+    assert len(requested_urls) == 1
+    assert waits == [3.0]
+    # static_request has no page to return
+    assert fetch.static_request("https://example.com/forbidden.html") is None
+    assert len(requested_urls) == 2
+
+
+# 429 and server errors are retried, waiting as long as Retry-After asks
+def test_static_response_retries_rate_limits_and_server_errors(monkeypatch):
+    requested_urls, waits = fake_requests(
+        monkeypatch,
+        [(429, {"Retry-After": "60"}), requests.ConnectionError("reset"), (503, {}), (200, {})],
+    )
+
+    response = fetch.static_response("https://example.com/page.html", request_delay=3.0)
+
+    assert response.status_code == 200
+    assert len(requested_urls) == 4
+    assert waits[0] == 60.0
+    # exponential backoff for the attempts without Retry-After
+    assert 2 <= waits[1] < 3
+    assert 4 <= waits[2] < 5
+    assert waits[3] == 3.0
+
+
+# a page the site answers 404 for is recorded next to where it would be saved and not requested again until recheck_missing
+def test_refresh_cached_page_remembers_missing_pages(monkeypatch, tmp_path):
+    requested_urls, _ = fake_requests(monkeypatch, [(404, {}), (404, {})])
+    page_file = tmp_path / "gamelogs" / "beean01_1981.html"
+
+    assert not fetch.refresh_cached_page("https://example.com/gamelog/1982", page_file)
+    assert not fetch.refresh_cached_page("https://example.com/gamelog/1982", page_file)
+    assert len(requested_urls) == 1
+    assert fetch.load_page_validators(page_file)["status"] == 404
+    assert not page_file.exists()
+
+    assert not fetch.refresh_cached_page("https://example.com/gamelog/1982", page_file, recheck_missing=True)
+    assert len(requested_urls) == 2
+
+
+# a saved page is requested with its validators: a 304 leaves the page and its validators untouched, and so does a 200 with the same page and validators; a changed ETag with a changed page rewrites both
+def test_refresh_cached_page_validators(monkeypatch, tmp_path):
+    request_headers = []
+    requested_urls, _ = fake_requests(
+        monkeypatch,
+        [
+            (200, {"ETag": '"v1"'}, "<html>1</html>"),
+            (304, {}),
+            (200, {"ETag": '"v1"'}, "<html>1</html>"),
+            (200, {"ETag": '"v2"'}, "<html>2</html>"),
+        ],
+        request_headers,
+    )
+    page_file = tmp_path / "box_scores" / "198010100DAL.html"
+    validators_file = fetch.page_validators_file(page_file)
+
+    assert fetch.refresh_cached_page("https://example.com/box", page_file)
+    assert request_headers[0].get("If-None-Match") is None
+    # mtimes are only compared, so make sure a rewrite would change them
+    os.utime(page_file, ns=(0, 0))
+    os.utime(validators_file, ns=(0, 0))
+    saved_times = (0, 0)
+
+    # 304: nothing is written
+    assert not fetch.refresh_cached_page("https://example.com/box", page_file)
+    assert request_headers[1]["If-None-Match"] == '"v1"'
+    assert (page_file.stat().st_mtime_ns, validators_file.stat().st_mtime_ns) == saved_times
+
+    # 200 with the same page (a site ignoring If-None-Match): compared by sha1, nothing is written
+    assert not fetch.refresh_cached_page("https://example.com/box", page_file)
+    assert (page_file.stat().st_mtime_ns, validators_file.stat().st_mtime_ns) == saved_times
+
+    # new ETag and page: both are saved
+    assert fetch.refresh_cached_page("https://example.com/box", page_file)
+    assert page_file.read_text(encoding="utf-8") == "<html>2</html>"
+    assert fetch.load_page_validators(page_file)["etag"] == '"v2"'
+    assert len(requested_urls) == 4
+
+
+# game logs of a player without an id are skipped when the page cannot be loaded
+def test_player_season_stats_skips_pages_not_loaded(monkeypatch, tmp_path):
+    monkeypatch.setattr(fetch, "fetch_page", lambda **kwargs: None)
+    config = fetch.ScrapeConfig(raw_cache_root=tmp_path, intermediate_root=tmp_path, compiled_root=tmp_path)
+    player_info = {"player": "Ann Bee", "player_url": None, "year_min": 1980, "year_max": 1981}
+    monkeypatch.setattr(
+        fetch,
+        "player_gamelog_urls",
+        lambda *args: {1980: "/players/b/beean01/gamelog/1981", 1981: "/players/b/beean01/gamelog/1982"},
+    )
+
+    assert fetch.get_player_season_stats([player_info], range(1980, 1982), config=config) == []
+
+
+# a player whose career page cannot be loaded is skipped instead of failing the batch
+def test_player_gamelog_urls_without_career_page(monkeypatch, tmp_path):
+    requested_urls, _ = fake_requests(monkeypatch, [(404, {})])
+    config = fetch.ScrapeConfig(raw_cache_root=tmp_path, intermediate_root=tmp_path, compiled_root=tmp_path)
+    player_info = {"player": "Ann Bee", "player_url": "/players/b/beean01.html"}
+
+    assert fetch.player_gamelog_urls(player_info, [1980], config) == {}
+    assert len(requested_urls) == 1
+
+
+# a box score page with one player per team; every stat is 1 apart from the minutes and the points given
+def box_score_page(team_points: dict) -> str:
+    tables = []
+    for team, points in team_points.items():
+        stats = {"mp": "10:00", "pts": points}
+        cells = "".join(
+            f'<td data-stat="{data_stat}">{stats.get(data_stat, 1)}</td>'
+            for data_stat, _, _ in BOX_SCORE_TABLE_COLUMNS[1:]
+        )
+        tables.append(
+            f'<table id="box-{team}-game-basic">\n{table_head_html(BOX_SCORE_TABLE_COLUMNS)}\n<tbody>\n'
+            f'<tr><th data-stat="player"><a href="/players/x/{team.lower()}01.html">{team} Player</a></th>{cells}</tr>\n'
+            "</tbody>\n</table>"
+        )
+    return page_html("Box Score", "\n".join(tables))
+
+
+# with one game already parsed into the csv and one new game, only the new page is fetched and parsed and the saved rows are kept as they are; --rebuild parses every saved page again
+def test_get_box_scores_keeps_saved_rows(monkeypatch, tmp_path):
+    config = temporary_config(tmp_path)
+    schedule_df = save_schedule(config, 1980)
+    schedule_df["Box_score_url"] = "/boxscores/" + schedule_df["Game_id"] + ".html"
+    schedule_df.to_csv(config.season_games_directory / "1980_season_games.csv", index=False)
+
+    config.box_score_pages_directory.mkdir(parents=True, exist_ok=True)
+    (config.box_score_pages_directory / "198010100DAL.html").write_text(
+        box_score_page({"LAL": 101, "DAL": 96}), encoding="utf-8"
+    )
+    box_scores_file = config.season_games_directory / "1980_box_scores.csv"
+    # the saved rows hold points the page does not, so a parse of the saved page would show
+    pd.DataFrame(
+        {
+            "Game_id": ["198010100DAL", "198010100DAL"],
+            "Team": ["LAL", "DAL"],
+            "Player": ["LAL Player", "DAL Player"],
+            "Points": [50.0, 40.0],
+        }
+    ).to_csv(box_scores_file, index=False)
+
+    requested_urls = []
+
+    def fake_refresh_cached_page(request_url, file_path, web_driver=None):
+        requested_urls.append(request_url)
+        file_path.write_text(box_score_page({"BOS": 99, "NYK": 104}), encoding="utf-8")
+        return True
+
+    monkeypatch.setattr(fetch, "refresh_cached_page", fake_refresh_cached_page)
+
+    fetch.get_box_scores(1980, 1980, config)
+
+    assert requested_urls == [rf"{fetch.BASELINE_URL}/boxscores/198010110NYK.html"]
+    box_score_df = pd.read_csv(box_scores_file)
+    assert list(box_score_df["Game_id"]) == ["198010100DAL"] * 2 + ["198010110NYK"] * 2
+    assert list(box_score_df["Points"]) == [50.0, 40.0, 99.0, 104.0]
+    new_rows = box_score_df[box_score_df["Game_id"] == "198010110NYK"]
+    assert list(new_rows["Game_location"]) == ["Away", "Home"]
+    assert list(new_rows["Opponent"]) == ["NYK", "BOS"]
+    assert list(new_rows["Minutes Played"]) == [10.0, 10.0]
+
+    fetch.get_box_scores(1980, 1980, config, rebuild=True)
+
+    # both pages are saved, so nothing more is fetched
+    assert len(requested_urls) == 1
+    box_score_df = pd.read_csv(box_scores_file)
+    assert list(box_score_df["Game_id"]) == ["198010100DAL"] * 2 + ["198010110NYK"] * 2
+    assert list(box_score_df["Points"]) == [101.0, 96.0, 99.0, 104.0]
@@ -0,0 +1,145 @@
+from datetime import date, datetime, timedelta
+
+import pandas as pd
+import pytest
+
+# local library
+import scraping_functions as scrape
+
+# tests of the table field parsers in scraping_functions.parse against known values and against the datetime.strptime conversions they replaced; run with "python -m pytest" from this folder
+
+# (parser name, raw value, expected result); None means the value cannot be read
+FIELD_PARSER_CASES = [
+    ("playtime", "33:00", 33.0),
+    ("playtime", "4:30", 4.5),
+    ("playtime", "45", 0.75),
+    ("playtime", "1:02:30", 62.5),
+    # strptime("%M:%S") rejected minutes past 59, which overtime games reach
+    ("playtime", "62:10", 62 + 10 / 60),
+    ("playtime", "", None),
+    ("playtime", "Did Not Play", None),
+    ("player_date", "1980-10-12", "10/12/80"),
+    ("player_date", "2001-01-05", "01/05/01"),
+    ("player_date", "2000-02-29", "02/29/00"),
+    ("player_date", "1980-13-45", None),
+    ("player_date", "1981-02-29", None),
+    ("player_date", "1980-00-10", None),
+    ("player_date", "10/12/1980", None),
+    ("schedule_date", "Sun, Oct 12, 1980", "10/12/80"),
+    ("schedule_date", "Fri, Jan 5, 2001", "01/05/01"),
+    ("schedule_date", "Fri, Feb 30, 1981", None),
+    ("schedule_date", "Sun, Oct 32, 1980", None),
+    ("schedule_date", "Sun, Okt 12, 1980", None),
+    ("schedule_date", "Xyz, Oct 12, 1980", None),
+    ("age", "22-060", 22 + 60 / 365),
+    ("age", "35-000", 35.0),
+    ("age", "", None),
+    ("margin", "W (+9)", 9.0),
+    ("margin", "L (-13)", -13.0),
+    ("margin", "W, 110-101", 9.0),
+    ("margin", "L, 98-104", -6.0),
+    ("margin", "", None),
+]
+
+
+# date_change raises for dates it cannot read; the column version and these tests use None for them
+def date_or_none(value: str, is_player: bool) -> str:
+    try:
+        return scrape.date_change(value, is_player)
+    except ValueError:
+        return None
+
+
+# parser name -> (scalar parser, column parser)
+FIELD_PARSERS = {
+    "playtime": (scrape.playtime_conversion, scrape.playtime_conversion_series),
+    "player_date": (
+        lambda value: date_or_none(value, True),
+        lambda column: scrape.date_change_series(column, is_player=True),
+    ),
+    "schedule_date": (
+        lambda value: date_or_none(value, False),
+        lambda column: scrape.date_change_series(column, is_player=False),
+    ),
+    "age": (scrape.reformat_player_age, scrape.reformat_player_age_series),
+    "margin": (scrape.reformat_win_loss_margin, scrape.reformat_win_loss_margin_series),
+}
+
+
+# the strptime based conversions the parsers replaced
+def strptime_date_change(value: str, is_player: bool) -> str:
+    date_format = "%Y-%m-%d" if is_player else "%a, %b %d, %Y"
+    return datetime.strptime(value, date_format).strftime("%m/%d/%y")
+
+
+def strptime_playtime_conversion(value: str) -> float:
+    time_object = datetime.strptime(value, "%M:%S")
+    return float(time_object.minute) + float(time_object.second) / 60.0
+
+
+# true when a parsed value matches the expected one (floats within rounding, None/NaN for unreadable values)
+def values_match(parsed_value, expected_value) -> bool:
+    if expected_value is None:
+        return parsed_value is None or pd.isna(parsed_value)
+    if isinstance(expected_value, float):
+        return parsed_value is not None and abs(parsed_value - expected_value) < 1e-9
+    return parsed_value == expected_value
+
+
+# every case gives the expected value with both the scalar and the column parser
+@pytest.mark.parametrize("parser_name, raw_value, expected_value", FIELD_PARSER_CASES)
+def test_field_parser_cases(parser_name, raw_value, expected_value):
+    scalar_parser, series_parser = FIELD_PARSERS[parser_name]
+
+    assert values_match(scalar_parser(raw_value), expected_value)
+    series_value = series_parser(pd.Series([raw_value], dtype="str")).iloc[0]
+    assert values_match(None if pd.isna(series_value) else series_value, expected_value)
+
+
+# every day from the first NBA season to the 2030s is converted as strptime converted it, in both date formats
+def test_date_change_matches_strptime_on_every_day():
+    for day_number in range((date(2035, 1, 1) - date(1946, 1, 1)).days):
+        game_day = date(1946, 1, 1) + timedelta(days=day_number)
+        player_date = f"{game_day:%Y-%m-%d}"
+        schedule_date = f"{game_day:%a, %b} {game_day.day}, {game_day.year}"
+
+        assert scrape.date_change(player_date, is_player=True) == strptime_date_change(player_date, True)
+        assert scrape.date_change(schedule_date) == strptime_date_change(schedule_date, False)
+
+
+# inputs strptime rejected are rejected too, and odd inputs strptime accepted are read the same way
+@pytest.mark.parametrize(
+    "raw_value, is_player",
+    [
+        ("1980-13-45", True),
+        ("1980-02-30", True),
+        ("1980-00-01", True),
+        ("1980-1-5", True),
+        ("80-10-12", True),
+        ("", True),
+        ("Fri, Feb 30, 1981", False),
+        ("Sun, Oct 0, 1980", False),
+        ("Sun, Okt 12, 1980", False),
+        ("Xyz, Oct 12, 1980", False),
+        ("sun, oct 12, 1980", False),
+        ("Sunday, Oct 12, 1980", False),
+        ("", False),
+    ],
+)
+def test_date_change_rejects_what_strptime_rejects(raw_value, is_player):
+    try:
+        expected_value = strptime_date_change(raw_value, is_player)
+    except ValueError:
+        with pytest.raises(ValueError):
+            scrape.date_change(raw_value, is_player)
+        return
+
+    assert scrape.date_change(raw_value, is_player) == expected_value
+
+
+# every minutes:seconds value strptime could read is converted to the same minutes
+def test_playtime_conversion_matches_strptime():
+    for minutes in range(60):
+        for seconds in range(60):
+            for playtime in (f"{minutes}:{seconds:02d}", f"{minutes:02d}:{seconds:02d}"):
+                assert scrape.playtime_conversion(playtime) == strptime_playtime_conversion(playtime)
@@ -0,0 +1,107 @@
+import cProfile
+import io
+import pstats
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# local library
+import profiling
+
+# tests of the profiling helpers; run with "python -m pytest" from this folder
+
+# longest the folded stack conversion of the pandas profile may take (seconds); the profiled work itself takes about a second
+FOLDED_STACK_TIME_LIMIT = 20.0
+
+
+# player line work like the subcommands profile: csv round trip, grouped rolling means, merges, pivots, date and string columns
+def pandas_workload() -> pd.DataFrame:
+    random_generator = np.random.default_rng(0)
+    player_games_df = pd.DataFrame(
+        {
+            "Player_id": random_generator.integers(0, 200, 20_000),
+            "Team": random_generator.choice(["BOS", "LAL", "NYK", "DAL"], 20_000),
+            "Points": random_generator.integers(0, 40, 20_000).astype("float64"),
+            "Minutes Played": random_generator.uniform(0, 48, 20_000),
+        }
+    )
+    csv_buffer = io.StringIO()
+    player_games_df.to_csv(csv_buffer, index=False)
+    csv_buffer.seek(0)
+    player_games_df = pd.read_csv(csv_buffer)
+    player_games_df["Date"] = pd.to_datetime("1980-10-10") + pd.to_timedelta(
+        player_games_df["Player_id"] % 100, unit="D"
+    )
+
+    rolling_df = (
+        player_games_df.groupby("Player_id")[["Points", "Minutes Played"]]
+        .rolling(5, min_periods=1)
+        .mean()
+        .reset_index(level=0, drop=True)
+    )
+    team_totals_df = player_games_df.groupby("Team")[["Points"]].sum().reset_index()
+    player_games_df = player_games_df.join(rolling_df, rsuffix="_form").merge(
+        team_totals_df, on="Team", suffixes=("", "_team")
+    )
+
+    player_games_df.pivot_table(index="Team", columns="Player_id", values="Points", aggfunc="mean")
+    player_games_df.sort_values(["Team", "Date"]).groupby("Team")["Points"].shift(1)
+    player_games_df["Team"].str.lower().str.strip()
+    player_games_df.groupby(["Team", player_games_df["Date"].dt.month]).agg(
+        {"Points": ["mean", "max"], "Minutes Played": "sum"}
+    )
+    return pd.concat([player_games_df, player_games_df]).drop_duplicates()
+
+
+# saves a cProfile profile of the pandas workload and returns its file
+def save_pandas_profile(tmp_path) -> Path:
+    profiler = cProfile.Profile()
+    profiler.runcall(pandas_workload)
+    profile_file = tmp_path / "pandas.prof"
+    profiler.dump_stats(profile_file)
+    return profile_file
+
+
+# the folded stacks of a real pandas profile are written within the time limit; the conversion runs in its own process so a slow one fails the test instead of hanging it
+def test_pstats_to_folded_stacks_of_pandas_profile(tmp_path):
+    profile_file = save_pandas_profile(tmp_path)
+    folded_file = tmp_path / "pandas.cpu.folded"
+
+    subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import pstats, sys; from pathlib import Path; import profiling; "
+            "profiling.write_folded_stacks(profiling.pstats_to_folded_stacks(pstats.Stats(sys.argv[1])), Path(sys.argv[2]))",
+            str(profile_file),
+            str(folded_file),
+        ],
+        cwd=Path(__file__).parent,
+        check=True,
+        timeout=FOLDED_STACK_TIME_LIMIT,
+    )
+
+    folded_stacks = {
+        stack_key: int(weight)
+        for stack_key, weight in (line.rsplit(" ", 1) for line in folded_file.read_text(encoding="utf-8").splitlines())
+    }
+    workload_weight = sum(
+        weight for stack_key, weight in folded_stacks.items() if stack_key.split(";")[0].endswith(":pandas_workload")
+    )
+    # nearly all of the time is under the profiled function
+    assert workload_weight > 0.9 * sum(folded_stacks.values())
+    assert all(weight > 0 for weight in folded_stacks.values())
+
+
+# a stack is dropped once its share of the time is below min_time
+def test_pstats_to_folded_stacks_min_time(tmp_path):
+    profile_stats = pstats.Stats(str(save_pandas_profile(tmp_path)))
+
+    all_stacks = profiling.pstats_to_folded_stacks(profile_stats)
+    large_stacks = profiling.pstats_to_folded_stacks(profile_stats, min_time=1e-3)
+
+    assert set(large_stacks) <= set(all_stacks)
+    assert len(large_stacks) < len(all_stacks)
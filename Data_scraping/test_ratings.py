@@ -0,0 +1,49 @@
+import pandas as pd
+
+# local library
+import ratings
+from test_transform import temporary_config
+
+# tests of the team ratings; run with "python -m pytest" from this folder
+
+# (season, date, away, away points, home, home points) of the games used below
+SEASON_GAMES = [
+    (1980, "10/10/80", "LAL", 101, "BOS", 96),
+    (1980, "10/10/80", "DAL", 99, "NYK", 104),
+    (1980, "11/02/80", "BOS", 110, "DAL", 90),
+    (1980, "11/03/80", "NYK", 95, "LAL", 97),
+    (1981, "10/09/81", "LAL", 88, "BOS", 100),
+    (1981, "10/10/81", "DAL", 112, "NYK", 108),
+    (1981, "10/12/81", "BOS", 99, "DAL", 102),
+]
+
+
+# saves the schedules of the games (one file per season)
+def save_schedules(config, games: list):
+    games_df = pd.DataFrame(
+        games, columns=["Season", "Date", "Away", "Away_points", "Home", "Home_points"]
+    )
+    config.season_games_directory.mkdir(parents=True, exist_ok=True)
+    for season_year, schedule_df in games_df.groupby("Season"):
+        schedule_df.drop(columns="Season").to_csv(
+            config.season_games_directory / rf"{season_year}_season_games.csv", index=False
+        )
+
+
+# a game that turns up late for a day of a new season already rated rewinds into that season; the teams that had not played in it yet still start it from their reverted rating, so the result is the full replay's
+def test_incremental_update_across_season_boundary_matches_full_replay(tmp_path):
+    full_config = temporary_config(tmp_path / "full")
+    save_schedules(full_config, SEASON_GAMES)
+    ratings.update_ratings([1980, 1981], full_config)
+
+    incremental_config = temporary_config(tmp_path / "incremental")
+    # the DAL-NYK game of 10/10/81 is missing from the first update
+    save_schedules(incremental_config, SEASON_GAMES[:5] + SEASON_GAMES[6:])
+    ratings.update_ratings([1980, 1981], incremental_config)
+    save_schedules(incremental_config, SEASON_GAMES)
+    assert ratings.update_ratings([1981], incremental_config) == 2
+
+    pd.testing.assert_frame_equal(
+        ratings.load_rating_history(incremental_config), ratings.load_rating_history(full_config)
+    )
+    assert ratings.load_ratings_checkpoint(incremental_config) == ratings.load_ratings_checkpoint(full_config)
@@ -0,0 +1,159 @@
+import json
+
+import pandas as pd
+
+# local library
+import schemas
+import scraping_functions as scrape
+from test_transform import save_schedule, temporary_config
+
+# tests of the saved and exported data in scraping_functions.store; run with "python -m pytest" from this folder
+
+
+# a game not played yet (no points in the schedule) is exported with a null score and winner instead of failing the JSON export
+def test_json_export_with_unplayed_game(tmp_path):
+    config = temporary_config(tmp_path)
+    schedule_df = save_schedule(config, 1980)
+    schedule_df.loc[1, ["Away_points", "Home_points"]] = None
+    schedule_df.to_csv(config.season_games_directory / "1980_season_games.csv", index=False)
+    scrape.collect_players_in_game([1980], config)
+
+    scrape.pickled_players_in_games_to_json([1980], config)
+
+    with open(config.pickled_data_directory / "1980_season_compiled.json") as file:
+        season_json = json.load(file)
+    played_game, unplayed_game = season_json["Games"]
+    assert played_game["Home_team_stats"]["Score"] == 96
+    assert not played_game["Home_team_stats"]["Team_win"]
+    assert played_game["Away_team_stats"]["Team_win"]
+    assert unplayed_game["Game_id"] == "198010110NYK"
+    assert unplayed_game["Home_team_stats"]["Score"] is None
+    assert unplayed_game["Away_team_stats"]["Team_win"] is None
+
+
+# saves a letter index page listing the players given as (name, player id, first season end year, last season end year)
+def save_letter_page(config, letter: str, players: list):
+    header_cells = "".join(
+        rf'<th data-stat="{data_stat}">{data_stat}</th>'
+        for data_stat in schemas.TABLE_SCHEMAS["players"].columns
+    )
+    rows = "".join(
+        rf'<tr><th data-stat="player"><a href="/players/{letter}/{player_id}.html">{name}</a></th>'
+        rf'<td data-stat="year_min">{year_min}</td><td data-stat="year_max">{year_max}</td>'
+        r'<td data-stat="pos">G</td><td data-stat="height">6-5</td><td data-stat="weight">200</td>'
+        r'<td data-stat="birth_date">May 1, 1960</td><td data-stat="colleges">Duke</td></tr>'
+        for name, player_id, year_min, year_max in players
+    )
+    letter_file = config.letter_pages_directory / rf"letter_{letter}_players.html"
+    letter_file.parent.mkdir(parents=True, exist_ok=True)
+    letter_file.write_text(
+        rf'<html><body><table id="players"><thead><tr>{header_cells}</tr></thead><tbody>{rows}</tbody></table></body></html>',
+        encoding="utf-8",
+    )
+
+
+# names of the players of the index active in the seasons (start year convention, inclusive)
+def active_player_names(player_index, start_year: int, end_year: int) -> list:
+    return [player["player"] for player in player_index.active_players(start_year, end_year)]
+
+
+# the index is built from two letter pages and answers season range queries; after a letter page changes only that letter is rebuilt, clearing the seasons its players no longer cover and setting the new ones
+def test_player_season_index_build_query_and_rebuild(tmp_path):
+    config = temporary_config(tmp_path)
+    save_letter_page(config, "a", [("Al Abe", "abeal01", 1980, 1982), ("Amy Ash", "asham01", 1985, 1990)])
+    save_letter_page(config, "b", [("Bo Bee", "beebo01", 1981, 1981)])
+
+    player_index = scrape.update_player_season_index("a", "b", config)
+
+    assert active_player_names(player_index, 1980, 1980) == ["Al Abe", "Bo Bee"]
+    assert active_player_names(player_index, 1983, 1985) == ["Amy Ash"]
+    assert active_player_names(player_index, 1990, 1995) == []
+    assert player_index.letter_season_bits["a"][1979] == 0b01
+    assert player_index.letter_players["a"][0]["player_id"] == "abeal01"
+    assert player_index.letter_players["a"][0]["height_cm"] == 195.58
+
+    # Al Abe's career moves to 1984-85 and a new player is added after him
+    save_letter_page(
+        config,
+        "a",
+        [("Al Abe", "abeal01", 1985, 1985), ("Amy Ash", "asham01", 1985, 1990), ("Ann Ary", "aryan01", 1981, 1981)],
+    )
+    letter_b_bits = dict(player_index.letter_season_bits["b"])
+
+    player_index = scrape.update_player_season_index("a", "b", config)
+
+    assert active_player_names(player_index, 1980, 1980) == ["Ann Ary", "Bo Bee"]
+    assert active_player_names(player_index, 1984, 1984) == ["Al Abe", "Amy Ash"]
+    assert 1979 not in player_index.letter_season_bits["a"]
+    assert player_index.letter_season_bits["a"][1980] == 0b100
+    assert player_index.letter_season_bits["a"][1984] == 0b011
+    assert player_index.letter_season_bits["b"] == letter_b_bits
+    # the rebuilt index was saved
+    assert scrape.load_player_season_index(config).letter_season_bits == player_index.letter_season_bits
+
+
+# games of players for one season as the game log parser gives them
+def player_games(rows: list) -> pd.DataFrame:
+    return pd.DataFrame(rows, columns=["Season", "Player", "Player_id", "Date", "Points"])
+
+
+# players are appended as one block each, a player scraped again replaces their block, and single players are read back through the byte ranges
+def test_append_replace_and_read_player_season_games(tmp_path):
+    config = temporary_config(tmp_path)
+    scrape.append_player_season_games(
+        1980,
+        player_games(
+            [
+                (1980, "Al Abe", "abeal01", "10/10/80", 12.0),
+                (1980, "Al Abe", "abeal01", "10/12/80", 8.0),
+                (1980, "Bo Bee", "beebo01", "10/10/80", 20.0),
+            ]
+        ),
+        config,
+    )
+    scrape.append_player_season_games(
+        1980,
+        player_games(
+            [
+                (1980, "Al Abe", "abeal01", "10/10/80", 14.0),
+                (1980, "Cy Cox", "coxcy01", "10/11/80", 3.0),
+            ]
+        ),
+        config,
+    )
+
+    games_file, index_file = scrape.player_season_games_files(1980, config)
+    games_index = scrape.load_player_games_index(index_file)
+    assert list(games_index["players"]) == ["beebo01", "abeal01", "coxcy01"]
+    assert [block[2] for block in games_index["players"].values()] == [1, 1, 1]
+    all_games_df = scrape.read_player_season_games(1980, config)
+    assert list(all_games_df["Points"]) == [20.0, 14.0, 3.0]
+    abe_games_df = scrape.read_player_season_games(1980, config, ["abeal01", "nobody01"])
+    assert list(abe_games_df["Points"]) == [14.0]
+    assert list(abe_games_df.columns) == games_index["columns"]
+
+
+# a data file whose index file is missing is indexed again from its rows, so a player appended again is replaced instead of duplicated
+def test_append_player_season_games_without_index_file(tmp_path):
+    config = temporary_config(tmp_path)
+    first_games_df = player_games(
+        [
+            (1980, "Al Abe", "abeal01", "10/10/80", 12.0),
+            (1980, "Bo Bee, Jr.", "beebo01", "10/10/80", 20.0),
+            (1980, "Bo Bee, Jr.", "beebo01", "10/11/80", 22.0),
+        ]
+    )
+    scrape.append_player_season_games(1980, first_games_df, config)
+    games_file, index_file = scrape.player_season_games_files(1980, config)
+    saved_index = scrape.load_player_games_index(index_file)
+    index_file.unlink()
+
+    assert scrape.rebuild_player_games_index(games_file) == saved_index
+
+    scrape.append_player_season_games(
+        1980, player_games([(1980, "Bo Bee, Jr.", "beebo01", "10/10/80", 25.0)]), config
+    )
+
+    games_index = scrape.load_player_games_index(index_file)
+    assert games_index["columns"] == list(first_games_df.columns)
+    assert list(scrape.read_player_season_games(1980, config)["Points"]) == [12.0, 25.0]
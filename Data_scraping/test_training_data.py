@@ -0,0 +1,56 @@
+import numpy as np
+import pandas as pd
+
+# local library
+import scraping_functions as scrape
+import training_data
+from test_ratings import SEASON_GAMES, save_schedules
+from test_transform import save_schedule, temporary_config
+
+# tests of the training and lineup matrices; run with "python -m pytest" from this folder
+
+
+# a compiled season without player games keeps a lineup row for every game, with no entries, and the lineup rows are the training matrix rows
+def test_lineup_matrix_rows_match_training_matrix_without_player_games(tmp_path):
+    config = temporary_config(tmp_path)
+    save_schedule(config, 1980)
+    scrape.collect_players_in_game([1980], config)
+
+    games_df = training_data.compiled_games([1980], config)
+    training_data.build_training_matrix([1980], config, games_df)
+    lineup_matrix = training_data.build_lineup_matrix([1980], config, games_df)
+
+    assert lineup_matrix.shape == (2, 0)
+    assert lineup_matrix.nnz == 0
+    training_games_df = pd.read_csv(config.training_data_directory / training_data.GAME_KEYS_FILE)
+    lineup_games_df = pd.read_csv(config.training_data_directory / training_data.LINEUP_GAMES_FILE)
+    pd.testing.assert_frame_equal(training_games_df, lineup_games_df)
+
+
+# the memory-mapped matrices of two compiled seasons have one float32 row per game, in season order, and the manifest's season offsets are the row blocks of each season
+def test_training_matrix_rows_and_season_offsets(tmp_path):
+    config = temporary_config(tmp_path)
+    save_schedules(config, SEASON_GAMES)
+    scrape.collect_players_in_game([1980, 1981], config)
+
+    manifest = training_data.build_training_matrix([1980, 1981], config)
+    feature_matrix, label_matrix, loaded_manifest = training_data.load_training_matrix(config)
+
+    assert loaded_manifest == manifest
+    assert isinstance(feature_matrix, np.memmap)
+    assert feature_matrix.dtype == np.float32
+    assert label_matrix.dtype == np.float32
+    assert feature_matrix.shape == (7, len(training_data.feature_columns()))
+    assert label_matrix.shape == (7, len(training_data.LABEL_COLUMNS))
+    assert manifest["rows"] == 7
+    assert manifest["season_offsets"] == {"1980": [0, 4], "1981": [4, 7]}
+
+    game_keys_df = pd.read_csv(config.training_data_directory / training_data.GAME_KEYS_FILE)
+    assert list(game_keys_df["Season"]) == [1980] * 4 + [1981] * 3
+    # home win and home margin of each game, in schedule order within the season
+    home_margins = [home_points - away_points for _, _, _, away_points, _, home_points in SEASON_GAMES]
+    np.testing.assert_array_equal(label_matrix[:, 1], home_margins)
+    np.testing.assert_array_equal(label_matrix[:, 0], [margin > 0 for margin in home_margins])
+
+    rows_1981 = training_data.season_rows(manifest, 1981, 1981)
+    assert list(game_keys_df["Season"][rows_1981]) == [1981] * 3
@@ -0,0 +1,132 @@
+import pandas as pd
+
+# local library
+import scraping_functions as scrape
+from config import ScrapeConfig
+
+# tests of the compiled data sets built in scraping_functions.transform; run with "python -m pytest" from this folder
+
+
+# config with every data root in the test's temporary folder
+def temporary_config(tmp_path) -> ScrapeConfig:
+    return ScrapeConfig(raw_cache_root=tmp_path, intermediate_root=tmp_path, compiled_root=tmp_path)
+
+
+# saves a two game schedule for the season and returns it
+def save_schedule(config: ScrapeConfig, season_year: int) -> pd.DataFrame:
+    schedule_df = pd.DataFrame(
+        {
+            "Date": ["10/10/80", "10/11/80"],
+            "Away": ["LAL", "BOS"],
+            "Away_points": [101, 99],
+            "Home": ["DAL", "NYK"],
+            "Home_points": [96, 104],
+            "Game_id": ["198010100DAL", "198010110NYK"],
+        }
+    )
+    schedule_file = config.season_games_directory / rf"{season_year}_season_games.csv"
+    schedule_file.parent.mkdir(parents=True, exist_ok=True)
+    schedule_df.to_csv(schedule_file, index=False)
+    return schedule_df
+
+
+# a season with a schedule but no player games gets empty totals for every team-game instead of failing
+def test_team_game_totals_without_player_games(tmp_path):
+    config = temporary_config(tmp_path)
+    save_schedule(config, 1980)
+
+    team_games_df = scrape.build_team_game_totals(1980, config)
+
+    assert len(team_games_df) == 4
+    assert (team_games_df["Players"] == 0).all()
+    assert team_games_df[scrape.TEAM_GAME_TOTAL_COLUMNS].isna().all().all()
+    assert not team_games_df["Points_match"].any()
+    assert (config.season_games_directory / "1980_team_games.csv").is_file()
+
+
+# the same season compiles to one row per schedule game
+def test_compile_season_without_player_games(tmp_path):
+    config = temporary_config(tmp_path)
+    schedule_df = save_schedule(config, 1980)
+
+    season_df = scrape.compile_season_games(1980, config)
+
+    assert list(season_df["Game_id"]) == list(schedule_df["Game_id"])
+    assert season_df.iloc[0]["Home_team_stats"]["Players_game_stats"].empty
+
+
+# player lines missing a stat column still give totals for the columns they have
+def test_team_game_totals_with_missing_stat_columns(tmp_path):
+    config = temporary_config(tmp_path)
+    save_schedule(config, 1980)
+    player_games_df = pd.DataFrame(
+        {
+            "Game_id": ["198010100DAL", "198010100DAL"],
+            "Team": ["DAL", "DAL"],
+            "Minutes Played": [30.0, 18.0],
+            "Points": [60, 36],
+        }
+    )
+
+    team_games_df = scrape.build_team_game_totals(1980, config, (player_games_df, ["Game_id", "Team"]))
+
+    dallas_game = team_games_df[team_games_df["Team"] == "DAL"].iloc[0]
+    assert dallas_game["Players"] == 2
+    assert dallas_game["Points"] == 96
+    assert dallas_game["Points_match"]
+    assert pd.isna(dallas_game["Assists"])
+
+
+# under a memory budget, seasons whose recorded (or estimated) peak compiled at once does not fit are compiled a month at a time, and the worker count follows the largest estimate
+def test_season_chunks_within_budget(monkeypatch):
+    monkeypatch.setattr(scrape.transform.profiling, "peak_rss_mib", lambda children=False: 100.0)
+    manifest = {
+        "seasons": {
+            "1980": {"chunk": "season", "peak_rss_mib": 250.0},
+            "1981": {"chunk": "season", "peak_rss_mib": 600.0},
+            # peaks of a process that compiled several seasons are not used
+            "1982": {"chunk": "month", "process_peak_rss_mib": 50.0},
+        }
+    }
+
+    season_chunks = scrape.season_chunks_within_budget([1980, 1981, 1982], 500, "season", manifest)
+
+    # 1982 has no season peak of its own and gets the largest recorded one
+    assert season_chunks == {1980: "season", 1981: "month", 1982: "month"}
+    # the month estimate (384 MiB) is the largest
+    assert scrape.workers_within_budget(4, 500, season_chunks, manifest) == 1
+    assert scrape.workers_within_budget(4, 1000, {1980: "season"}, manifest) == 3
+
+
+# seasons whose worker went over its share of the budget compiled at once are compiled again a month at a time; a season already compiled a month at a time is only reported
+def test_compile_seasons_over_budget(monkeypatch, tmp_path):
+    monkeypatch.setattr(scrape.transform.profiling, "peak_rss_mib", lambda children=False: 100.0)
+    recompiled = []
+
+    def fake_run_in_workers(function, work_items, worker_count, **kwargs):
+        recompiled.append((work_items, kwargs["chunk"]))
+        return [{str(season_year): {"chunk": "month", "peak_rss_mib": 150.0} for season_year in work_items}]
+
+    monkeypatch.setattr(scrape.transform, "run_in_workers", fake_run_in_workers)
+    worker_results = [
+        {"1980": {"chunk": "season", "peak_rss_mib": 180.0}},
+        {"1981": {"chunk": "season", "peak_rss_mib": 300.0}},
+        {"1982": {"chunk": "month", "peak_rss_mib": 250.0}},
+    ]
+
+    # two workers share the 400 MiB this process leaves of the budget
+    month_results = scrape.compile_seasons_over_budget(worker_results, 500, 2, temporary_config(tmp_path))
+
+    assert recompiled == [([1981], "month")]
+    assert month_results == [{"1981": {"chunk": "month", "peak_rss_mib": 150.0}}]
+
+
+# in_process (used by --profile) compiles in this process even with a memory budget, so the peaks are recorded as the process's
+def test_collect_players_in_game_in_process_with_budget(tmp_path):
+    config = temporary_config(tmp_path)
+    save_schedule(config, 1980)
+
+    manifest = scrape.collect_players_in_game([1980], config, workers=2, memory_budget_mib=100000, in_process=True)
+
+    assert "process_peak_rss_mib" in manifest["seasons"]["1980"]
+    assert "peak_rss_mib" not in manifest["seasons"]["1980"]
@@ -0,0 +1,295 @@
+import json
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+# local library
+import features
+import scraping_functions as scrape
+from config import ScrapeConfig, load_config, prepare_file_path
+
+# model-ready training matrix built from the compiled game data (collect_players_in_game) and the saved form features (features.py)
+#
+# one row per played game, ordered by season then date; the features are the pre-game form of both teams plus the summed pre-game form of the players who appeared for each side, and the labels are the home win (1.0 / 0.0) and the home margin
+#
+# the arrays are written as float32 .npy files next to a manifest.json holding the column names and the first / last row of each season, so training code can np.load them with mmap_mode="r" (no parsing, no copies) and slice whole seasons for time-ordered cross-validation:
+#
+#   feature_matrix, labels, manifest = load_training_matrix(config)
+#   train_rows = season_rows(manifest, 1980, 1989)
+#   model.fit(feature_matrix[train_rows], labels[train_rows, 0])
+#
+# the lineup matrix is a sparse games x players matrix (scipy CSR, saved with save_npz) holding the minutes each player played in each game, positive for the home side and negative for the away side; its row and column maps are saved as lineup_games.csv / lineup_players.csv
+# both matrices take their rows from compiled_games, so row i of the lineup matrix is the game of row i of the training matrix; pass the same games_df to both builders to read the compiled seasons only once
+
+# file names inside config.training_data_directory
+FEATURE_MATRIX_FILE = "features.npy"
+LABELS_FILE = "labels.npy"
+GAME_KEYS_FILE = "games.csv"
+MANIFEST_FILE = "manifest.json"
+LINEUP_MATRIX_FILE = "lineups.npz"
+LINEUP_GAMES_FILE = "lineup_games.csv"
+LINEUP_PLAYERS_FILE = "lineup_players.csv"
+
+# label columns, in order
+LABEL_COLUMNS = ["Home_win", "Home_margin"]
+
+# player form column summed over the players of each side
+ROSTER_FORM_COLUMN = "Game Score_last_10"
+
+
+# team form columns used as features (everything but the identifying columns)
+def team_form_feature_columns() -> list:
+    return [
+        "Games_before",
+        *[
+            rf"{stat}_last_{window}"
+            for window in features.FORM_WINDOWS
+            for stat in features.TEAM_FORM_STATS
+        ],
+    ]
+
+
+# feature column names, in matrix order
+def feature_columns() -> list:
+    return [
+        rf"{side}_{column}"
+        for side in ("Home", "Away")
+        for column in [*team_form_feature_columns(), "Roster_" + ROSTER_FORM_COLUMN]
+    ]
+
+
+# one row per played game of the compiled data in the season range: identifying columns, scores and the player ids of each side
+def compiled_games(season_list: list, config: ScrapeConfig) -> pd.DataFrame:
+    game_rows = []
+    # one compiled season in memory at a time; only the flat rows are kept
+    for season_data in scrape.iterate_compiled_seasons(season_list, config):
+        for game_data in season_data.Season_game_data.itertuples():
+            home_stats = game_data.Home_team_stats
+            away_stats = game_data.Away_team_stats
+            # games not played yet have no score
+            if pd.isna(home_stats["Score"]) or pd.isna(away_stats["Score"]):
+                continue
+
+            game_rows.append(
+                {
+                    "Season": season_data.Season_year,
+                    "Game_id": getattr(game_data, "Game_id", None),
+                    "Date": game_data.Game_date,
+                    "Home": home_stats["Team"].strip(),
+                    "Away": away_stats["Team"].strip(),
+                    "Home_points": float(home_stats["Score"]),
+                    "Away_points": float(away_stats["Score"]),
+                    "Home_player_ids": list(home_stats["Players_game_stats"].get("Player_id", [])),
+                    "Away_player_ids": list(away_stats["Players_game_stats"].get("Player_id", [])),
+                }
+            )
+
+    games_df = pd.DataFrame(game_rows)
+    if games_df.empty:
+        return games_df
+
+    games_df["Game_date"] = pd.concat(
+        features.season_game_dates(season_year, season_games["Date"])
+        for season_year, season_games in games_df.groupby("Season", sort=False)
+    )
+    # stable, so games of the same day keep their schedule order (the lineup matrix rows use the same order)
+    return games_df.sort_values(["Season", "Game_date"], kind="stable", ignore_index=True)
+
+
+# the feature matrix of the games (float32, NaN where a form value is not known yet, e.g. a team's first game)
+def game_feature_matrix(games_df: pd.DataFrame, config: ScrapeConfig) -> np.ndarray:
+    form_columns = team_form_feature_columns()
+    side_features = []
+    for side in ("Home", "Away"):
+        team_form_parts = []
+        roster_form_parts = []
+        for season_year, season_games in games_df.groupby("Season", sort=False):
+            # pre-game team form of the side, looked up by (team, date)
+            team_form_df = features.read_form_features(season_year, "team", config)
+            if team_form_df is None:
+                team_form_df = pd.DataFrame(columns=["Team", "Date", *form_columns])
+            team_form_parts.append(
+                season_games[[side, "Date"]]
+                .merge(
+                    team_form_df[["Team", "Date", *form_columns]],
+                    left_on=[side, "Date"],
+                    right_on=["Team", "Date"],
+                    how="left",
+                )[form_columns]
+                .set_axis(season_games.index)
+            )
+
+            # pre-game form of every player who appeared for the side, summed per game
+            player_form_df = features.read_form_features(season_year, "player", config)
+            side_players = season_games[[rf"{side}_player_ids", "Date"]].explode(rf"{side}_player_ids")
+            if player_form_df is None:
+                roster_form = pd.Series(np.nan, index=season_games.index)
+            else:
+                roster_form = (
+                    side_players.reset_index()
+                    .merge(
+                        player_form_df[["Player_id", "Date", ROSTER_FORM_COLUMN]],
+                        left_on=[rf"{side}_player_ids", "Date"],
+                        right_on=["Player_id", "Date"],
+                        how="left",
+                    )
+                    .groupby("index")[ROSTER_FORM_COLUMN]
+                    .sum(min_count=1)
+                    .reindex(season_games.index)
+                )
+            roster_form_parts.append(roster_form)
+
+        side_features.append(pd.concat(team_form_parts).loc[games_df.index].to_numpy(dtype="float32"))
+        side_features.append(
+            pd.concat(roster_form_parts).loc[games_df.index].to_numpy(dtype="float32")[:, None]
+        )
+
+    return np.hstack(side_features)
+
+
+# builds the training matrix for the seasons in the list and writes it, with its labels, game keys and manifest, to config.training_data_directory; returns the manifest; games_df takes the result of compiled_games when it is already loaded
+def build_training_matrix(season_list: list, config: ScrapeConfig = None, games_df: pd.DataFrame = None) -> dict:
+    config = config or load_config()
+    if games_df is None:
+        games_df = compiled_games(season_list, config)
+    if games_df.empty:
+        print("No played games in the compiled data for the requested seasons")
+        return {}
+
+    feature_matrix = game_feature_matrix(games_df, config)
+    home_margin = (games_df["Home_points"] - games_df["Away_points"]).to_numpy()
+    label_matrix = np.column_stack([(home_margin > 0), home_margin]).astype("float32")
+
+    output_directory = config.training_data_directory
+    # written through open_memmap so the files are exactly what np.load(mmap_mode="r") maps back
+    for file_name, matrix in ((FEATURE_MATRIX_FILE, feature_matrix), (LABELS_FILE, label_matrix)):
+        mapped_matrix = np.lib.format.open_memmap(
+            prepare_file_path(output_directory / file_name),
+            mode="w+",
+            dtype="float32",
+            shape=matrix.shape,
+        )
+        mapped_matrix[:] = matrix
+        mapped_matrix.flush()
+        del mapped_matrix
+
+    games_df[["Season", "Game_id", "Date", "Home", "Away"]].to_csv(
+        output_directory / GAME_KEYS_FILE, index=False
+    )
+
+    # rows are in season order, so each season is one contiguous [start, end) block
+    season_offsets = {}
+    for row_number, season_year in enumerate(games_df["Season"].to_numpy()):
+        season_offsets.setdefault(str(season_year), [row_number, row_number])[1] = row_number + 1
+
+    manifest = {
+        "rows": len(games_df),
+        "dtype": "float32",
+        "feature_file": FEATURE_MATRIX_FILE,
+        "feature_columns": feature_columns(),
+        "label_file": LABELS_FILE,
+        "label_columns": LABEL_COLUMNS,
+        "game_keys_file": GAME_KEYS_FILE,
+        "season_offsets": season_offsets,
+    }
+    with open(output_directory / MANIFEST_FILE, "w") as file:
+        json.dump(manifest, file, indent=1)
+
+    print(
+        rf"Training matrix saved: {feature_matrix.shape[0]} games x {feature_matrix.shape[1]} features"
+    )
+    return manifest
+
+
+# memory-mapped (read only) feature matrix and labels plus the manifest; nothing is read from disk until rows are used
+def load_training_matrix(config: ScrapeConfig = None) -> tuple:
+    config = config or load_config()
+    output_directory = config.training_data_directory
+    with open(output_directory / MANIFEST_FILE, "r") as file:
+        manifest = json.load(file)
+
+    feature_matrix = np.load(output_directory / manifest["feature_file"], mmap_mode="r")
+    label_matrix = np.load(output_directory / manifest["label_file"], mmap_mode="r")
+    return feature_matrix, label_matrix, manifest
+
+
+# row slice covering the seasons start_season..end_season (inclusive) that are in the matrix; slicing a memory-mapped array with it does not copy
+def season_rows(manifest: dict, start_season: int, end_season: int) -> slice:
+    season_blocks = [
+        block
+        for season_year, block in manifest["season_offsets"].items()
+        if start_season <= int(season_year) <= end_season
+    ]
+    if not season_blocks:
+        return slice(0, 0)
+    return slice(min(block[0] for block in season_blocks), max(block[1] for block in season_blocks))
+
+
+# builds the games x players lineup matrix of the seasons in the list and saves it with its row / column maps; the rows are the games of compiled_games (the rows of the training matrix) and the entries come from the flat player lines (box scores when saved, otherwise the player game logs); a player line becomes one entry: +minutes for the home side, -minutes for the away side, and players who did not play (or games without player lines) leave no entry
+def build_lineup_matrix(season_list: list, config: ScrapeConfig = None, games_df: pd.DataFrame = None) -> sparse.csr_matrix:
+    config = config or load_config()
+    if games_df is None:
+        games_df = compiled_games(season_list, config)
+    if games_df.empty:
+        print("No played games in the compiled data for the requested seasons")
+        return None
+
+    entry_parts = []
+    for season_year, season_games_df in games_df.groupby("Season", sort=False):
+        player_games_df, match_columns = scrape.load_season_player_games(season_year, config)
+        played_df = player_games_df[
+            player_games_df.get("Minutes Played", pd.Series(dtype="float64")) > 0
+        ].reindex(columns=[*match_columns, "Player_id", "Minutes Played"])
+        # games are matched on (Game_id, Team) for box scores and (Date, Team) for game logs
+        game_key_column = match_columns[0]
+        for side, side_sign in (("Home", 1.0), ("Away", -1.0)):
+            side_games_df = pd.DataFrame(
+                {
+                    game_key_column: season_games_df[game_key_column],
+                    "Team": season_games_df[side],
+                    "Row": season_games_df.index,
+                }
+            )
+            side_entries_df = played_df.merge(side_games_df, on=match_columns)
+            entry_parts.append(
+                pd.DataFrame(
+                    {
+                        "Row": side_entries_df["Row"],
+                        "Player_id": side_entries_df["Player_id"],
+                        "Minutes": side_sign * side_entries_df["Minutes Played"],
+                    }
+                )
+            )
+
+    entries_df = pd.concat(entry_parts, ignore_index=True)
+    # columns are the players in id order
+    player_columns, player_ids = pd.factorize(entries_df["Player_id"], sort=True)
+    lineup_matrix = sparse.csr_matrix(
+        (
+            entries_df["Minutes"].to_numpy(dtype="float32"),
+            (entries_df["Row"].to_numpy(), player_columns),
+        ),
+        shape=(len(games_df), len(player_ids)),
+        dtype="float32",
+    )
+
+    output_directory = config.training_data_directory
+    sparse.save_npz(prepare_file_path(output_directory / LINEUP_MATRIX_FILE), lineup_matrix)
+    games_df[["Season", "Game_id", "Date", "Home", "Away"]].to_csv(output_directory / LINEUP_GAMES_FILE, index=False)
+    pd.DataFrame({"Player_id": player_ids}).to_csv(output_directory / LINEUP_PLAYERS_FILE, index=False)
+
+    print(
+        rf"Lineup matrix saved: {lineup_matrix.shape[0]} games x {lineup_matrix.shape[1]} players, {lineup_matrix.nnz} player lines"
+    )
+    return lineup_matrix
+
+
+# saved lineup matrix with its row map (one row per game) and column map (player ids)
+def load_lineup_matrix(config: ScrapeConfig = None) -> tuple:
+    config = config or load_config()
+    output_directory = config.training_data_directory
+    lineup_matrix = sparse.load_npz(output_directory / LINEUP_MATRIX_FILE)
+    lineup_games_df = pd.read_csv(output_directory / LINEUP_GAMES_FILE)
+    player_ids = pd.read_csv(output_directory / LINEUP_PLAYERS_FILE)["Player_id"].to_list()
+    return lineup_matrix, lineup_games_df, player_ids